@@ -0,0 +1,181 @@
+"""Time stages of the generator on synthetic schemas of increasing size.
+
+For each size a synthetic schema (see `synthetic.py`) is generated, then
+`build_schema`, `lexicographic_sort_schema`, `GraphQLSchemaTypeMap.build`
+and the rest of the setup of the generator (both as measured by its own
+profiler), each stage of the output module and the final write are timed
+separately. The minimum and the median of each stage over
+runs are reported as JSON, so results of releases can be compared.
+
+    python benchmarks/generator.py --sizes 100,1000,5000 --output results.json
+
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from graphql import build_schema, lexicographic_sort_schema
+
+from graphql2python import __version__
+from graphql2python.model.config import GraphQL2PythonModelConfig
+from graphql2python.model.generate import Generator
+from graphql2python.utils.files import write_chunks
+from graphql2python.utils.profile import Profiler
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic import synthetic_schema  # noqa: E402  # pylint: disable=wrong-import-position
+
+# stages of the output module in the order of `Generator.iter_chunks`
+CHUNK_STAGES: Dict[str, Callable[[Generator], Iterable[str]]] = {
+    "header": lambda generator: [generator._header_str()],  # pylint: disable=protected-access
+    "scalars": lambda generator: generator._scalars_chunks(),  # pylint: disable=protected-access
+    "enums": lambda generator: generator._enums_chunks(),  # pylint: disable=protected-access
+    "unions": lambda generator: generator._unions_chunks(),  # pylint: disable=protected-access
+    "interfaces": lambda generator: generator._interfaces_chunks(),  # pylint: disable=protected-access
+    "objects": lambda generator: generator._objects_chunks(),  # pylint: disable=protected-access
+    "footer": lambda generator: [generator._footer_str()],  # pylint: disable=protected-access
+}
+
+
+def _timed(timings: Dict[str, float], stage: str, function: Callable):
+    start = time.perf_counter()
+    result = function()
+    timings[stage] = time.perf_counter() - start
+
+    return result
+
+
+def run_once(sdl: str, tmp_dir: Path, renderer: str) -> Dict[str, float]:
+    """Time stages of one generation of the schema.
+
+    Args:
+        sdl: the schema.
+        tmp_dir: a folder for the schema file and the output.
+        renderer: the renderer of the pydantic backend (see `options.renderer`).
+
+    """
+
+    timings: Dict[str, float] = {}
+
+    schema_path = tmp_dir / "schema.graphql"
+    schema_path.write_text(sdl, encoding="utf-8")
+
+    config = GraphQL2PythonModelConfig(schema=schema_path, output=tmp_dir / "model.py", options={"renderer": renderer})
+
+    schema = _timed(timings, "build_schema", lambda: build_schema(sdl))
+    schema = _timed(timings, "lexicographic_sort_schema", lambda: lexicographic_sort_schema(schema))
+
+    # stages of the generator (the type map and the order of classes) are nested in its setup and excluded from it
+    profiler = Profiler(trace_memory=False)
+
+    with profiler.stage("generator_setup"):
+        generator = Generator(config, schema=schema, profiler=profiler)
+
+    for stage, result in profiler.stages.items():
+        timings[stage] = result["wall"]
+
+    chunks: List[str] = []
+
+    for stage, chunks_of in CHUNK_STAGES.items():
+        chunks.extend(_timed(timings, stage, lambda chunks_of=chunks_of: list(chunks_of(generator))))
+
+    _timed(timings, "write", lambda: write_chunks(config.output, chunks))
+
+    timings["total"] = sum(timings.values())
+
+    return timings
+
+
+def run(  # pylint: disable=too-many-arguments
+    sizes: List[int],
+    runs: int,
+    fields: int,
+    interface_depth: int,
+    union_width: int,
+    description_len: int,
+    renderer: str,
+) -> Dict:
+    """Run the benchmark for each size and return the JSON report."""
+
+    parameters = {
+        "fields": fields,
+        "interface_depth": interface_depth,
+        "union_width": union_width,
+        "description_len": description_len,
+        "renderer": renderer,
+        "runs": runs,
+    }
+
+    report: Dict = {
+        "graphql2python": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": parameters,
+        "results": [],
+    }
+
+    for size in sizes:
+        sdl = synthetic_schema(size, fields, interface_depth, union_width, description_len)
+        samples: Dict[str, List[float]] = {}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for _ in range(runs):
+                for stage, seconds in run_once(sdl, Path(tmp_dir), renderer).items():
+                    samples.setdefault(stage, []).append(seconds)
+
+            output_bytes = (Path(tmp_dir) / "model.py").stat().st_size
+
+        report["results"].append(
+            {
+                "types": size,
+                "schema_bytes": len(sdl.encode("utf-8")),
+                "output_bytes": output_bytes,
+                "stages": {
+                    stage: {"min": min(times), "median": statistics.median(times)} for stage, times in samples.items()
+                },
+            }
+        )
+
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--sizes", default="100,1000,5000", help="comma-separated numbers of types")
+    parser.add_argument("--runs", type=int, default=3, help="a number of runs for each size")
+    parser.add_argument("--fields", type=int, default=10, help="a number of own fields of each type")
+    parser.add_argument("--interface-depth", type=int, default=2, help="a length of each chain of interfaces")
+    parser.add_argument("--union-width", type=int, default=4, help="a number of members of each union")
+    parser.add_argument("--description-len", type=int, default=80, help="a length of each description")
+    parser.add_argument("--renderer", choices=["python", "jinja2"], default="python", help="see options.renderer")
+    parser.add_argument("--output", type=Path, default=None, help="a JSON file for results (stdout by default)")
+    args = parser.parse_args(argv)
+
+    report = run(
+        [int(size) for size in args.sizes.split(",")],
+        args.runs,
+        args.fields,
+        args.interface_depth,
+        args.union_width,
+        args.description_len,
+        args.renderer,
+    )
+
+    result = json.dumps(report, indent=2)
+
+    if args.output is None:
+        print(result)
+    else:
+        args.output.write_text(result + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Startup time of the generator with and without the template bytecode cache.
+
+Each run is a new process which imports the generator and renders a small
+schema; the time of the import and the render (with the compilation of
+templates) is measured in that process. Runs of the cases are interleaved.
+
+    python benchmarks/startup.py --runs 20
+
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+SCHEMA = ROOT / "tests" / "tests_model" / "tests_docs_examples" / "test_interfaces" / "input.graphql"
+
+RUN_CODE = """
+import sys
+import time
+
+start = time.perf_counter()
+
+from graphql2python.model.config import GraphQL2PythonModelConfig
+from graphql2python.model.generate import Generator
+
+Generator(GraphQL2PythonModelConfig(schema=sys.argv[1], output=sys.argv[2])).generate()
+
+print(time.perf_counter() - start)
+"""
+
+
+def _run(template_cache: str, output: Path) -> float:
+    env = dict(os.environ, GRAPHQL2PYTHON_TEMPLATE_CACHE=template_cache)
+
+    process = subprocess.run(
+        [sys.executable, "-c", RUN_CODE, str(SCHEMA), str(output)],
+        env=env,
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    return float(process.stdout)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--runs", type=int, default=10, help="a number of runs for each case")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output = Path(tmp_dir) / "model.py"
+        cache_dir = str(Path(tmp_dir) / "templates")
+
+        # fill the cache
+        _run(cache_dir, output)
+
+        cases: Dict[str, str] = {"without cache": "", "with cache": cache_dir}
+        results: Dict[str, List[float]] = {name: [] for name in cases}
+
+        for _ in range(args.runs):
+            for name, template_cache in cases.items():
+                results[name].append(_run(template_cache, output))
+
+    for name, times in results.items():
+        print(f"{name:<15} median {statistics.median(times) * 1000:8.1f} ms   min {min(times) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
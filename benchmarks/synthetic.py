@@ -0,0 +1,166 @@
+"""A generator of synthetic GraphQL schemas for benchmarks.
+
+A schema has `types` named types: two custom scalars, enums, chains of
+interfaces of the given depth (each interface implements the previous one),
+unions of the given width and objects. Each object implements the last
+interface of some chain, has `fields` own fields and references enums,
+unions and other objects. Each type and field has a description of
+`description_len` characters. The same arguments give the same schema.
+
+    python benchmarks/synthetic.py --types 1000 > schema.graphql
+
+"""
+
+import argparse
+import random
+from typing import List, Optional
+
+__all__ = [
+    "synthetic_schema",
+]
+
+SCALARS = ["DateTime", "JSON"]
+BUILTIN_SCALARS = ["String", "Int", "Float", "Boolean", "ID"]
+
+WORDS = ["the", "schema", "object", "field", "value", "of", "a", "type", "with", "some", "data", "and", "an", "item"]
+
+
+def _description(rnd: random.Random, length: int, indent: str) -> str:
+    if length <= 0:
+        return ""
+
+    words: List[str] = []
+    size = 0
+
+    while size < length:
+        words.append(rnd.choice(WORDS))
+        size += len(words[-1]) + 1
+
+    return f'{indent}"""\n{indent}{" ".join(words)[:length]}\n{indent}"""\n'
+
+
+def synthetic_schema(  # pylint: disable=too-many-arguments,too-many-locals
+    types: int = 1000,
+    fields: int = 10,
+    interface_depth: int = 2,
+    union_width: int = 4,
+    description_len: int = 80,
+    seed: int = 0,
+) -> str:
+    """Return SDL of a synthetic schema.
+
+    Args:
+        types: a number of named types except `Query` and built-in scalars.
+        fields: a number of own fields of each interface and object.
+        interface_depth: a length of each chain of interfaces (0 for no interfaces).
+        union_width: a number of members of each union.
+        description_len: a length of the description of each type and field (0 for no descriptions).
+        seed: a seed of the random choice of field types.
+
+    """
+
+    rnd = random.Random(seed)
+
+    share = max(1, types // 20)
+    n_enums = share
+    n_chains = share if interface_depth > 0 else 0
+    n_unions = share if union_width > 0 else 0
+    n_objects = max(1, types - len(SCALARS) - n_enums - n_chains * interface_depth - n_unions)
+
+    enums = [f"Enum{i}" for i in range(n_enums)]
+    chains = [[f"Interface{i}Level{level}" for level in range(interface_depth)] for i in range(n_chains)]
+    unions = [f"Union{i}" for i in range(n_unions)]
+    objects = [f"Object{i}" for i in range(n_objects)]
+
+    leaf_types = SCALARS + BUILTIN_SCALARS + enums
+
+    def field_type() -> str:
+        kind = rnd.random()
+
+        if kind < 0.6:
+            name = rnd.choice(leaf_types)
+        elif kind < 0.8 or not unions:
+            name = rnd.choice(objects)
+        else:
+            name = rnd.choice(unions)
+
+        if rnd.random() < 0.2:
+            name = f"[{name}]"
+
+        return name + ("!" if rnd.random() < 0.5 else "")
+
+    def type_fields(prefix: str) -> List[str]:
+        return [f"{prefix}Field{i}: {field_type()}" for i in range(fields)]
+
+    def render_fields(lines: List[str]) -> str:
+        return "".join(_description(rnd, description_len, "  ") + f"  {line}\n" for line in lines)
+
+    blocks: List[str] = []
+
+    for name in SCALARS:
+        blocks.append(_description(rnd, description_len, "") + f"scalar {name}\n")
+
+    for name in enums:
+        values = "".join(f"  {name.upper()}_VALUE{i}\n" for i in range(5))
+        blocks.append(_description(rnd, description_len, "") + f"enum {name} {{\n{values}}}\n")
+
+    # fields of each interface with fields of its parents
+    interface_fields = {}
+
+    for chain in chains:
+        inherited: List[str] = []
+
+        for level, name in enumerate(chain):
+            own = type_fields(f"{name[0].lower()}{name[1:]}")
+            implements = f" implements {' & '.join(chain[:level])}" if level > 0 else ""
+
+            blocks.append(
+                _description(rnd, description_len, "")
+                + f"interface {name}{implements} {{\n{render_fields(inherited + own)}}}\n"
+            )
+
+            inherited = inherited + own
+            interface_fields[name] = inherited
+
+    for name in unions:
+        members = rnd.sample(objects, min(union_width, len(objects)))
+        blocks.append(_description(rnd, description_len, "") + f"union {name} = {' | '.join(members)}\n")
+
+    for name in objects:
+        lines = type_fields(f"{name[0].lower()}{name[1:]}")
+        implements = ""
+
+        if chains:
+            chain = rnd.choice(chains)
+            implements = f" implements {' & '.join(chain)}"
+            lines = interface_fields[chain[-1]] + lines
+
+        blocks.append(
+            _description(rnd, description_len, "") + f"type {name}{implements} {{\n{render_fields(lines)}}}\n"
+        )
+
+    blocks.append(f"type Query {{\n  {objects[0][0].lower()}{objects[0][1:]}: {objects[0]}\n}}\n")
+
+    return "\n".join(blocks)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--types", type=int, default=1000, help="a number of named types")
+    parser.add_argument("--fields", type=int, default=10, help="a number of own fields of each type")
+    parser.add_argument("--interface-depth", type=int, default=2, help="a length of each chain of interfaces")
+    parser.add_argument("--union-width", type=int, default=4, help="a number of members of each union")
+    parser.add_argument("--description-len", type=int, default=80, help="a length of each description")
+    parser.add_argument("--seed", type=int, default=0, help="a seed of the random choice of field types")
+    args = parser.parse_args(argv)
+
+    print(
+        synthetic_schema(
+            args.types, args.fields, args.interface_depth, args.union_width, args.description_len, args.seed
+        ),
+        end="",
+    )
+
+
+if __name__ == "__main__":
+    main()
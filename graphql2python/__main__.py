@@ -1,11 +1,21 @@
+import glob
+import json
 import os
+import sys
+import time
 from pathlib import Path
+from typing import List, Optional, Set, Tuple
 
 import click
 import yaml
 
+from graphql2python.model.batch import generate_batch
+from graphql2python.model.cache import RenderCache
 from graphql2python.model.config import GraphQL2PythonModelConfig
 from graphql2python.model.generate import Generator
+from graphql2python.model.operations import OperationsGenerator
+from graphql2python.utils.profile import Profiler
+from graphql2python.utils.watch import watch_files
 
 
 @click.group()
@@ -17,21 +27,363 @@ def model_cli():
 @click.option(
     "-c",
     "--config",
-    help="GraphQL2Python model config.",
+    "configs",
+    multiple=True,
+    help="GraphQL2Python model config. Can be a glob pattern or be used several times.",
 )
-def generate(config: str):
+@click.option(
+    "--manifest",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="A file with paths to configs (one per line).",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="A number of processes for render (overrides options.workers).",
+)
+@click.option(
+    "--batch-jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="A number of processes for generation of several configs.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Do not use the schema and render caches (see cache_dir).",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Regenerate on changes of the config, schema or license file.",
+)
+@click.option(
+    "--stats",
+    is_flag=True,
+    default=False,
+    help="Print hits and misses of the render caches.",
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    default=False,
+    help="Do not write the output, exit with code 1 if it is not up to date.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Print wall and CPU time and peak memory of each stage, and counts of rendered types and fields.",
+)
+@click.option(
+    "--profile-json",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the profile of stages to a JSON file.",
+)
+@click.option(
+    "--profile-dump",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write cProfile stats of the render phase to a file (see pstats).",
+)
+@click.option(
+    "--profile-memory/--no-profile-memory",
+    default=True,
+    help="Trace peak memory of stages with tracemalloc (slows the run down).",
+)
+def generate(
+    configs: Tuple[str, ...],
+    manifest: Optional[Path],
+    jobs: Optional[int],
+    batch_jobs: int,
+    no_cache: bool,
+    watch: bool,
+    stats: bool,
+    check: bool,
+    profile: bool,
+    profile_json: Optional[Path],
+    profile_dump: Optional[Path],
+    profile_memory: bool,
+):  # pylint: disable=too-many-arguments,too-many-locals
     """Generate pydantic data-model."""
 
+    config_paths = _config_paths(configs, manifest)
+    profiled = profile or profile_json is not None or profile_dump is not None
+
+    if len(config_paths) == 0:
+        raise click.UsageError("No config is given, use --config or --manifest.")
+
+    if check and watch:
+        raise click.UsageError("--check cannot be used with --watch.")
+
+    if len(config_paths) > 1:
+        if watch:
+            raise click.UsageError("--watch supports only one config.")
+
+        if profiled:
+            raise click.UsageError("--profile supports only one config.")
+
+        _generate_batch(config_paths, jobs, batch_jobs, no_cache, check)
+        return
+
+    config = _load_config(config_paths[0], jobs, no_cache)
+
+    if check:
+        _check(Generator(config))
+        return
+
+    if profiled:
+        generator = _generate_profiled(config, profile, profile_json, profile_dump, profile_memory)
+    else:
+        generator = Generator(config)
+        generator.generate()
+
+    _print_pruned(generator)
+
+    if stats:
+        _print_stats(generator)
+
+    if watch:
+        _watch(config_paths[0], jobs, no_cache, generator)
+
+
+@model_cli.command("generate-operations")
+@click.option("-c", "--config", "config", required=True, help="GraphQL2Python model config.")
+@click.option(
+    "--operation",
+    "operations",
+    multiple=True,
+    help="A file with operations. Can be a glob pattern or be used several times (default is options.operations).",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    required=True,
+    help="A path to the output python file.",
+)
+def generate_operations(config: str, operations: Tuple[str, ...], output: Path):
+    """Generate pydantic models of responses for GraphQL operations."""
+
+    generator = Generator(_load_config(Path(config).resolve(), None, False))
+    operation_paths = _operation_paths(operations) if operations else generator.config.options.operations
+
+    if len(operation_paths) == 0:
+        raise click.UsageError("No operation is given, use --operation or options.operations.")
+
+    try:
+        operations_generator = OperationsGenerator(generator, operation_paths)
+    except ValueError as error:
+        raise click.ClickException(str(error)) from error
+
+    operations_generator.generate(output)
+
+
+def _operation_paths(operations: Tuple[str, ...]) -> List[Path]:
+    """Absolute paths to operation files from CLI options with expanded glob patterns."""
+
+    operation_paths: List[Path] = []
+
+    for pattern in operations:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+
+            if len(matches) == 0:
+                raise click.UsageError(f"No operation file matches {pattern}.")
+
+            operation_paths.extend(Path(match).resolve() for match in matches)
+        else:
+            operation_paths.append(Path(pattern).resolve())
+
+    return list(dict.fromkeys(operation_paths))
+
+
+def _config_paths(configs: Tuple[str, ...], manifest: Optional[Path]) -> List[Path]:
+    """Absolute paths to configs from CLI options with expanded glob patterns."""
+
     cwd_path = Path(os.getcwd())
-    config_path = (cwd_path / Path(config)).resolve()
+    patterns = [(cwd_path, config) for config in configs]
+
+    if manifest is not None:
+        with manifest.open("r", encoding="utf-8") as manifest_file:
+            for line in manifest_file:
+                line = line.strip()
 
+                if line and not line.startswith("#"):
+                    patterns.append(((cwd_path / manifest).parent, line))
+
+    config_paths: List[Path] = []
+
+    for base_path, pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(str(base_path / pattern), recursive=True))
+
+            if len(matches) == 0:
+                raise click.UsageError(f"No config matches {pattern}.")
+
+            config_paths.extend(Path(match).resolve() for match in matches)
+        else:
+            config_paths.append((base_path / Path(pattern)).resolve())
+
+    # keep the first occurrence of each config
+    return list(dict.fromkeys(config_paths))
+
+
+def _load_config(config_path: Path, jobs: Optional[int], no_cache: bool) -> GraphQL2PythonModelConfig:
     with config_path.open("r", encoding="utf-8") as config_file:
         yaml_config = yaml.safe_load(config_file)
 
     graphql2python_config = GraphQL2PythonModelConfig.parse_obj(yaml_config)
 
-    generator = Generator(graphql2python_config)
-    generator.generate()
+    if jobs is not None:
+        graphql2python_config.options.workers = jobs
+
+    if no_cache:
+        graphql2python_config.cache_dir = None
+
+    return graphql2python_config
+
+
+def _check(generator: Generator):
+    """Exit with code 1 if some output files are not up to date."""
+
+    stale = generator.check()
+
+    for path in stale:
+        click.echo(f"{path} is not up to date", err=True)
+
+    if stale:
+        sys.exit(1)
+
+    click.echo(f"{generator.config.output} is up to date")
+
+
+def _generate_batch(
+    config_paths: List[Path], jobs: Optional[int], batch_jobs: int, no_cache: bool, check: bool = False
+):  # pylint: disable=too-many-arguments
+    """Generate (or check) data-models for several configs and print a timing summary."""
+
+    start = time.perf_counter()
+    configs = [_load_config(config_path, jobs, no_cache) for config_path in config_paths]
+
+    failed = 0
+    width = max(len(str(config_path)) for config_path in config_paths)
+
+    for config_path, result in zip(config_paths, generate_batch(configs, batch_jobs, check)):
+        if result.error is not None:
+            status = f"error: {result.error}"
+        elif check and result.changed:
+            status = "not up to date: " + ", ".join(map(str, result.changed))
+        elif not result.changed:
+            status = "ok (unchanged)"
+        else:
+            status = "ok"
+
+        click.echo(f"{str(config_path):<{width}}  {result.seconds:8.2f}s  {status}")
+
+        if result.error is not None or (check and result.changed):
+            failed += 1
+
+    click.echo(f"{'total':<{width}}  {time.perf_counter() - start:8.2f}s  {len(configs) - failed}/{len(configs)} ok")
+
+    if failed > 0:
+        sys.exit(1)
+
+
+def _generate_profiled(
+    config: GraphQL2PythonModelConfig,
+    print_table: bool,
+    json_path: Optional[Path],
+    dump_path: Optional[Path],
+    trace_memory: bool,
+) -> Generator:  # pylint: disable=too-many-arguments
+    """Generate the data-model with the profiler and print or write its results."""
+
+    with Profiler(trace_memory=trace_memory, cprofile_path=dump_path) as profiler:
+        generator = Generator(config, profiler=profiler)
+        generator.generate()
+
+    if print_table:
+        click.echo(profiler.format_table())
+
+    if json_path is not None:
+        with json_path.open("w", encoding="utf-8") as json_file:
+            json.dump(profiler.report(), json_file, indent=2)
+
+    return generator
+
+
+def _print_pruned(generator: Generator):
+    """Print a number of pruned types if only types reachable from roots are rendered."""
+
+    options = generator.config.options
+
+    if options.roots or options.operations:
+        click.echo(f"{generator.type_map.pruned} types are pruned, {len(generator.type_map.types)} types are rendered")
+
+
+def _print_stats(generator: Generator):
+    """Print counters of the render caches (types rendered in worker processes are not counted)."""
+
+    render = generator.render
+    click.echo(f"field types: {render.field_type_cache_hits} hits, {render.field_type_cache_misses} misses")
+
+    text_hits, text_misses = render.text_cache_info()
+    click.echo(f"comments and docstrings: {text_hits} hits, {text_misses} misses")
+
+    if generator.render_cache is not None:
+        render_cache = generator.render_cache
+        click.echo(f"render cache: {render_cache.hits} hits, {render_cache.misses} misses")
+
+
+def _watch(config_path: Path, jobs: Optional[int], no_cache: bool, generator: Generator):
+    """Regenerate on changes, reusing the loaded schema and rendered types."""
+
+    if generator.render_cache is None:
+        generator.render_cache = RenderCache()
+
+    def watched_paths() -> List[Path]:
+        paths = [config_path, *generator.config.schema_paths, *generator.config.options.operations]
+
+        if generator.config.license_file is not None:
+            paths.append(generator.config.license_file)
+
+        return paths
+
+    def on_change(changed: Set[Path]):
+        nonlocal generator
+
+        start = time.perf_counter()
+
+        try:
+            # the schema is loaded again only if it or the config is changed
+            if changed - {generator.config.license_file}:
+                generator = Generator(_load_config(config_path, jobs, no_cache), generator.render_cache)
+
+            written = generator.generate()
+
+        except Exception as error:  # pylint: disable=broad-except
+            click.echo(f"Error: {error}", err=True)
+            return
+
+        if not written:
+            click.echo(f"{generator.config.output} is not changed ({time.perf_counter() - start:.2f}s)")
+            return
+
+        click.echo(f"Regenerated {generator.config.output} in {time.perf_counter() - start:.2f}s")
+
+    click.echo(f"Watching for changes of {', '.join(str(path) for path in watched_paths())}")
+
+    try:
+        watch_files(watched_paths, on_change)
+    except KeyboardInterrupt:
+        pass
 
 
 graphql2python = cli = click.CommandCollection(sources=[model_cli])
@@ -1,8 +1,10 @@
+import re
+import sys
 from collections import defaultdict
 from functools import lru_cache
 from typing import DefaultDict, Dict, Iterable, List, Optional, Set, Union
 
-from pydantic import BaseModel
+from graphql2python.utils.compat import BaseModel
 
 __all__ = [
     "Import",
@@ -20,8 +22,20 @@ __all__ = [
     "IMPORT_DATETIME",
     "IMPORT_TIME",
     "IMPORT_UUID",
+    "IMPORT_TYPING_MODULE",
+    "pytype_import",
 ]
 
+# modules of the standard library for python versions without sys.stdlib_module_names
+_STDLIB_MODULES = frozenset({
+    'collections', 'dataclasses', 'datetime', 'decimal', 'enum', 'fractions', 'importlib', 'ipaddress',
+    'json', 'pathlib', 'typing', 'uuid',
+})
+
+
+def _is_stdlib(module: str) -> bool:
+    return module.split('.')[0] in getattr(sys, 'stdlib_module_names', _STDLIB_MODULES)
+
 
 class Import(BaseModel):
     from_: Optional[str] = None
@@ -63,6 +77,25 @@ class Imports(DefaultDict[Optional[str], Set[str]]):
             self.create_line(from_, imports) for from_, imports in self.items()
         )
 
+    def dump_sections(self) -> str:
+        """Sorted imports of the standard library, then imports of other packages after an empty line."""
+
+        sections: List[str] = []
+
+        for is_stdlib in (True, False):
+            modules = {i for i in self.get(None, ()) if _is_stdlib(i) == is_stdlib}
+            lines = [self.create_line(None, modules)] if modules else []
+
+            lines += [
+                self.create_line(from_, self[from_])
+                for from_ in sorted(from_ for from_ in self if from_ and _is_stdlib(from_) == is_stdlib)
+            ]
+
+            if lines:
+                sections.append('\n'.join(lines))
+
+        return '\n\n'.join(sections)
+
     def append(self, imports: Union[Import, Iterable[Import], None]) -> None:
         if imports:
             if isinstance(imports, Import):
@@ -87,6 +120,8 @@ IMPORT_UNION = Import.from_full_path('typing.Union')
 IMPORT_OPTIONAL = Import.from_full_path('typing.Optional')
 IMPORT_LITERAL = Import.from_full_path('typing.Literal')
 IMPORT_TUPLE = Import.from_full_path('typing.Tuple')
+# the typing module as _t which rendered types use
+IMPORT_TYPING_MODULE = Import(import_='typing', alias='_t')
 
 
 #
@@ -98,3 +133,34 @@ IMPORT_DATE = Import.from_full_path('datetime.date')
 IMPORT_DATETIME = Import.from_full_path('datetime.datetime')
 IMPORT_TIME = Import.from_full_path('datetime.time')
 IMPORT_UUID = Import.from_full_path('uuid.UUID')
+
+
+# python types of scalars which are imported by their names
+KNOWN_PYTYPES: Dict[str, Import] = {
+    'date': IMPORT_DATE,
+    'datetime': IMPORT_DATETIME,
+    'time': IMPORT_TIME,
+    'Decimal': IMPORT_DECIMAL,
+    'UUID': IMPORT_UUID,
+}
+
+
+# a dotted path of a python type (as decimal.Decimal) without subscripts
+_DOTTED_PATH = re.compile(r'[A-Za-z_]\w*(\.[A-Za-z_]\w*)+')
+
+
+def pytype_import(pytype: str) -> Optional[Import]:
+    """An import of a python type for a scalar: a dotted path (as decimal.Decimal) or a known name.
+
+    A type of the typing module as _t (as _t.Any or _t.Dict[str, _t.Any]) needs `typing as _t`,
+    other types with subscripts are not imported.
+
+    """
+
+    if pytype.startswith('_t.'):
+        return IMPORT_TYPING_MODULE
+
+    if _DOTTED_PATH.fullmatch(pytype):
+        return Import.from_full_path(pytype)
+
+    return KNOWN_PYTYPES.get(pytype)
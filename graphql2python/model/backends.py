@@ -0,0 +1,244 @@
+"""Renders of the data-model for backends other than pydantic v1."""
+
+from typing import Dict, List, Optional, Tuple, Type
+
+from graphql2python.imports import IMPORT_DATE, IMPORT_DATETIME, Import
+from graphql2python.model.fast_render import FastDataModelRender
+from graphql2python.model.render import (
+    IMPORT_BASE_MODEL,
+    IMPORT_ENUM_MODULE,
+    IMPORT_TYPING_MODULE,
+    DataModelRender,
+    LazyTemplate
+)
+
+__all__ = [
+    "DataclassRender",
+    "FAST_RENDERS",
+    "FastPydanticV2Render",
+    "MsgspecRender",
+    "PydanticV2Render",
+    "RENDERS",
+]
+
+
+class PydanticV2Render(DataModelRender):
+    """Render GraphQL types as pydantic v2 models.
+
+    Classes are the same as for pydantic v1 with `discriminated_unions`:
+    interfaces are inherited, unions and interfaces in fields are unions
+    of object types with the `__typename` discriminator. The general class
+    has `model_config`, forward references are resolved by `model_rebuild`,
+    and `convert(obj, type)`, `decode(json, type)` and `to_builtins(obj)`
+    validate and dump any type (as a list or a union of classes) with
+    cached `TypeAdapter`s.
+
+    """
+
+    _template_general = LazyTemplate("pydantic_v2/general.jinja2")
+
+    GENERAL_IMPORTS = (
+        IMPORT_TYPING_MODULE,
+        IMPORT_BASE_MODEL,
+        Import.from_full_path("pydantic.ConfigDict"),
+        Import.from_full_path("pydantic.TypeAdapter"),
+    )
+
+    # from_trusted_dict is not rendered
+    FROM_TRUSTED_DICT_IMPORTS: Tuple[Import, ...] = ()
+    JSON_METHODS_IMPORTS: Tuple[Import, ...] = (IMPORT_TYPING_MODULE,)
+
+    # pydantic v2 does not convert numbers and booleans to str
+    BUILTIN_SCALAR_PYTYPES = {"Int": "int", "Float": "float", "Boolean": "bool"}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # members of unions are always chosen by __typename
+        self.discriminated_unions = True
+
+    def render_general_class(  # type: ignore
+        self,
+        add_from_dict: bool,
+        add_to_dict: bool,
+        add_from_trusted_dict: bool = False,
+        add_json_methods: bool = False,
+    ) -> str:
+        """Render the general class for each datamodel class and functions of the data-model.
+
+        Args:
+            add_from_dict: add from_dict method to the general class.
+            add_to_dict: add to_dict method to the general class.
+            add_from_trusted_dict: is ignored, pydantic v2 validates responses fast enough.
+            add_json_methods: add from_json and to_json methods (JSON of pydantic-core) to the general class.
+
+        """
+
+        return self._template_general.render(
+            add_from_dict=add_from_dict, add_to_dict=add_to_dict, add_json_methods=add_json_methods
+        )
+
+    @staticmethod
+    def render_footer(names: List[str]) -> str:
+        """Render the end of the output module.
+
+        Args:
+            names: names of rendered interfaces and objects with forward references.
+
+        """
+
+        return "".join(f"{name}.model_rebuild()\n" for name in names)
+
+
+class FastPydanticV2Render(FastDataModelRender, PydanticV2Render):
+    """Render pydantic v2 models without jinja2 templates (see `FastDataModelRender`)."""
+
+
+class _BackendRender(DataModelRender):
+    """A base render for backends with slotted classes.
+
+    Slots of several base classes conflict, so classes do not inherit
+    their interfaces and have all fields. A union or an interface in
+    a field is replaced by the union of its possible object types
+    which are decoded by `__typename`.
+
+    """
+
+    INHERIT_INTERFACES = False
+
+    # neither dataclasses nor msgspec coerce JSON numbers and booleans to str
+    BUILTIN_SCALAR_PYTYPES = {"Int": "int", "Float": "float", "Boolean": "bool"}
+
+    # from_trusted_dict and JSON methods are not rendered
+    FROM_TRUSTED_DICT_IMPORTS: Tuple[Import, ...] = ()
+    JSON_METHODS_IMPORTS: Tuple[Import, ...] = ()
+
+    _template_general: LazyTemplate
+    _template_decoder: LazyTemplate
+
+    # a function for options of a field
+    FIELD_FUNCTION: str
+    # an argument of `FIELD_FUNCTION` for an alias
+    ALIAS_ARGUMENT: str
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # unions are always decoded by __typename without pydantic discriminators
+        self.discriminated_unions = False
+
+    def render_general_class(  # type: ignore
+        self,
+        add_from_dict: bool,
+        add_to_dict: bool,
+        add_from_trusted_dict: bool = False,
+        add_json_methods: bool = False,
+    ) -> str:
+        """Render the general class for each datamodel class.
+
+        Args:
+            add_from_dict: add from_dict method to the general class.
+            add_to_dict: add to_dict method to the general class.
+            add_from_trusted_dict: is ignored, decoders of these backends do not validate.
+            add_json_methods: is ignored, use `decode(json, type)` of the data-model.
+
+        """
+
+        return self._template_general.render(add_from_dict=add_from_dict, add_to_dict=add_to_dict)
+
+    def render_footer(self, names: List[str]) -> str:  # type: ignore
+        """Render the decoder of the data-model.
+
+        Args:
+            names: names of rendered interfaces and objects.
+
+        """
+
+        return self._template_decoder.render() + "\n"
+
+    @property
+    def expand_interfaces(self) -> bool:
+        return True
+
+    def _render_type_ref(self, type_name: str) -> Tuple[str, bool]:
+        possible_types = self.possible_types.get(type_name)
+
+        if not possible_types:
+            return self._name_ref(type_name), False
+
+        if len(possible_types) == 1:
+            return self._name_ref(possible_types[0]), False
+
+        return "_t.Union[" + ", ".join(map(self._name_ref, possible_types)) + "]", False
+
+    def _render_field_options(self, default: Optional[str], alias: Optional[str], discriminated: bool) -> str:
+        options: List[str] = []
+
+        if default == "None":
+            options.append("default=None")
+        elif default == "list":
+            options.append("default_factory=list")
+
+        if alias is not None:
+            options.append(self.ALIAS_ARGUMENT.format(alias=alias))
+
+        if len(options) == 0:
+            return ""
+
+        if options == ["default=None"]:
+            return " = None"
+
+        return f" = {self.FIELD_FUNCTION}({', '.join(options)})"
+
+
+class DataclassRender(_BackendRender):
+    """Render GraphQL types as slotted dataclasses (Python 3.10+)."""
+
+    _template_interface = LazyTemplate("dataclass_slots/interface.jinja2")
+    _template_object = LazyTemplate("dataclass_slots/object.jinja2")
+    _template_general = LazyTemplate("dataclass_slots/general.jinja2")
+    _template_decoder = LazyTemplate("dataclass_slots/decoder.jinja2")
+
+    # the decoder in the footer converts enums and dates
+    GENERAL_IMPORTS = (
+        Import(import_="dataclasses"),
+        Import(import_="json"),
+        IMPORT_ENUM_MODULE,
+        IMPORT_TYPING_MODULE,
+        IMPORT_DATE,
+        IMPORT_DATETIME,
+    )
+    CLASS_IMPORTS = (Import(import_="dataclasses"), IMPORT_TYPING_MODULE)
+
+    FIELD_FUNCTION = "dataclasses.field"
+    ALIAS_ARGUMENT = "metadata={{'alias': '{alias}'}}"
+
+
+class MsgspecRender(_BackendRender):
+    """Render GraphQL types as `msgspec.Struct` classes tagged by `__typename`."""
+
+    _template_interface = LazyTemplate("msgspec/interface.jinja2")
+    _template_object = LazyTemplate("msgspec/object.jinja2")
+    _template_general = LazyTemplate("msgspec/general.jinja2")
+    _template_decoder = LazyTemplate("msgspec/decoder.jinja2")
+
+    GENERAL_IMPORTS = (Import(import_="msgspec"), IMPORT_TYPING_MODULE)
+    CLASS_IMPORTS = (Import(import_="msgspec"), IMPORT_TYPING_MODULE)
+
+    FIELD_FUNCTION = "msgspec.field"
+    ALIAS_ARGUMENT = "name='{alias}'"
+
+
+# options.backend --> render class
+RENDERS: Dict[str, Type[DataModelRender]] = {
+    "pydantic": DataModelRender,
+    "pydantic_v2": PydanticV2Render,
+    "dataclass_slots": DataclassRender,
+    "msgspec": MsgspecRender,
+}
+
+# render class --> the render with the same output without templates (see options.renderer)
+FAST_RENDERS: Dict[Type[DataModelRender], Type[DataModelRender]] = {
+    DataModelRender: FastDataModelRender,
+    PydanticV2Render: FastPydanticV2Render,
+}
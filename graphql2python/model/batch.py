@@ -0,0 +1,80 @@
+"""Generation of data-models for many configs in one process."""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from graphql import GraphQLSchema
+
+from graphql2python.model.config import GraphQL2PythonModelConfig
+from graphql2python.model.generate import Generator, load_schema
+
+__all__ = [
+    "BatchResult",
+    "generate_batch",
+]
+
+
+class BatchResult(NamedTuple):
+    """A result of generation for one config of a batch."""
+
+    config: GraphQL2PythonModelConfig
+    seconds: float
+    error: Optional[str] = None
+    # written files or, for a check, files which are not up to date
+    changed: Tuple[Path, ...] = ()
+
+
+# ((schema path, mtime in ns) for each schema file, cache_dir) --> sorted schema; shared by configs of the process
+_schemas: Dict[Tuple[Tuple[Tuple[Path, int], ...], Optional[Path]], GraphQLSchema] = {}
+
+
+def _shared_schema(config: GraphQL2PythonModelConfig) -> GraphQLSchema:
+    files = tuple((path, path.stat().st_mtime_ns) for path in config.schema_paths)
+    key = (files, config.cache_dir)
+
+    if key not in _schemas:
+        _schemas[key] = load_schema(config)
+
+    return _schemas[key]
+
+
+def _generate_one(config: GraphQL2PythonModelConfig, check: bool = False) -> BatchResult:
+    start = time.perf_counter()
+
+    try:
+        generator = Generator(config, schema=_shared_schema(config))
+        changed = generator.check() if check else generator.generate()
+
+    except Exception as error:  # pylint: disable=broad-except
+        return BatchResult(config, time.perf_counter() - start, f"{type(error).__name__}: {error}")
+
+    return BatchResult(config, time.perf_counter() - start, changed=tuple(changed))
+
+
+def generate_batch(
+    configs: List[GraphQL2PythonModelConfig], workers: int = 1, check: bool = False
+) -> Iterator[BatchResult]:
+    """Generate data-models for each config in their order.
+
+    A schema used by several configs is loaded once per process. An error
+    for some config is returned in its result and does not stop the batch.
+
+    Args:
+        configs: configs for generate.
+        workers: a number of processes; configs are rendered serially in each of them.
+        check: only check that outputs are up to date (see `Generator.check`).
+
+    """
+
+    if workers <= 1 or len(configs) <= 1:
+        yield from map(_generate_one, configs, repeat(check))
+        return
+
+    # worker processes of the batch cannot start their own workers
+    serial_configs = [config.copy(update={"options": config.options.copy(update={"workers": 1})}) for config in configs]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_generate_one, serial_configs, repeat(check))
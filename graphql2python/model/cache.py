@@ -0,0 +1,274 @@
+"""On-disk caches for the data-model generator."""
+
+import hashlib
+import json
+import os
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from graphql import DocumentNode, parse
+from graphql import version as graphql_core_version
+from graphql.language import ast
+
+from graphql2python.__version__ import __version__
+from graphql2python.utils.files import write_chunks
+
+__all__ = [
+    "RenderCache",
+    "SchemaCache",
+]
+
+
+class RenderCache:
+    """Rendered types with fingerprints of their definitions.
+
+    A type is taken from the cache only if the fingerprint of its
+    definition and render options is the same as in the previous run.
+
+    Args:
+        path: a path to the cache file. The cache is kept in memory only if it is None.
+
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+
+        # type name --> (fingerprint, rendered text)
+        self._entries: Dict[str, Tuple[str, str]] = {}
+        self._new_entries: Dict[str, Tuple[str, str]] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_output(cls, cache_dir: Path, output: Path) -> "RenderCache":
+        """Create a cache for some output file.
+
+        Args:
+            cache_dir: a folder with cache files.
+            output: a path to the output file.
+
+        """
+
+        output_key = hashlib.sha256(str(output).encode("utf-8")).hexdigest()[:16]
+
+        return cls(cache_dir / f"render-{output_key}.json")
+
+    def load(self) -> None:
+        """Load entries from the cache file. A broken or outdated file is ignored."""
+
+        if self.path is None:
+            return
+
+        self._entries = {}
+
+        try:
+            with self.path.open("r", encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict) or data.get("version") != __version__:
+            return
+
+        self._entries = {name: (entry[0], entry[1]) for name, entry in data.get("types", {}).items()}
+
+    def contains(self, name: str, fingerprint: str) -> bool:
+        """Check that the type is in the cache with the same fingerprint, hits and misses are not counted.
+
+        Args:
+            name: a type name.
+            fingerprint: the fingerprint of the type.
+
+        """
+
+        entry = self._entries.get(name)
+
+        return entry is not None and entry[0] == fingerprint
+
+    def get(self, name: str, fingerprint: str) -> Optional[str]:
+        """Get the rendered type if its fingerprint is not changed.
+
+        Args:
+            name: a type name.
+            fingerprint: the fingerprint of the type.
+
+        """
+
+        entry = self._entries.get(name)
+
+        if entry is None or entry[0] != fingerprint:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._new_entries[name] = entry
+
+        return entry[1]
+
+    def set(self, name: str, fingerprint: str, text: str) -> None:
+        """Save the rendered type.
+
+        Args:
+            name: a type name.
+            fingerprint: the fingerprint of the type.
+            text: the rendered type.
+
+        """
+
+        self._new_entries[name] = (fingerprint, text)
+
+    def save(self) -> None:
+        """Write types rendered or used in this run to the cache file."""
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            types: Dict[str, List[str]] = {name: list(entry) for name, entry in self._new_entries.items()}
+            write_chunks(self.path, [json.dumps({"version": __version__, "types": types})])
+
+        self._entries = self._new_entries
+        self._new_entries = {}
+
+
+# a key of the class name of an AST node in JSON, it is not a name of a node field
+_KIND = ""
+
+# classes of AST nodes and enums by their names, only these classes are created from a cache file
+_AST_CLASSES: Dict[str, Union[Type[ast.Node], Type[Enum]]] = {
+    name: value
+    for name, value in vars(ast).items()
+    if isinstance(value, type) and issubclass(value, (ast.Node, Enum)) and value not in (ast.Node, Enum)
+}
+
+
+def _document_to_json(value: Any) -> Any:
+    """Convert an AST without locations to JSON-serializable values."""
+
+    if isinstance(value, ast.Node):
+        result = {key: _document_to_json(getattr(value, key)) for key in value.keys if key != "loc"}
+        result[_KIND] = type(value).__name__
+        return result
+
+    if isinstance(value, (list, tuple)):
+        return [_document_to_json(item) for item in value]
+
+    if isinstance(value, Enum):
+        return {_KIND: type(value).__name__, "value": value.value}
+
+    return value
+
+
+def _json_to_node(data: Dict[str, Any]) -> Any:
+    """Create an AST node or an enum of a JSON object (an `object_hook` of `json.loads`)."""
+
+    if _KIND not in data:
+        return data
+
+    cls = _AST_CLASSES[data.pop(_KIND)]
+
+    if issubclass(cls, Enum):
+        return cls(data["value"])
+
+    # nodes are created without __init__, which is slow for large documents
+    node = cls.__new__(cls)
+    node.loc = None
+
+    for key in cls.keys:
+        if key != "loc":
+            value = data[key]
+            setattr(node, key, tuple(value) if isinstance(value, list) else value)
+
+    return node
+
+
+class SchemaCache:
+    """Parsed GraphQL schemas keyed on the schema text and the graphql-core version.
+
+    Documents are stored as JSON, so a cache file cannot run code when it
+    is loaded. Cached schemas are removed in least recently used order
+    when their total size is greater than `max_size` (see `evict`).
+
+    Args:
+        cache_dir: a folder with cache files.
+        max_size: the maximum of the total size of cached schemas in bytes.
+
+    """
+
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+    def __init__(self, cache_dir: Path, max_size: int = DEFAULT_MAX_SIZE):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    def _path(self, schema_str: str) -> Path:
+        key = hashlib.sha256(f"{graphql_core_version}\0{schema_str}".encode("utf-8")).hexdigest()
+
+        return self.cache_dir / f"schema-{key}.json"
+
+    def _load(self, path: Path) -> Optional[DocumentNode]:
+        try:
+            with path.open("r", encoding="utf-8") as cache_file:
+                document = json.load(cache_file, object_hook=_json_to_node)
+
+            # mark as recently used
+            os.utime(path)
+
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+        if not isinstance(document, DocumentNode):
+            return None
+
+        return document
+
+    def evict(self) -> None:
+        """Remove least recently used schemas which do not fit into `max_size`.
+
+        Files removed by another process at the same time are skipped.
+
+        """
+
+        files = []
+
+        for path in self.cache_dir.glob("schema-*.json"):
+            try:
+                files.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+
+        total_size = 0
+
+        for path, stat in sorted(files, key=lambda file: file[1].st_mtime, reverse=True):
+            total_size += stat.st_size
+
+            if total_size > self.max_size:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def parse(self, schema_str: str) -> DocumentNode:
+        """Parse a GraphQL schema or take it from the cache.
+
+        Old schemas are not removed here, so several processes can parse schemas at once; call `evict` after.
+
+        Args:
+            schema_str: GraphQL schema in SDL.
+
+        """
+
+        path = self._path(schema_str)
+
+        document = self._load(path)
+        if document is not None:
+            return document
+
+        document = parse(schema_str, no_location=True)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        write_chunks(path, [json.dumps(_document_to_json(document), separators=(",", ":"))])
+
+        return document
@@ -1,8 +1,9 @@
+import glob
 import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, validator
+from graphql2python.utils.compat import BaseModel, Field, root_validator, validator
 
 __all__ = [
     "FieldSetting",
@@ -14,6 +15,26 @@ __all__ = [
 cwd_path = Path(os.getcwd())
 
 
+def _expand_patterns(paths: List[Any]) -> List[Path]:
+    """Paths with expanded glob patterns; a relative pattern is expanded against the current folder."""
+
+    result: List[Path] = []
+
+    for path in map(str, paths):
+        if not glob.has_magic(path):
+            result.append(Path(path))
+            continue
+
+        matches = sorted(glob.glob(str(cwd_path / path), recursive=True))
+
+        if len(matches) == 0:
+            raise ValueError(f"No file matches {path}.")
+
+        result.extend(map(Path, matches))
+
+    return result
+
+
 class FieldSetting(BaseModel):
     """Settings for an object field."""
 
@@ -35,41 +56,123 @@ class GraphQL2PythonModelOptions(BaseModel):
     each_field_optional: bool = Field(default=False, description="Each fields of interfaces and objects are optional.")
     add_from_dict: bool = Field(default=False, description="add from_dict method to the general class.")
     add_to_dict: bool = Field(default=False, description="add to_dict method to the general class.")
+    add_from_trusted_dict: bool = Field(
+        default=False, description="add from_trusted_dict method (parsing without validation) to the general class."
+    )
+    add_json_methods: bool = Field(
+        default=False,
+        description="add from_json and to_json methods (with orjson if it is installed) to the general class.",
+    )
+    backend: Literal["pydantic", "pydantic_v2", "dataclass_slots", "msgspec"] = Field(
+        default="pydantic",
+        description="A kind of data-model classes: pydantic v1 or v2 models, dataclasses or msgspec structs.",
+    )
+    renderer: Literal["python", "jinja2"] = Field(
+        default="python",
+        description="Render pydantic classes by python code or by jinja2 templates (the output is the same).",
+    )
+    discriminated_unions: bool = Field(
+        default=False,
+        description="Render unions and interface-typed fields as unions with the __typename discriminator.",
+    )
+    ordered_classes: bool = Field(
+        default=False,
+        description="Render types after types they reference, so only references in cycles need update_forward_refs.",
+    )
+    workers: int = Field(default=1, ge=1, description="A number of processes for render of interfaces and objects.")
+    roots: List[str] = Field(
+        default_factory=list, description="Render only types which are reachable from these types."
+    )
+    operations: List[Path] = Field(
+        default_factory=list,
+        description="Render only types which are reachable from types selected in these operation files.",
+    )
+
+    @validator("operations", pre=True)
+    def validation_operations_patterns(cls, operation_paths: Any):
+        if not isinstance(operation_paths, (list, tuple)):
+            operation_paths = [operation_paths]
+
+        return _expand_patterns(operation_paths)
+
+    @validator("operations", each_item=True)
+    def validation_operation_file(cls, operation_path: Path):
+        if not operation_path.is_absolute():
+            operation_path = (cwd_path / operation_path).resolve()
+
+        if not operation_path.is_file():
+            raise ValueError(f"The operation file {operation_path} is not exist.")
+
+        return operation_path
 
 
 class GraphQL2PythonModelConfig(BaseModel):
     """GraphQL2Python config for pydantic data-model generation."""
 
-    graphql_schema: Path = Field(description="A path to the target GraphQL schema file.", alias="schema")
-    output: Path = Field(description="A path to an output python file.")
+    graphql_schema: Union[List[Path], Path] = Field(
+        description=(
+            "A path to the target GraphQL schema file (SDL or an introspection result in JSON), "
+            "a glob pattern or a list of SDL files."
+        ),
+        alias="schema",
+    )
+    output: Path = Field(
+        description="A path to an output python file or to a folder (without suffix) for an output package."
+    )
     license_file: Optional[Path] = Field(default=None, description="A path to a license file header for output.")
     options: GraphQL2PythonModelOptions = Field(
         description="Data-model render options.", default=GraphQL2PythonModelOptions()
     )
+    cache_dir: Optional[Path] = Field(
+        default=None, description="A path to a folder for the render cache. The cache is disabled by default."
+    )
+
+    @validator("graphql_schema", pre=True)
+    def validation_graphql_schema_patterns(cls, schema_paths: Any):
+        if not isinstance(schema_paths, (list, tuple)):
+            schema_paths = [schema_paths]
+
+        result = _expand_patterns(schema_paths)
+
+        return result[0] if len(result) == 1 else result
 
     @validator("graphql_schema")
-    def validation_graphql_schema_file(cls, schema_path: Path):
-        if not schema_path.is_absolute():
-            schema_path = (cwd_path / schema_path).resolve()
+    def validation_graphql_schema_file(cls, schema_paths: Union[List[Path], Path]):
+        result: List[Path] = []
+
+        for schema_path in schema_paths if isinstance(schema_paths, list) else [schema_paths]:
+            if not schema_path.is_absolute():
+                schema_path = (cwd_path / schema_path).resolve()
+
+            if not schema_path.exists():
+                raise ValueError(f"The file {schema_path} is not exist.")
+
+            if not schema_path.is_file():
+                raise ValueError("The input schema is not file.")
+
+            if schema_path.suffix not in (".graphql", ".json"):
+                raise ValueError("The input file must have the suffix is .graphql or .json")
 
-        if not schema_path.exists():
-            raise ValueError(f"The file {schema_path} is not exist.")
+            result.append(schema_path)
 
-        if not schema_path.is_file():
-            raise ValueError("The input schema is not file.")
+        if len(result) == 0:
+            raise ValueError("No schema file is given.")
 
-        if schema_path.suffix != ".graphql":
-            raise ValueError("The input file must have the suffix is .graphql")
+        if len(result) > 1 and any(schema_path.suffix == ".json" for schema_path in result):
+            raise ValueError("An introspection result in JSON cannot be merged with other schema files.")
 
-        return schema_path
+        return result[0] if len(result) == 1 else result
 
     @validator("output")
     def validation_output_py_file(cls, output_path: Path):
         if not output_path.is_absolute():
             output_path = (cwd_path / output_path).resolve()
 
-        if output_path.suffix != ".py":
-            raise ValueError("The output file must have the suffix is .py")
+        if output_path.suffix not in (".py", ""):
+            raise ValueError("The output file must have the suffix is .py (or no suffix for a package)")
+
+        if output_path.suffix == "" and output_path.exists() and not output_path.is_dir():
+            raise ValueError("The output package is not folder.")
 
         return output_path
 
@@ -85,3 +188,32 @@ class GraphQL2PythonModelConfig(BaseModel):
             raise ValueError("The license_file is not file.")
 
         return license_path
+
+    @validator("cache_dir")
+    def validation_cache_dir(cls, cache_path: Path):
+        if not cache_path.is_absolute():
+            cache_path = (cwd_path / cache_path).resolve()
+
+        if cache_path.exists() and not cache_path.is_dir():
+            raise ValueError("The cache_dir is not folder.")
+
+        return cache_path
+
+    @root_validator(skip_on_failure=True)
+    def validation_output_package(cls, values):
+        if values["output"].suffix == "" and values["options"].backend not in ("pydantic", "pydantic_v2"):
+            raise ValueError("The output package is supported for pydantic backends only.")
+
+        return values
+
+    @property
+    def schema_paths(self) -> List[Path]:
+        """Paths to all schema files."""
+
+        return self.graphql_schema if isinstance(self.graphql_schema, list) else [self.graphql_schema]
+
+    @property
+    def output_is_package(self) -> bool:
+        """The output is a package with a module for each group of types."""
+
+        return self.output.suffix == ""
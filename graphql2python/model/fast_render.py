@@ -0,0 +1,90 @@
+"""A render of the pydantic data-model without templates."""
+
+from typing import List, Optional, Tuple
+
+from graphql2python.model.render import DataModelRender
+
+__all__ = [
+    "FastDataModelRender",
+]
+
+
+class FastDataModelRender(DataModelRender):
+    """Render GraphQL types with the same output as `DataModelRender` without jinja2 templates.
+
+    Each emitter joins string parts of a type at once instead of
+    a call of a template (see templates for the output format).
+
+    """
+
+    def _emit_comment(self, indent: str, lines: List[str]) -> str:
+        return "\n".join([f"{indent}# {line}" for line in lines])
+
+    def _emit_docstring(self, indent: str, lines: List[str]) -> str:
+        parts = [indent, '"""\n']
+
+        for line in lines:
+            parts += [indent, line, "\n"]
+
+        parts += [indent, '"""']
+
+        return "".join(parts)
+
+    def _emit_scalar(self, description: str, name: str, pytype: str) -> str:
+        return f"{description}\n{name} = {pytype}"
+
+    def _emit_enum(
+        self, docstring: str, name: str, values: List[Tuple[str, str, Optional[str], Optional[str]]]
+    ) -> str:
+        parts = ["class ", name, "(enum.Enum):\n", docstring]
+
+        for v_name, v, desc, dpr in values:  # pylint: disable=invalid-name
+            if desc is not None:
+                parts += ["\n    ", desc]
+
+            parts += ["\n    ", v_name, " = ", v]
+
+            if dpr is not None:
+                parts += ["  # deprecation_reason: ", dpr]
+
+        return "".join(parts)
+
+    def _emit_union(self, description: str, name: str, types: List[str]) -> str:
+        parts = [description, "\n", name]
+
+        if len(types) > 1 and self.discriminated_unions:
+            parts.append(" = _t.Annotated[\n    _t.Union[")
+            parts += [f"\n        {type_}," for type_ in types]
+            parts.append("\n    ],\n    Field(discriminator='typename__'),\n]")
+
+        elif len(types) > 1:
+            parts.append(" = _t.Union[")
+            parts += [f"\n    {type_}," for type_ in types]
+            parts.append("\n]")
+
+        else:
+            parts.append(f" = _t.TypeVar('{name}', bound={types[0]})")
+
+        return "".join(parts)
+
+    def _emit_class(self, docstring: str, name: str, interfaces: List[str], fields: List[str]) -> str:
+        parts = ["class ", name]
+
+        if len(interfaces) > 0:
+            parts.append("(")
+            parts += [f"\n    {interface}," for interface in interfaces]
+            parts.append("\n)")
+        else:
+            parts.append("(GraphQLBaseModel)")
+
+        parts += [":\n", docstring]
+
+        for field in fields:
+            parts += ["\n", field]
+
+        parts.append(f'\n    typename__: _t.Literal["{name}"] = Field(default="{name}", alias="__typename")')
+
+        return "".join(parts)
+
+    _emit_interface = _emit_class
+    _emit_object = _emit_class
@@ -1,15 +1,49 @@
+import hashlib
+import json
+import math
+import typing
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
 from enum import Enum
-from typing import Dict, List, Set
-
-from graphql import GraphQLNamedType, GraphQLSchema, build_schema, lexicographic_sort_schema
+from itertools import chain, islice, repeat
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+from graphql import (
+    DocumentNode,
+    GraphQLEnumType,
+    GraphQLInterfaceType,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    GraphQLScalarType,
+    GraphQLSchema,
+    GraphQLUnionType,
+    build_ast_schema,
+    build_client_schema,
+    concat_ast,
+    get_named_type,
+    lexicographic_sort_schema,
+    parse,
+    print_type
+)
 from graphql.type.introspection import TypeKind, TypeResolvers
 
+from graphql2python.imports import Import, pytype_import
+from graphql2python.model.backends import FAST_RENDERS, RENDERS
+from graphql2python.model.cache import RenderCache, SchemaCache
 from graphql2python.model.config import GraphQL2PythonModelConfig
+from graphql2python.model.reachable import load_operations, operation_types, reachable_types
 from graphql2python.model.render import DataModelRender
+from graphql2python.utils.files import same_content, write_chunks
 from graphql2python.utils.graphlib import TopologicalSorter
+from graphql2python.utils.profile import Profiler, profile_iter, profile_stage
+from graphql2python.utils.scc import strongly_connected_components
 
 __all__ = [
     "Generator",
+    "PackageLayout",
+    "load_schema",
 ]
 
 
@@ -36,6 +70,102 @@ TYPES_MAPPER: Dict[TypeKind, SupportTypes] = {
 }
 
 
+def _load_json(path: Path) -> Any:
+    """Load a JSON file with orjson if it is installed."""
+
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        with path.open("r", encoding="utf8") as json_file:
+            return json.load(json_file)
+
+    return orjson.loads(path.read_bytes())  # pylint: disable=no-member
+
+
+def _load_introspection(path: Path) -> GraphQLSchema:
+    """Build a schema from an introspection result (with or without the `data` key)."""
+
+    introspection = _load_json(path)
+
+    if isinstance(introspection, dict) and "data" in introspection:
+        introspection = introspection["data"]
+
+    return build_client_schema(introspection)
+
+
+def _parse_sdl(path: Path, cache_dir: Optional[Path]) -> DocumentNode:
+    """Parse an SDL file, the parsed document is taken from the schema cache if `cache_dir` is given."""
+
+    with path.open("r", encoding="utf8") as schema_file:
+        schema_str = schema_file.read()
+
+    if cache_dir is not None:
+        return SchemaCache(cache_dir).parse(schema_str)
+
+    return parse(schema_str, no_location=True)
+
+
+def _parse_schema(config: GraphQL2PythonModelConfig, profiler: Optional[Profiler] = None) -> Optional[DocumentNode]:
+    """Parse SDL files of a config in one document or return None for an introspection result.
+
+    Several SDL files are parsed in `options.workers` processes.
+
+    Args:
+        config: config for generate.
+        profiler: a profiler for stages of the loading.
+
+    """
+
+    paths = config.schema_paths
+
+    if paths[0].suffix == ".json":
+        return None
+
+    with profile_stage(profiler, "parse"):
+        if config.options.workers > 1 and len(paths) > 1:
+            with ProcessPoolExecutor(max_workers=min(config.options.workers, len(paths))) as executor:
+                documents = list(executor.map(_parse_sdl, paths, repeat(config.cache_dir)))
+        else:
+            documents = [_parse_sdl(path, config.cache_dir) for path in paths]
+
+        # only this process removes old schemas, workers above can write to the cache at once
+        if config.cache_dir is not None:
+            SchemaCache(config.cache_dir).evict()
+
+    return concat_ast(documents)
+
+
+def load_schema(
+    config: GraphQL2PythonModelConfig,
+    profiler: Optional[Profiler] = None,
+    document: Optional[DocumentNode] = None,
+) -> GraphQLSchema:
+    """Load and sort the GraphQL schema from a config.
+
+    Several SDL files are merged in one schema, they are parsed in
+    `options.workers` processes.
+
+    Args:
+        config: config for generate.
+        profiler: a profiler for stages of the loading.
+        document: SDL files of the config if they are already parsed.
+
+    """
+
+    if document is None:
+        document = _parse_schema(config, profiler)
+
+    if document is None:
+        with profile_stage(profiler, "build_schema"):
+            schema = _load_introspection(config.schema_paths[0])
+    else:
+        with profile_stage(profiler, "build_schema"):
+            schema = build_ast_schema(document)
+
+    with profile_stage(profiler, "sort_schema"):
+        return lexicographic_sort_schema(schema)
+
+
 class GraphQLSchemaTypeMap:
     # pylint: disable=too-few-public-methods
 
@@ -45,7 +175,24 @@ class GraphQLSchemaTypeMap:
     # object name --> GraphQL object
     types: Dict[str, GraphQLNamedType]
 
-    def build(self, schema: GraphQLSchema):
+    # union or interface name --> names of its possible object types
+    possible_types: Dict[str, List[str]]
+
+    # interface name --> names of its fields and fields of its interfaces
+    interface_fields: Dict[str, FrozenSet[str]]
+
+    # a number of types which are not reachable from roots
+    pruned: int
+
+    def build(self, schema: GraphQLSchema, roots: Optional[Iterable[str]] = None):
+        """Collect types of a schema.
+
+        Args:
+            schema: a GraphQL schema.
+            roots: only types which are reachable from these types are collected (see `reachable_types`).
+
+        """
+
         self.type_map: Dict[SupportTypes, List[str]] = {
             SupportTypes.GraphQLUnionType: [],
             SupportTypes.GraphQLScalarType: [],
@@ -55,6 +202,9 @@ class GraphQLSchemaTypeMap:
             SupportTypes.GraphQLInputObjectType: [],
         }
         self.types: Dict[str, GraphQLNamedType] = {}
+        self.pruned = 0
+
+        reachable = None if roots is None else reachable_types(schema, roots)
 
         for object_name, type_ in schema.type_map.items():
             if object_name.startswith("__"):
@@ -63,6 +213,10 @@ class GraphQLSchemaTypeMap:
             if object_name in ["Query", "Mutation"]:
                 continue
 
+            if reachable is not None and object_name not in reachable:
+                self.pruned += 1
+                continue
+
             resolved_type = resolver.kind(type_, None)
 
             self.type_map[TYPES_MAPPER[resolved_type]].append(object_name)
@@ -76,12 +230,250 @@ class GraphQLSchemaTypeMap:
         t_sort = TopologicalSorter(graph)
         self.type_map[SupportTypes.GraphQLInterfaceType] = list(t_sort.static_order())
 
+        self.interface_fields: Dict[str, FrozenSet[str]] = {}
+
+        # interfaces of an interface go before it
+        for object_name in self.type_map[SupportTypes.GraphQLInterfaceType]:
+            interface = self.types[object_name]
+            fields = set(interface.fields)  # type: ignore
+
+            for parent in interface.interfaces:  # type: ignore
+                fields.update(self.interface_fields.get(parent.name, parent.fields))
+
+            self.interface_fields[object_name] = frozenset(fields)
+
+        self.possible_types: Dict[str, List[str]] = {}
+
+        abstract_types = self.type_map[SupportTypes.GraphQLUnionType] + self.type_map[SupportTypes.GraphQLInterfaceType]
+
+        for object_name in abstract_types:
+            self.possible_types[object_name] = sorted(
+                type_.name
+                for type_ in schema.get_possible_types(self.types[object_name])  # type: ignore
+                if type_.name in self.types
+            )
+
+
+class PackageLayout:
+    """Modules of an output package.
+
+    Types which reference each other (a strongly connected component of the
+    type reference graph) are in one module. A module imports the modules of
+    types referenced by its types, so importing a type loads only the types
+    it needs. Scalars and the general class are in the `_base` module.
+
+    Module names are unique ignoring case (for case-insensitive file
+    systems) and differ from names of types, which are attributes of the
+    package as modules are, so a name is suffixed with a number if it is taken.
+
+    With `ordered` a union also references its members. Then components
+    are in the order of a single output module with `options.ordered_classes`:
+    types of a component go after types they reference, so only references
+    inside a component are forward references.
+
+    Args:
+        type_map: types of the schema.
+        expand_interfaces: interface-typed fields are rendered as unions of possible types.
+        ordered: unions reference their members (see `options.ordered_classes`).
+
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    # a name of the module with the general class and scalars (see `base_module`)
+    BASE_MODULE = "_base"
+
+    # types of modules in the render order
+    MODULE_TYPES = (
+        SupportTypes.GraphQLEnumType,
+        SupportTypes.GraphQLUnionType,
+        SupportTypes.GraphQLInterfaceType,
+        SupportTypes.GraphQLObjectType,
+    )
+
+    def __init__(self, type_map: GraphQLSchemaTypeMap, expand_interfaces: bool = False, ordered: bool = False):
+        self.type_map = type_map
+
+        names = [name for type_kind in self.MODULE_TYPES for name in type_map.type_map[type_kind]]
+        order = {name: i for i, name in enumerate(names)}
+
+        # type name --> names of types which are used in its fields or which it inherits
+        self.references: Dict[str, Set[str]] = {name: set() for name in names}
+
+        for type_kind in (SupportTypes.GraphQLInterfaceType, SupportTypes.GraphQLObjectType):
+            for name in type_map.type_map[type_kind]:
+                self.references[name] = self._type_references(name, expand_interfaces)
+
+        if ordered:
+            for name in type_map.type_map[SupportTypes.GraphQLUnionType]:
+                self.references[name] = set(type_map.possible_types[name])
+
+        scalars = set(type_map.type_map[SupportTypes.GraphQLScalarType])
+        graph = {name: sorted(self.references[name] - scalars, key=order.__getitem__) for name in names}
+
+        # module name --> type names in the render order; dependencies of a module go before it
+        self.modules: Dict[str, List[str]] = {}
+        # type name --> module name
+        self.type_modules: Dict[str, str] = {}
+
+        # names of types which are in cycles of references
+        self.cyclic: Set[str] = set()
+
+        # lowercase names of modules and types
+        taken = {name.lower() for name in type_map.types}
+
+        # the module with the general class and scalars
+        self.base_module = self._unique_module(self.BASE_MODULE, taken)
+
+        for component in strongly_connected_components(graph):
+            component.sort(key=order.__getitem__)
+
+            module = self._unique_module("_" + component[0], taken)
+            self.modules[module] = component
+            self.type_modules.update((name, module) for name in component)
+
+            if len(component) > 1 or component[0] in self.references[component[0]]:
+                self.cyclic.update(component)
+
+    @staticmethod
+    def _unique_module(name: str, taken: Set[str]) -> str:
+        """A module name which is not taken ignoring case, it is taken then.
+
+        Args:
+            name: a preferred module name.
+            taken: lowercase names of modules and types.
+
+        """
+
+        module = name
+        suffix = 2
+
+        while module.lower() in taken:
+            module = f"{name}_{suffix}"
+            suffix += 1
+
+        taken.add(module.lower())
+
+        return module
+
+    def forward_ref_classes(self) -> Set[str]:
+        """Names of interfaces and objects which need `update_forward_refs` with `ordered` references.
+
+        A class needs it if it is in a cycle (its fields have forward
+        references), it inherits such a class or it uses a union
+        with forward references to its members.
+
+        """
+
+        result: Set[str] = set()
+
+        for names in self.modules.values():
+            for name in names:
+                type_ = self.type_map.types[name]
+
+                if not isinstance(type_, (GraphQLInterfaceType, GraphQLObjectType)):
+                    continue
+
+                if (
+                    name in self.cyclic
+                    or any(interface.name in result for interface in type_.interfaces)
+                    or any(
+                        reference in self.cyclic and isinstance(self.type_map.types[reference], GraphQLUnionType)
+                        for reference in self.references[name]
+                    )
+                ):
+                    result.add(name)
+
+        return result
+
+    def _type_references(self, name: str, expand_interfaces: bool) -> Set[str]:
+        type_ = self.type_map.types[name]
+        result = {interface.name for interface in type_.interfaces}  # type: ignore
+
+        for field in type_.fields.values():  # type: ignore
+            field_type_name = get_named_type(field.type).name
+
+            if field_type_name not in self.type_map.types:
+                continue
+
+            result.add(field_type_name)
+
+            # members of unions are resolved in the namespace of the field module
+            if field_type_name in self.type_map.type_map[SupportTypes.GraphQLUnionType] or (
+                expand_interfaces and field_type_name in self.type_map.possible_types
+            ):
+                result.update(self.type_map.possible_types[field_type_name])
+
+        return result
+
+    def imports(self, module: str) -> Dict[str, List[str]]:
+        """Imported names of a module by modules.
+
+        Args:
+            module: a module name.
+
+        """
+
+        names = self.modules[module]
+        referenced: Set[str] = set().union(*(self.references[name] for name in names)) - set(names)
+
+        result: Dict[str, List[str]] = {}
+
+        base_names = [name for name in self.type_map.type_map[SupportTypes.GraphQLScalarType] if name in referenced]
+
+        # classes of interfaces and objects inherit the general class
+        if any(isinstance(self.type_map.types[name], (GraphQLInterfaceType, GraphQLObjectType)) for name in names):
+            base_names.insert(0, "GraphQLBaseModel")
+
+        if base_names:
+            result[self.base_module] = base_names
+
+        for other_module, other_names in self.modules.items():
+            imported = [name for name in other_names if name in referenced]
+            if imported:
+                result[other_module] = imported
+
+        return result
+
+
+# the generator of the current worker process (see Generator.worker_pool)
+_worker_generator: Optional["Generator"] = None
+
+
+def _init_worker(config: GraphQL2PythonModelConfig, document: Optional[DocumentNode]):
+    """Prepare a worker process for render of types.
+
+    Args:
+        config: config for generate with one worker, so a worker does not start processes.
+        document: the parsed schema of the parent process (None for an introspection result).
+
+    """
+
+    global _worker_generator  # pylint: disable=global-statement
+
+    # a forked worker inherits the generator of the parent process, a spawned one builds the schema of the document
+    if _worker_generator is None:
+        _worker_generator = Generator(config, schema=load_schema(config, document=document))
+
+
+def _render_in_worker(type_kind: Optional[SupportTypes], names: List[str]) -> List[str]:
+    """Render a chunk of types (of any kinds if `type_kind` is None) in a worker process."""
+
+    assert _worker_generator is not None
+    # pylint: disable=protected-access
+    render_type = _worker_generator._render_type if type_kind is None else _worker_generator._type_renders()[type_kind]
+
+    return [render_type(name) for name in names]
+
 
 class Generator:
     """Generate GraphQL datamodel with pydantic from some GraphQL schema.
 
     Args:
         config: config for generate.
+        render_cache: the render cache from a previous generator (see `config.cache_dir` by default).
+        schema: the sorted schema from `config` if it is already loaded (see `load_schema`).
+        profiler: a profiler for stages of the generation (see `Profiler`).
 
     """
 
@@ -94,24 +486,103 @@ class Generator:
 
     DEFAULT_PYTYPE_FOR_SCALAR: str = "str"
 
-    def __init__(self, config: GraphQL2PythonModelConfig):
+    # the docstring of each output module
+    MODULE_DOCSTRING: str = '"""Auto-generated by graphql2python."""'
+
+    # a number of chunks per worker process for parallel render
+    CHUNKS_PER_WORKER: int = 4
+    # the maximum of types in a chunk, so memory of rendered chunks does not grow with the schema
+    MAX_CHUNK_SIZE: int = 64
+    # a number of chunks per worker process which are submitted before their results are taken
+    PENDING_CHUNKS_PER_WORKER: int = 2
+    # types which are rendered in worker processes
+    PARALLEL_TYPES = (SupportTypes.GraphQLInterfaceType, SupportTypes.GraphQLObjectType)
+    # kinds of rendered types in the order of the output module
+    RENDER_ORDER = (
+        SupportTypes.GraphQLScalarType,
+        SupportTypes.GraphQLEnumType,
+        SupportTypes.GraphQLUnionType,
+        SupportTypes.GraphQLInterfaceType,
+        SupportTypes.GraphQLObjectType,
+    )
+
+    def __init__(
+        self,
+        config: GraphQL2PythonModelConfig,
+        render_cache: Optional[RenderCache] = None,
+        schema: Optional[GraphQLSchema] = None,
+        profiler: Optional[Profiler] = None,
+    ):
         self.config = config
+        self.profiler = profiler
+
+        # the parsed schema for spawned worker processes, which do not parse schema files again
+        self._document: Optional[DocumentNode] = None
+
+        if schema is None:
+            document = _parse_schema(config, profiler)
+            schema = load_schema(config, profiler, document)
+
+            if config.options.workers > 1:
+                self._document = document
+
+        self.schema = schema
 
-        with config.graphql_schema.open("r", encoding="utf8") as schema_file:
-            schema_str = schema_file.read()
+        with profile_stage(profiler, "type_map"):
+            self.type_map = GraphQLSchemaTypeMap()
+            self.type_map.build(self.schema, self._roots())
 
-        self.schema = build_schema(schema_str)
-        self.schema = lexicographic_sort_schema(self.schema)
+        render_class = RENDERS[config.options.backend]
 
-        self.type_map = GraphQLSchemaTypeMap()
-        self.type_map.build(self.schema)
+        # other backends have their own templates
+        if config.options.renderer == "python":
+            render_class = FAST_RENDERS.get(render_class, render_class)
 
-        self.render = DataModelRender(
+        self.render = render_class(
             max_line_len=config.options.max_line_len,
             name_suffix=config.options.name_suffix,
             each_field_optional=config.options.each_field_optional,
+            discriminated_unions=config.options.discriminated_unions,
+            possible_types=self.type_map.possible_types,
+            interface_fields=self.type_map.interface_fields,
         )
 
+        # types in the order of their references (see options.ordered_classes)
+        self.layout: Optional[PackageLayout] = None
+        # interfaces and objects which need update_forward_refs in the ordered output
+        self._forward_ref_classes: Set[str] = set()
+
+        if config.options.ordered_classes:
+            with profile_stage(profiler, "order"):
+                self.layout = PackageLayout(self.type_map, self.render.expand_interfaces, ordered=True)
+                self._forward_ref_classes = self.layout.forward_ref_classes()
+
+            self.render.components = self.layout.type_modules
+
+        self._executor: Optional[Executor] = None
+
+        self.render_cache = render_cache
+        if self.render_cache is None and config.cache_dir is not None:
+            self.render_cache = RenderCache.for_output(config.cache_dir, config.output)
+
+        # a hash of render options for fingerprints, a render cache can be set after the generator is created
+        self._options_hash: Optional[str] = None
+
+    def _roots(self) -> Optional[Set[str]]:
+        """Types for tree shaking from `options.roots` and `options.operations` or None to render all types."""
+
+        options = self.config.options
+
+        if not options.roots and not options.operations:
+            return None
+
+        roots = set(options.roots)
+
+        if options.operations:
+            roots.update(operation_types(self.schema, load_operations(self.schema, options.operations)))
+
+        return roots
+
     def _render_license(self) -> str:
         result = ""
 
@@ -153,123 +624,602 @@ class Generator:
 
         return result + "]"
 
-    def _scalars_str(self) -> str:
-        """Render all scalars."""
+    @staticmethod
+    def _separated(blocks: Iterable[str], keep_separator: bool = False) -> Iterator[str]:
+        """Prefix each rendered block with blank lines between top-level definitions.
 
-        scalar_strings: List[str] = []
+        Args:
+            blocks: rendered blocks.
+            keep_separator: yield the separator even if there are no blocks.
 
-        for scalar_name in self.type_map.type_map[SupportTypes.GraphQLScalarType]:
-            obj = self.type_map.types[scalar_name]
+        """
 
-            pytype = self.config.options.scalar_pytypes.get(obj.name, self.DEFAULT_PYTYPE_FOR_SCALAR)  # type: ignore
+        is_empty = True
 
-            scalar_strings.append(self.render.render_scalar(obj, pytype))  # type: ignore
+        for block in blocks:
+            is_empty = False
+            yield "\n\n\n" + block
 
-        return "\n\n\n" + "\n\n\n".join(scalar_strings)
+        if is_empty and keep_separator:
+            yield "\n\n\n"
 
-    def _enums_str(self) -> str:
-        """Render all enums."""
+    def scalar_pytype(self, name: str) -> Tuple[str, Optional[Import]]:
+        """A python type of a scalar in the output module and its import (see `options.scalar_pytypes`).
 
-        enum_strings: List[str] = []
+        A dotted path (as `decimal.Decimal`) is imported from its module, with
+        an alias if its name is the name of another GraphQL type.
 
-        for enum_name in self.type_map.type_map[SupportTypes.GraphQLEnumType]:
-            obj = self.type_map.types[enum_name]
+        Args:
+            name: a scalar name.
 
-            enum_strings.append(self.render.render_enum(obj))  # type: ignore
+        """
 
-        if len(enum_strings) == 0:
-            return ""
+        pytype = self.config.options.scalar_pytypes.get(
+            name, self.render.BUILTIN_SCALAR_PYTYPES.get(name, self.DEFAULT_PYTYPE_FOR_SCALAR)
+        )
+        pytype_import_ = pytype_import(pytype)
 
-        return "\n\n\n" + "\n\n\n".join(enum_strings)
+        # a module import (as typing for _t.Any) keeps the python type as it is
+        if pytype_import_ is None or pytype_import_.from_ is None:
+            return pytype, pytype_import_
 
-    def _unions_str(self) -> str:
-        """Render all unions."""
+        local_name = pytype_import_.import_
 
-        union_strings: List[str] = []
+        if "." in pytype and local_name != name and local_name in self.schema.type_map:
+            local_name = f"_{local_name}"
+            pytype_import_ = Import(from_=pytype_import_.from_, import_=pytype_import_.import_, alias=local_name)
 
-        for union_name in self.type_map.type_map[SupportTypes.GraphQLUnionType]:
-            obj = self.type_map.types[union_name]
+        return local_name, pytype_import_
 
-            union_strings.append(self.render.render_union(obj))  # type: ignore
+    def _imports(self, names: Iterable[str], general_class: bool = False) -> str:
+        """Render imports which are used by types (and by the general class).
 
-        if len(union_strings) == 0:
-            return ""
+        Args:
+            names: names of rendered types of the module.
+            general_class: the general class is rendered in the module.
 
-        return "\n\n\n" + "\n\n\n".join(union_strings)
+        """
 
-    def _interfaces_str(self) -> str:
-        """Render all unions."""
+        render = self.render
+        imports: List[Import] = []
 
-        interface_strings: List[str] = []
+        if general_class:
+            imports += render.general_class_imports(
+                add_from_dict=self.config.options.add_from_dict,
+                add_to_dict=self.config.options.add_to_dict,
+                add_from_trusted_dict=self.config.options.add_from_trusted_dict,
+                add_json_methods=self.config.options.add_json_methods,
+            )
 
-        for int_name in self.type_map.type_map[SupportTypes.GraphQLInterfaceType]:
-            obj = self.type_map.types[int_name]
+        for name in names:
+            type_ = self.type_map.types[name]
 
-            field_aliases = self.config.options.fields_setting.get(int_name, {})
+            if isinstance(type_, GraphQLScalarType):
+                pytype_import_ = self.scalar_pytype(name)[1]
+                imports += [pytype_import_] if pytype_import_ is not None else []
+            elif isinstance(type_, GraphQLEnumType):
+                imports += render.ENUM_IMPORTS
+            elif isinstance(type_, GraphQLUnionType):
+                imports += render.union_imports()
+            else:
+                imports += render.CLASS_IMPORTS
 
-            interface_strings.append(self.render.render_interface(obj, field_aliases))  # type: ignore
+        return render.render_imports(imports)
 
-        if len(interface_strings) == 0:
-            return ""
+    def _render_scalar(self, name: str) -> str:
+        return self.render.render_scalar(self.type_map.types[name], self.scalar_pytype(name)[0])  # type: ignore
 
-        return "\n\n\n" + "\n\n\n".join(interface_strings)
+    def _render_enum(self, name: str) -> str:
+        return self.render.render_enum(self.type_map.types[name])  # type: ignore
 
-    def _objects_str(self) -> str:
+    def _render_union(self, name: str) -> str:
+        return self.render.render_union(self.type_map.types[name])  # type: ignore
+
+    def _render_interface(self, name: str) -> str:
+        return self.render.render_interface(
+            self.type_map.types[name],  # type: ignore
+            self.config.options.fields_setting.get(name, {}),
+        )
+
+    def _render_object(self, name: str) -> str:
+        return self.render.render_object(
+            self.type_map.types[name],  # type: ignore
+            self.config.options.fields_setting.get(name, {}),
+        )
+
+    def _render_type(self, name: str) -> str:
+        """Render a type of any kind by its name."""
+
+        return self._type_renders()[TYPES_MAPPER[resolver.kind(self.type_map.types[name], None)]](name)
+
+    def _type_renders(self) -> Dict[SupportTypes, Callable[[str], str]]:
+        """Renders of a type by its name."""
+
+        return {
+            SupportTypes.GraphQLScalarType: self._render_scalar,
+            SupportTypes.GraphQLEnumType: self._render_enum,
+            SupportTypes.GraphQLUnionType: self._render_union,
+            SupportTypes.GraphQLInterfaceType: self._render_interface,
+            SupportTypes.GraphQLObjectType: self._render_object,
+        }
+
+    def _options_fingerprint(self) -> str:
+        """A hash of render options which are common for all types."""
+
+        # renderers give the same output; roots change only possible types which are in fingerprints of types
+        exclude = {"scalar_pytypes", "fields_setting", "workers", "renderer", "roots", "operations"}
+        options = self.config.options.json(exclude=exclude, sort_keys=True)
+
+        return hashlib.sha256(options.encode("utf-8")).hexdigest()
+
+    def _fingerprint(self, name: str) -> str:
+        """A hash of a type definition and its render options.
+
+        Args:
+            name: a type name.
+
+        """
+
+        if self._options_hash is None:
+            self._options_hash = self._options_fingerprint()
+
+        type_ = self.type_map.types[name]
+        parts = [self._options_hash, print_type(type_)]
+
+        # fields from interfaces are not rendered in an implementation
+        for interface in getattr(type_, "interfaces", []):
+            parts.append(",".join(sorted(interface.fields)))
+
+        # unions and interfaces in fields can be replaced by their possible types
+        for field in getattr(type_, "fields", {}).values():
+            field_type_name = get_named_type(field.type).name
+
+            if field_type_name in self.type_map.possible_types:
+                parts.append(",".join(self.type_map.possible_types[field_type_name]))
+
+        if isinstance(type_, GraphQLScalarType):
+            parts.append(self.scalar_pytype(name)[0])
+
+        # references inside the component of the type are forward references
+        if self.layout is not None:
+            component = self.layout.type_modules.get(name)
+            parts.append(
+                ",".join(
+                    sorted(
+                        reference
+                        for reference in self.layout.references.get(name, ())
+                        if self.layout.type_modules.get(reference) == component
+                    )
+                )
+            )
+
+        if name in self.config.options.fields_setting:
+            fields_setting = {f_name: f.dict() for f_name, f in self.config.options.fields_setting[name].items()}
+            parts.append(json.dumps(fields_setting, sort_keys=True))
+
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def worker_pool(self) -> Iterator[None]:
+        """Start worker processes for render if `options.workers` is greater than 1."""
+
+        global _worker_generator  # pylint: disable=global-statement
+
+        if self.config.options.workers <= 1 or self._executor is not None:
+            yield
+            return
+
+        _worker_generator = self
+
+        try:
+            worker_options = self.config.options.copy(update={"workers": 1})
+
+            with ProcessPoolExecutor(
+                max_workers=self.config.options.workers,
+                initializer=_init_worker,
+                initargs=(self.config.copy(update={"options": worker_options}), self._document),
+            ) as executor:
+                self._executor = executor
+                yield
+
+        finally:
+            self._executor = None
+            _worker_generator = None
+
+    def _render_names(self, type_kind: Optional[SupportTypes], names: List[str]) -> Iterator[str]:
+        """Render types in their order, in worker processes if they are started.
+
+        Only `PENDING_CHUNKS_PER_WORKER` chunks per worker are submitted
+        ahead of the consumer, so rendered types do not pile up in memory.
+
+        Args:
+            type_kind: a kind of types or None for types of any kinds.
+            names: names of types.
+
+        """
+
+        if self._executor is None or (type_kind is not None and type_kind not in self.PARALLEL_TYPES):
+            return map(self._render_type if type_kind is None else self._type_renders()[type_kind], names)
+
+        workers = self.config.options.workers
+        chunk_size = min(math.ceil(len(names) / (workers * self.CHUNKS_PER_WORKER)), self.MAX_CHUNK_SIZE) or 1
+        chunks = (names[i : i + chunk_size] for i in range(0, len(names), chunk_size))
+
+        return self._render_chunks(self._executor, type_kind, chunks, workers * self.PENDING_CHUNKS_PER_WORKER)
+
+    @staticmethod
+    def _render_chunks(
+        executor: Executor, type_kind: Optional[SupportTypes], chunks: Iterable[List[str]], max_pending: int
+    ) -> Iterator[str]:
+        """Render chunks of types in worker processes with at most `max_pending` submitted chunks."""
+
+        pending: "deque[Future]" = deque()
+
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(_render_in_worker, type_kind, chunk))
+
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+
+        finally:
+            # the render is stopped early (as by check at the first difference), so chunks are not waited for
+            for future in pending:
+                future.cancel()
+
+    def _render_types(self, type_kind: Optional[SupportTypes], names: Optional[List[str]] = None) -> Iterator[str]:
+        """Render all types of some kind. Unchanged types are taken from the render cache.
+
+        Args:
+            type_kind: a kind of types or None for types of any kinds.
+            names: names of types to render, all types of the kind by default.
+
+        """
+
+        if names is None:
+            names = self.type_map.type_map[type_kind]  # type: ignore
+
+        if self.render_cache is None:
+            yield from self._render_names(type_kind, names)
+            return
+
+        fingerprints = {name: self._fingerprint(name) for name in names}
+        cached = {name for name in names if self.render_cache.contains(name, fingerprints[name])}
+
+        rendered = self._render_names(type_kind, [name for name in names if name not in cached])
+
+        for name in names:
+            text = self.render_cache.get(name, fingerprints[name])
+
+            if text is None:
+                text = next(rendered)
+                self.render_cache.set(name, fingerprints[name], text)
+
+            yield text
+
+    def _scalars_chunks(self) -> Iterator[str]:
+        """Render all scalars."""
+
+        return self._separated(self._render_types(SupportTypes.GraphQLScalarType), keep_separator=True)
+
+    def _enums_chunks(self) -> Iterator[str]:
+        """Render all enums."""
+
+        return self._separated(self._render_types(SupportTypes.GraphQLEnumType))
+
+    def _unions_chunks(self) -> Iterator[str]:
+        """Render all unions."""
+
+        return self._separated(self._render_types(SupportTypes.GraphQLUnionType))
+
+    def _interfaces_chunks(self) -> Iterator[str]:
+        """Render all interfaces."""
+
+        return self._separated(self._render_types(SupportTypes.GraphQLInterfaceType))
+
+    def _objects_chunks(self) -> Iterator[str]:
         """Render all objects."""
 
-        object_strings: List[str] = []
+        return self._separated(self._render_types(SupportTypes.GraphQLObjectType), keep_separator=True)
 
-        for obj_name in self.type_map.type_map[SupportTypes.GraphQLObjectType]:
-            obj = self.type_map.types[obj_name]
+    def _ordered_names(self) -> List[str]:
+        """Unions, interfaces and objects in the order of their references (see `PackageLayout`)."""
 
-            field_aliases = self.config.options.fields_setting.get(obj_name, {})
+        assert self.layout is not None
 
-            object_strings.append(self.render.render_object(obj, field_aliases))  # type: ignore
+        return [
+            name
+            for names in self.layout.modules.values()
+            for name in names
+            if not isinstance(self.type_map.types[name], GraphQLEnumType)
+        ]
 
-        return "\n\n\n" + "\n\n\n".join(object_strings)
+    def _ordered_chunks(self) -> Iterator[str]:
+        """Render unions, interfaces and objects in the order of their references."""
 
-    def _update_forward_refs(self) -> str:
-        """Render of update_forward_refs for each interface and for each object."""
+        return self._separated(self._render_types(None, self._ordered_names()))
 
-        result = ""
+    def _footer_str(self, names: Optional[List[str]] = None) -> str:
+        """Render the end of the output module (update_forward_refs for each interface and for each object).
 
-        for type_name in [
-            SupportTypes.GraphQLInterfaceType,
-            SupportTypes.GraphQLObjectType,
-        ]:
-            for o_name in self.type_map.type_map[type_name]:
-                result += f"{o_name}.update_forward_refs()\n"
+        With `options.ordered_classes` only classes with forward references are updated.
+
+        Args:
+            names: names of interfaces and objects of the module, all of them by default.
+
+        """
+
+        if names is None and self.layout is not None:
+            names = self._ordered_names()
+        elif names is None:
+            names = (
+                self.type_map.type_map[SupportTypes.GraphQLInterfaceType]
+                + self.type_map.type_map[SupportTypes.GraphQLObjectType]
+            )
+
+        if self.layout is not None:
+            names = [name for name in names if name in self._forward_ref_classes]
+
+        result = self.render.render_footer(names)
 
         if result == "":
             return result
 
         return "\n\n\n" + result
 
-    def generate(self):
-        result_str = self._render_license()
-        result_str += '"""Auto-generated by graphql2python."""\n\n# pylint: disable-all\n# mypy: ignore-errors\n\n'
+    def _intro_str(self) -> str:
+        """Render the beginning of each output module: license and docstring."""
 
-        # TODO: add only used imports
-        # TODO: add custom imports
-        result_str += """import enum
-import typing as _t
-from datetime import date, datetime
+        return self._render_license() + self.MODULE_DOCSTRING + "\n\n# pylint: disable-all\n# mypy: ignore-errors\n\n"
 
-from pydantic import BaseModel, Field"""
+    def _header_str(self) -> str:
+        """Render the module header: license, docstring, imports and `__all__`."""
+
+        result_str = self._intro_str()
+
+        # TODO: add custom imports
+        result_str += self._imports(
+            chain.from_iterable(self.type_map.type_map[type_kind] for type_kind in self.RENDER_ORDER),
+            general_class=True,
+        )
 
         result_str += "\n\n" + self._render_all_header()
 
         result_str += "\n\n\n" + self.render.render_general_class(
             add_from_dict=self.config.options.add_from_dict,
             add_to_dict=self.config.options.add_to_dict,
+            add_from_trusted_dict=self.config.options.add_from_trusted_dict,
+            add_json_methods=self.config.options.add_json_methods,
+        )
+
+        return result_str
+
+    def iter_chunks(self) -> typing.Generator[str, None, None]:
+        """Render the output module chunk by chunk.
+
+        Each chunk is at most one rendered class, so the whole module
+        is never kept in memory.
+
+        """
+
+        with self.worker_pool():
+            with profile_stage(self.profiler, "header"):
+                header = self._header_str()
+
+            yield header
+
+            yield from profile_iter(self.profiler, "scalars", self._scalars_chunks())
+            yield from profile_iter(self.profiler, "enums", self._enums_chunks())
+
+            if self.layout is None:
+                yield from profile_iter(self.profiler, "unions", self._unions_chunks())
+                yield from profile_iter(self.profiler, "interfaces", self._interfaces_chunks())
+                yield from profile_iter(self.profiler, "objects", self._objects_chunks())
+            else:
+                yield from profile_iter(self.profiler, "classes", self._ordered_chunks())
+
+            with profile_stage(self.profiler, "footer"):
+                footer = self._footer_str()
+
+            # the ordered output can have no forward references at all
+            yield footer if footer or self.layout is None else "\n"
+
+    @staticmethod
+    def _render_all(names: List[str]) -> str:
+        return "__all__ = [\n" + "".join(f'    "{name}",\n' for name in names) + "]"
+
+    def _package_base_chunks(self, texts: List[str]) -> Iterator[str]:
+        """Render the `_base` module of the output package: the general class and scalars.
+
+        Args:
+            texts: rendered scalars.
+
+        """
+
+        scalars = self.type_map.type_map[SupportTypes.GraphQLScalarType]
+
+        yield self._intro_str() + self._imports(scalars, general_class=True)
+        yield "\n\n" + self._render_all(["GraphQLBaseModel"] + scalars)
+        yield "\n\n\n" + self.render.render_general_class(
+            add_from_dict=self.config.options.add_from_dict,
+            add_to_dict=self.config.options.add_to_dict,
+            add_from_trusted_dict=self.config.options.add_from_trusted_dict,
+            add_json_methods=self.config.options.add_json_methods,
         )
+        yield from self._separated(texts)
+        yield "\n"
+
+    def _package_module_chunks(self, layout: PackageLayout, module: str, texts: List[str]) -> Iterator[str]:
+        """Render a module of the output package with types of one component.
+
+        Args:
+            layout: modules of the package.
+            module: a module name.
+            texts: rendered types of the module.
+
+        """
+
+        names = layout.modules[module]
+
+        yield self._intro_str() + self._imports(names) + "\n"
+
+        for imported_module, imported_names in layout.imports(module).items():
+            yield "\n" + self.render.render_import(f".{imported_module}", imported_names)
+
+        yield "\n\n" + self._render_all(names)
+        yield from self._separated(texts)
+
+        footer = self._footer_str(
+            [name for name in names if isinstance(self.type_map.types[name], (GraphQLInterfaceType, GraphQLObjectType))]
+        )
+        yield footer or "\n"
+
+    def _package_init_str(self, layout: PackageLayout) -> str:
+        """Render `__init__.py` of the output package."""
+
+        return (
+            self._intro_str()
+            + self.render.render_package_init(
+                all_header=self._render_all_header(),
+                base_names=["GraphQLBaseModel"] + self.type_map.type_map[SupportTypes.GraphQLScalarType],
+                modules=layout.modules,
+                base_module=layout.base_module,
+            )
+            + "\n"
+        )
+
+    def _stale_modules(self, layout: PackageLayout) -> List[Path]:
+        """Generated modules of types which are not in the output package anymore."""
+
+        result: List[Path] = []
+
+        for path in self.config.output.glob("_*.py"):
+            if path.stem == "__init__" or path.stem == layout.base_module or path.stem in layout.modules:
+                continue
+
+            with path.open("r", encoding="utf8") as module_file:
+                if self.MODULE_DOCSTRING in module_file.read():
+                    result.append(path)
+
+        return result
 
-        result_str += self._scalars_str()
-        result_str += self._enums_str()
-        result_str += self._unions_str()
-        result_str += self._interfaces_str()
-        result_str += self._objects_str()
-        result_str += self._update_forward_refs()
+    def _package_files(self, layout: PackageLayout) -> Iterator[Tuple[Path, Iterable[str]]]:
+        """Files of the output package with their chunks (see `PackageLayout`).
 
-        with self.config.output.open("w", encoding="utf-8") as output_file:
-            output_file.write(result_str)
+        Types are rendered in the order of modules, only types of the current module are kept in memory.
+
+        """
+
+        package = self.config.output
+
+        scalars = self.type_map.type_map[SupportTypes.GraphQLScalarType]
+        names = scalars + [name for module_names in layout.modules.values() for name in module_names]
+
+        with self.worker_pool():
+            texts = profile_iter(self.profiler, "render", self._render_types(None, names))
+
+            yield package / f"{layout.base_module}.py", self._package_base_chunks(list(islice(texts, len(scalars))))
+
+            for module, module_names in layout.modules.items():
+                module_texts = list(islice(texts, len(module_names)))
+                yield package / f"{module}.py", self._package_module_chunks(layout, module, module_texts)
+
+        yield package / "__init__.py", [self._package_init_str(layout)]
+
+    def _package_layout(self) -> PackageLayout:
+        """Modules of the output package."""
+
+        if self.layout is not None:
+            return self.layout
+
+        return PackageLayout(self.type_map, expand_interfaces=self.render.expand_interfaces)
+
+    def _write_package(self) -> List[Path]:
+        """Write the output package and return changed files."""
+
+        layout = self._package_layout()
+        self.config.output.mkdir(parents=True, exist_ok=True)
+
+        written = [path for path, chunks in self._package_files(layout) if write_chunks(path, chunks)]
+
+        stale = self._stale_modules(layout)
+        for path in stale:
+            path.unlink()
+
+        return written + stale
+
+    def generate(self) -> List[Path]:
+        """Write the output and return changed files.
+
+        A file with the same content is not rewritten, so its mtime is kept.
+
+        """
+
+        if self.render_cache is not None:
+            self.render_cache.load()
+
+        # the render is lazy, so the write stage is the time of the write without nested render stages
+        with profile_stage(self.profiler, "write"), self._render_profile():
+            if self.config.output_is_package:
+                changed = self._write_package()
+            else:
+                changed = [self.config.output] if write_chunks(self.config.output, self.iter_chunks()) else []
+
+        if self.render_cache is not None:
+            self.render_cache.save()
+
+        if self.profiler is not None:
+            self._count_rendered(self.profiler)
+
+        return changed
+
+    def check(self) -> List[Path]:
+        """Return output files which are not up to date, nothing is written.
+
+        Files are compared with the output as it is rendered, so the check
+        stops the render of a file at its first difference.
+
+        """
+
+        if self.render_cache is not None:
+            self.render_cache.load()
+
+        if not self.config.output_is_package:
+            chunks = self.iter_chunks()
+
+            try:
+                return [] if same_content(self.config.output, chunks) else [self.config.output]
+            finally:
+                # stop worker processes of the unfinished render
+                chunks.close()
+
+        layout = self._package_layout()
+        stale = [path for path, chunks in self._package_files(layout) if not same_content(path, chunks)]
+
+        return stale + self._stale_modules(layout)
+
+    def _render_profile(self) -> ContextManager:
+        """cProfile of the render phase if the profiler has `cprofile_path`."""
+
+        if self.profiler is None:
+            return nullcontext()
+
+        return self.profiler.render_profile()
+
+    def _count_rendered(self, profiler: Profiler) -> None:
+        """Count rendered types of each kind and fields of interfaces and objects."""
+
+        for type_kind in self.RENDER_ORDER:
+            profiler.count(type_kind.value, len(self.type_map.type_map[type_kind]))
+
+        profiler.count(
+            "fields",
+            sum(
+                len(self.type_map.types[name].fields)  # type: ignore
+                for type_kind in (SupportTypes.GraphQLInterfaceType, SupportTypes.GraphQLObjectType)
+                for name in self.type_map.type_map[type_kind]
+            ),
+        )
@@ -0,0 +1,391 @@
+"""Generation of response models for GraphQL operations."""
+
+from keyword import iskeyword
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLEnumType,
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLScalarType,
+    GraphQLUnionType,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    get_named_type,
+    is_abstract_type,
+    is_composite_type
+)
+
+from graphql2python.model.generate import Generator
+from graphql2python.model.reachable import load_operations
+from graphql2python.model.render import DataModelRender
+from graphql2python.utils.files import write_chunks
+
+__all__ = [
+    "OperationsGenerator",
+]
+
+
+# a type with a selection set
+_CompositeType = Union[GraphQLObjectType, GraphQLInterfaceType, GraphQLUnionType]
+
+# response key --> (field nodes, the field can be skipped by @include or @skip)
+_CollectedFields = Dict[str, Tuple[List[FieldNode], bool]]
+
+
+class _SelectionField(NamedTuple):
+    """A field of a selection class."""
+
+    key: str
+    field: GraphQLField
+    # a selection class of the field or None for scalars and enums
+    class_name: Optional[str]
+
+
+class _SelectionClass(NamedTuple):
+    """A class for a selection set on some type."""
+
+    name: str
+    description: str
+    fields: List[_SelectionField]
+    # the value of __typename for an object type or None for an abstract type
+    typename: Optional[str]
+    # __typename is selected for an abstract type
+    has_typename: bool
+
+
+def _pascal_case(name: str) -> str:
+    return "".join(part[:1].upper() + part[1:] for part in name.split("_"))
+
+
+def _is_conditional(node: Union[FieldNode, InlineFragmentNode, FragmentSpreadNode]) -> bool:
+    """The selection has @include or @skip, so it can be missed in a response."""
+
+    return any(directive.name.value in ("include", "skip") for directive in node.directives or ())
+
+
+class OperationsGenerator:
+    """Generate a pydantic model for each selection set of GraphQL operations.
+
+    Fragments are inlined. A selection on an interface or a union with
+    different fields for its object types is a union of classes for
+    these types with the `__typename` discriminator, so `__typename`
+    must be selected there. A field can be missed only if the schema
+    allows null or it has `@include` or `@skip`.
+
+    Args:
+        generator: the data-model generator with the schema and render options.
+        operation_paths: paths to files with operations and fragments.
+
+    """
+
+    OPERATION_SUFFIXES = {"query": "Query", "mutation": "Mutation", "subscription": "Subscription"}
+
+    def __init__(self, generator: Generator, operation_paths: Sequence[Path]):
+        if generator.config.options.backend not in ("pydantic", "pydantic_v2"):
+            raise ValueError("Models of operations are supported for pydantic backends only.")
+
+        self.generator = generator
+        self.schema = generator.schema
+        self.config = generator.config
+
+        self.document = load_operations(self.schema, list(operation_paths))
+
+        self.fragments: Dict[str, FragmentDefinitionNode] = {
+            definition.name.value: definition
+            for definition in self.document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+
+        # class name --> selection class in the render order
+        self.classes: Dict[str, _SelectionClass] = {}
+        # union name --> names of selection classes of its object types
+        self.unions: Dict[str, List[str]] = {}
+        # scalars and enums of selected fields
+        self.leaf_types: Set[str] = set()
+        # names of classes of operations
+        self.operations: List[str] = []
+
+        for definition in self.document.definitions:
+            if isinstance(definition, OperationDefinitionNode):
+                self._add_operation(definition)
+
+        options = self.config.options
+        self.render: DataModelRender = type(generator.render)(
+            max_line_len=options.max_line_len,
+            name_suffix=options.name_suffix,
+            discriminated_unions=True,
+            possible_types=self.unions,
+        )
+
+    def _add_operation(self, operation: OperationDefinitionNode) -> None:
+        if operation.name is None:
+            raise ValueError("Each operation must have a name.")
+
+        operation_type = operation.operation.value
+        root_type = self.schema.get_root_type(operation.operation)
+
+        if root_type is None:
+            raise ValueError(f"The schema has no {operation_type} type.")
+
+        name = _pascal_case(operation.name.value)
+        if not name.endswith(self.OPERATION_SUFFIXES[operation_type]):
+            name += self.OPERATION_SUFFIXES[operation_type]
+
+        self.operations.append(name)
+        self._add_selection(name, f"{operation_type} {operation.name.value}", root_type, [operation.selection_set])
+
+    def _type_applies(self, condition: Optional[str], type_: _CompositeType) -> bool:
+        """A fragment with the type condition is applied to the type."""
+
+        if condition is None or condition == type_.name:
+            return True
+
+        condition_type = self.schema.get_type(condition)
+
+        if isinstance(type_, GraphQLObjectType) and is_abstract_type(condition_type):
+            return self.schema.is_sub_type(condition_type, type_)  # type: ignore
+
+        if isinstance(type_, GraphQLInterfaceType) and isinstance(condition_type, GraphQLInterfaceType):
+            return condition_type in type_.interfaces
+
+        return False
+
+    def _collect_fields(
+        self,
+        type_: _CompositeType,
+        selection_sets: List[SelectionSetNode],
+        result: Optional[_CollectedFields] = None,
+        conditional: bool = False,
+    ) -> _CollectedFields:
+        """Collect fields of selection sets for the type with inlined fragments."""
+
+        if result is None:
+            result = {}
+
+        for selection_set in selection_sets:
+            for selection in selection_set.selections:
+                if isinstance(selection, FieldNode):
+                    key = selection.alias.value if selection.alias else selection.name.value
+                    nodes, key_conditional = result.get(key, ([], True))
+
+                    nodes.append(selection)
+                    result[key] = (nodes, key_conditional and (conditional or _is_conditional(selection)))
+
+                    continue
+
+                if isinstance(selection, InlineFragmentNode):
+                    condition = selection.type_condition.name.value if selection.type_condition else None
+                    fragment_selection_set = selection.selection_set
+                else:
+                    fragment = self.fragments[selection.name.value]  # type: ignore
+                    condition = fragment.type_condition.name.value
+                    fragment_selection_set = fragment.selection_set
+
+                if self._type_applies(condition, type_):
+                    self._collect_fields(
+                        type_,
+                        [fragment_selection_set],
+                        result,
+                        conditional or _is_conditional(selection),  # type: ignore
+                    )
+
+        return result
+
+    def _add_selection(
+        self, name: str, description: str, type_: _CompositeType, selection_sets: List[SelectionSetNode]
+    ) -> None:
+        """Add classes for selection sets on some type."""
+
+        if name in self.classes or name in self.unions:
+            raise ValueError(f"The name {name} is used for several selections.")
+
+        if not is_abstract_type(type_):
+            self._add_class(name, description, type_, self._collect_fields(type_, selection_sets))
+            return
+
+        possible_types = sorted(self.schema.get_possible_types(type_), key=lambda p_type: p_type.name)  # type: ignore
+        collected = [self._collect_fields(p_type, selection_sets) for p_type in possible_types]
+
+        # the same fields for all object types
+        keys = {tuple((key, tuple(map(id, nodes))) for key, (nodes, _) in fields.items()) for fields in collected}
+
+        if len(keys) <= 1:
+            # fragments on object types are collected only on these types
+            fields = collected[0] if collected else self._collect_fields(type_, selection_sets)
+            self._add_class(name, description, type_, fields, possible_types[0] if possible_types else None)
+            return
+
+        if any("__typename" not in fields for fields in collected):
+            raise ValueError(f"Select __typename in {description} to choose a class by its object type.")
+
+        self.unions[name] = []
+
+        for p_type, fields in zip(possible_types, collected):
+            class_name = name + p_type.name
+
+            self.unions[name].append(class_name)
+            self._add_class(class_name, f"{description} on {p_type.name}", p_type, fields)
+
+    def _add_class(
+        self,
+        name: str,
+        description: str,
+        type_: _CompositeType,
+        collected: _CollectedFields,
+        object_type: Optional[GraphQLObjectType] = None,
+    ) -> None:
+        """Add a class for collected fields of some type.
+
+        Args:
+            name: a class name.
+            description: a description of the selection.
+            type_: a type of the selection.
+            collected: fields of the selection (see `_collect_fields`).
+            object_type: a possible type of an abstract `type_` with fields which `type_` does not have.
+
+        """
+
+        if name in self.classes:
+            raise ValueError(f"The name {name} is used for several selections.")
+
+        selection_class = _SelectionClass(
+            name=name,
+            description=description,
+            fields=[],
+            typename=type_.name if isinstance(type_, GraphQLObjectType) else None,
+            has_typename="__typename" in collected and not isinstance(type_, GraphQLObjectType),
+        )
+        self.classes[name] = selection_class
+
+        for key, (nodes, conditional) in collected.items():
+            field_name = nodes[0].name.value
+
+            if field_name == "__typename":
+                continue
+
+            if field_name.startswith("__"):
+                raise ValueError(f"The introspection field {field_name} is not supported.")
+
+            type_fields = getattr(type_, "fields", {})
+            schema_field: GraphQLField = (
+                type_fields[field_name] if field_name in type_fields else object_type.fields[field_name]  # type: ignore
+            )
+            field_type = schema_field.type
+
+            if conditional and isinstance(field_type, GraphQLNonNull):
+                field_type = field_type.of_type
+
+            field = GraphQLField(
+                field_type,
+                description=schema_field.description,
+                deprecation_reason=schema_field.deprecation_reason,
+            )
+
+            named_type = get_named_type(field_type)
+            class_name = None
+
+            if is_composite_type(named_type):
+                class_name = name + _pascal_case(key)
+                selection_sets = [node.selection_set for node in nodes if node.selection_set is not None]
+
+                self._add_selection(class_name, f"{description}.{key}", named_type, selection_sets)  # type: ignore
+            else:
+                self.leaf_types.add(named_type.name)
+
+            selection_class.fields.append(_SelectionField(key, field, class_name))
+
+    def _render_leaf_types(self) -> Iterator[str]:
+        """Render scalars and enums of selected fields."""
+
+        for name in sorted(self.leaf_types):
+            type_ = self.schema.get_type(name)
+
+            if isinstance(type_, GraphQLScalarType):
+                yield self.render.render_scalar(type_, self.generator.scalar_pytype(name)[0])
+
+        for name in sorted(self.leaf_types):
+            type_ = self.schema.get_type(name)
+
+            if isinstance(type_, GraphQLEnumType):
+                yield self.render.render_enum(type_)
+
+    def _imports(self) -> str:
+        """Render imports which are used by the general class, leaf types and classes."""
+
+        options = self.config.options
+        imports = self.render.general_class_imports(
+            options.add_from_dict, options.add_to_dict, options.add_from_trusted_dict, options.add_json_methods
+        )
+
+        for name in self.leaf_types:
+            if isinstance(self.schema.get_type(name), GraphQLEnumType):
+                imports += self.render.ENUM_IMPORTS
+            else:
+                pytype_import_ = self.generator.scalar_pytype(name)[1]
+                imports += [pytype_import_] if pytype_import_ is not None else []
+
+        if self.classes:
+            imports += self.render.CLASS_IMPORTS
+
+        return self.render.render_imports(imports)
+
+    def _render_class(self, selection_class: _SelectionClass) -> str:
+        docstring = self.render.render_docstring(
+            [f"A selection of {selection_class.description}"], indent=4, max_line_len=self.config.options.max_line_len
+        )
+
+        result = f"class {selection_class.name}(GraphQLBaseModel):\n{docstring}"
+
+        for field in selection_class.fields:
+            # a response key which is a python keyword is the alias of the field with the suffix
+            alias = field.key if iskeyword(field.key) else None
+
+            result += "\n" + self.render.render_field(field.key, field.field, alias=alias, type_name=field.class_name)
+
+        if selection_class.has_typename:
+            result += '\n    typename__: str = Field(alias="__typename")'
+
+        if selection_class.typename is not None:
+            typename = selection_class.typename
+            result += f'\n    typename__: _t.Literal["{typename}"] = Field(default="{typename}", alias="__typename")'
+
+        return result
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Render the output module chunk by chunk."""
+
+        # pylint: disable=protected-access
+
+        yield self.generator._intro_str() + self._imports()
+        yield "\n\n" + self.generator._render_all(["GraphQLBaseModel"] + self.operations)
+        yield "\n\n\n" + self.render.render_general_class(
+            add_from_dict=self.config.options.add_from_dict,
+            add_to_dict=self.config.options.add_to_dict,
+            add_from_trusted_dict=self.config.options.add_from_trusted_dict,
+            add_json_methods=self.config.options.add_json_methods,
+        )
+
+        yield from self.generator._separated(self._render_leaf_types())
+        yield from self.generator._separated(map(self._render_class, self.classes.values()))
+
+        # selection classes are not ordered, so each of them is updated
+        footer = self.render.render_footer(list(self.classes))
+        yield "\n\n\n" + footer if footer else ""
+
+    def generate(self, output: Path) -> None:
+        """Write response models of operations.
+
+        Args:
+            output: a path to the output python file.
+
+        """
+
+        write_chunks(output, self.iter_chunks())
@@ -0,0 +1,132 @@
+"""Types of a schema which are reachable from some roots."""
+
+from pathlib import Path
+from typing import Iterable, List, Set
+
+from graphql import (
+    DocumentNode,
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLUnionType,
+    OperationDefinitionNode,
+    TypeInfo,
+    TypeInfoVisitor,
+    Visitor,
+    concat_ast,
+    get_named_type,
+    parse,
+    validate,
+    visit
+)
+
+__all__ = [
+    "load_operations",
+    "operation_types",
+    "reachable_types",
+]
+
+
+def reachable_types(schema: GraphQLSchema, roots: Iterable[str]) -> Set[str]:
+    """Names of types which are reachable from roots.
+
+    A type is reachable from a type by a field, an implemented interface,
+    an implementation of an interface or a member of a union.
+
+    Args:
+        schema: a GraphQL schema.
+        roots: names of root types.
+
+    """
+
+    result: Set[str] = set()
+    stack = list(roots)
+
+    while stack:
+        name = stack.pop()
+
+        if name in result:
+            continue
+
+        type_ = schema.get_type(name)
+        if type_ is None:
+            raise ValueError(f"The type {name} is not in the schema.")
+
+        result.add(name)
+
+        if isinstance(type_, (GraphQLObjectType, GraphQLInterfaceType)):
+            stack.extend(get_named_type(field.type).name for field in type_.fields.values())
+            stack.extend(interface.name for interface in type_.interfaces)
+
+        if isinstance(type_, (GraphQLInterfaceType, GraphQLUnionType)):
+            stack.extend(possible_type.name for possible_type in schema.get_possible_types(type_))
+
+    return result
+
+
+def load_operations(schema: GraphQLSchema, paths: List[Path]) -> DocumentNode:
+    """Parse operation files in one document and validate it against the schema.
+
+    Args:
+        schema: a GraphQL schema.
+        paths: paths to files with operations and fragments.
+
+    """
+
+    documents = []
+
+    for path in paths:
+        with path.open("r", encoding="utf8") as operation_file:
+            documents.append(parse(operation_file.read()))
+
+    document = concat_ast(documents)
+
+    errors = validate(schema, document)
+    if errors:
+        raise ValueError("Invalid operations:\n" + "\n".join(str(error) for error in errors))
+
+    return document
+
+
+def operation_types(schema: GraphQLSchema, document: DocumentNode) -> Set[str]:
+    """Names of types of fields and fragments which are selected in operations.
+
+    Root types are not included, but types of their selected leaf fields are.
+
+    Args:
+        schema: a GraphQL schema.
+        document: validated operations (see `load_operations`).
+
+    """
+
+    result: Set[str] = set()
+    type_info = TypeInfo(schema)
+
+    root_types = {schema.query_type, schema.mutation_type, schema.subscription_type} - {None}
+
+    class SelectedTypes(Visitor):
+        """Collect types of selection sets of fields and fragments and of leaf fields of root types."""
+
+        def enter_field(self, node, *_args):
+            # leaf fields of other types are reached from their selection sets
+            if node.selection_set is not None or type_info.get_parent_type() not in root_types:
+                return
+
+            type_ = type_info.get_type()
+
+            if type_ is not None:
+                result.add(get_named_type(type_).name)
+
+        def enter_selection_set(self, _node, _key, parent, *_args):
+            # root types are not rendered and reach almost all types
+            if isinstance(parent, OperationDefinitionNode):
+                return
+
+            type_ = type_info.get_type()
+
+            if type_ is not None:
+                result.add(get_named_type(type_).name)
+
+    visit(document, TypeInfoVisitor(type_info, SelectedTypes()))
+
+    return result
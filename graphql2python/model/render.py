@@ -1,7 +1,8 @@
 import os
+from functools import lru_cache
 from keyword import iskeyword
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Collection, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 from graphql import (
     GraphQLEnumType,
@@ -13,8 +14,10 @@ from graphql import (
     is_list_type,
     is_non_null_type
 )
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from jinja2.bccache import Bucket
 
+from graphql2python.imports import IMPORT_DATE, IMPORT_DATETIME, IMPORT_TYPING_MODULE, Import, Imports
 from graphql2python.model.config import FieldSetting
 
 __all__ = [
@@ -25,7 +28,61 @@ __all__ = [
 # templates setting for render of classes
 TEMPLATES_FOLDER = Path(os.path.join(os.path.dirname(__file__), "templates/"))
 
-template_env = Environment(loader=FileSystemLoader(searchpath=TEMPLATES_FOLDER))
+# a folder for compiled templates (a private temporary folder by default), an empty value disables the cache
+TEMPLATE_CACHE_ENV = "GRAPHQL2PYTHON_TEMPLATE_CACHE"
+
+# modules and names which are used by rendered types
+IMPORT_ENUM_MODULE = Import(import_="enum")
+IMPORT_BASE_MODEL = Import.from_full_path("pydantic.BaseModel")
+IMPORT_FIELD = Import.from_full_path("pydantic.Field")
+
+
+class _TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Compiled templates shared by runs; templates are compiled again if the cache is not writable."""
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+def _template_bytecode_cache() -> Optional[BytecodeCache]:
+    directory = os.environ.get(TEMPLATE_CACHE_ENV)
+
+    if directory == "":
+        return None
+
+    try:
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        return _TemplateBytecodeCache(directory, pattern="__graphql2python_%s.cache")
+
+    except (OSError, RuntimeError):
+        return None
+
+
+# templates are not changed while the generator is running
+template_env = Environment(
+    loader=FileSystemLoader(searchpath=TEMPLATES_FOLDER),
+    bytecode_cache=_template_bytecode_cache(),
+    auto_reload=False,
+)
+
+
+class LazyTemplate:
+    """A template which is loaded on first access, so unused templates are never compiled."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._template: Optional[Template] = None
+
+    def __get__(self, instance: object, owner: type) -> Template:
+        if self._template is None:
+            self._template = template_env.get_template(self.name)
+
+        return self._template
 
 
 class DataModelRender:
@@ -35,16 +92,50 @@ class DataModelRender:
         max_line_len: maximum of line length.
         name_suffix: a suffix for invalid field name (as python object).
         each_field_optional: each field is optional.
+        discriminated_unions: render unions and interface-typed fields as unions
+            with the `typename__` discriminator.
+        possible_types: object names for each union and interface (see `GraphQLSchema.get_possible_types`).
+        interface_fields: field names of each interface with fields of its interfaces,
+            fields of interfaces are taken from their definitions if it is not given.
 
     """
 
-    _template_comment: Template = template_env.get_template("comment.jinja2")
-    _template_docstring: Template = template_env.get_template("docstring.jinja2")
-    _template_scalar: Template = template_env.get_template("scalar.jinja2")
-    _template_enum: Template = template_env.get_template("enum.jinja2")
-    _template_union: Template = template_env.get_template("union.jinja2")
-    _template_interface: Template = template_env.get_template("interface.jinja2")
-    _template_object: Template = template_env.get_template("object.jinja2")
+    _template_comment = LazyTemplate("comment.jinja2")
+    _template_docstring = LazyTemplate("docstring.jinja2")
+    _template_scalar = LazyTemplate("scalar.jinja2")
+    _template_enum = LazyTemplate("enum.jinja2")
+    _template_union = LazyTemplate("union.jinja2")
+    _template_interface = LazyTemplate("interface.jinja2")
+    _template_object = LazyTemplate("object.jinja2")
+    _template_package_init = LazyTemplate("package_init.jinja2")
+
+    # a number of rendered comments and docstrings in their caches
+    TEXT_CACHE_SIZE = 4096
+
+    # classes of interfaces and objects inherit classes of their interfaces
+    INHERIT_INTERFACES = True
+
+    # python types of built-in scalars, other scalars are `str` by default (see `options.scalar_pytypes`)
+    BUILTIN_SCALAR_PYTYPES: Dict[str, str] = {}
+
+    # imports of parts of the output module (see `render_imports`)
+    GENERAL_IMPORTS: Tuple[Import, ...] = (IMPORT_DATETIME, IMPORT_BASE_MODEL)
+    FROM_DICT_IMPORTS: Tuple[Import, ...] = (IMPORT_TYPING_MODULE,)
+    FROM_TRUSTED_DICT_IMPORTS: Tuple[Import, ...] = (
+        IMPORT_ENUM_MODULE,
+        IMPORT_TYPING_MODULE,
+        IMPORT_DATE,
+        IMPORT_DATETIME,
+    )
+    JSON_METHODS_IMPORTS: Tuple[Import, ...] = (
+        Import(import_="json"),
+        IMPORT_TYPING_MODULE,
+        Import.from_full_path("pydantic.json.pydantic_encoder"),
+    )
+    ENUM_IMPORTS: Tuple[Import, ...] = (IMPORT_ENUM_MODULE,)
+    UNION_IMPORTS: Tuple[Import, ...] = (IMPORT_TYPING_MODULE,)
+    DISCRIMINATED_UNION_IMPORTS: Tuple[Import, ...] = (IMPORT_TYPING_MODULE, IMPORT_FIELD)
+    CLASS_IMPORTS: Tuple[Import, ...] = (IMPORT_TYPING_MODULE, IMPORT_FIELD)
 
     SCALAR_DEFAULT_DESCRIPTION = "A Scalar type\nSee https://graphql.org/learn/schema/#scalar-types"
     ENUM_DEFAULT_DESCRIPTION = "An Enum type\nSee https://graphql.org/learn/schema/#enumeration-types"
@@ -57,25 +148,55 @@ class DataModelRender:
         max_line_len: int = 120,
         name_suffix: str = "_",
         each_field_optional: bool = False,
-    ):
+        discriminated_unions: bool = False,
+        possible_types: Optional[Dict[str, List[str]]] = None,
+        interface_fields: Optional[Dict[str, FrozenSet[str]]] = None,
+    ):  # pylint: disable=too-many-arguments
         self.max_line_len = max_line_len
         self.name_suffix = name_suffix
         self.each_field_optional = each_field_optional
+        self.discriminated_unions = discriminated_unions
+        self.possible_types = possible_types or {}
+        self.interface_fields = interface_fields or {}
+
+        # type name --> its component of the reference graph (see `PackageLayout`) or None to quote each reference
+        self.components: Optional[Dict[str, str]] = None
+        # the component of the type which is rendered now
+        self._component: Optional[str] = None
+
+        # names of interfaces --> names of fields of these interfaces
+        self._inherited_fields: Dict[Tuple[str, ...], FrozenSet[str]] = {}
+
+        # (wrapper tokens, type reference, alias, each_field_optional) --> rendered field type
+        self._field_types: Dict[Tuple[Tuple[str, ...], str, Optional[str], bool], str] = {}
+        self.field_type_cache_hits = 0
+        self.field_type_cache_misses = 0
+
+        # descriptions are often the same for many types and fields (as Relay connections)
+        self._cached_comment = lru_cache(maxsize=self.TEXT_CACHE_SIZE)(self._render_comment)
+        self._cached_docstring = lru_cache(maxsize=self.TEXT_CACHE_SIZE)(self._render_docstring)
 
     @staticmethod
     def _line_shift(text: str, indent: int = 4) -> str:
         return ("\n" + " " * indent).join(text.split("\n"))
 
     @staticmethod
-    def render_general_class(add_from_dict: bool, add_to_dict: bool) -> str:
+    def render_general_class(
+        add_from_dict: bool, add_to_dict: bool, add_from_trusted_dict: bool = False, add_json_methods: bool = False
+    ) -> str:
         """Render the general class for each datamodel class.
 
         Args:
             add_from_dict: add from_dict method to the general class.
             add_to_dict: add to_dict method to the general class.
+            add_from_trusted_dict: add from_trusted_dict method (parsing without validation) to the general class.
+            add_json_methods: add from_json and to_json methods (with orjson if it is installed) to the general class.
 
         """
 
+        # module-level helpers of methods go after the class
+        helpers = ""
+
         general_class = '''class GraphQLBaseModel(BaseModel):
     """Base Model for GraphQL object."""
 
@@ -98,7 +219,219 @@ class DataModelRender:
         """Special wrapper over .dict method."""
         return self.dict(by_alias=True)'''
 
-        return general_class
+        if add_from_trusted_dict:
+            general_class += '''\n\n    @classmethod
+    def from_trusted_dict(cls, obj: _t.Dict[str, _t.Any]):
+        """Build an object from trusted data without validation (see .construct method).
+
+        Nested objects are built in the same way, members of unions are chosen by __typename.
+        """
+        fields = _TRUSTED_FIELDS.get(cls)
+        if fields is None:
+            fields = _TRUSTED_FIELDS[cls] = [
+                (name, field.alias, _trusted_converter(field)) for name, field in cls.__fields__.items()
+            ]
+
+        values = {}
+        for name, alias, converter in fields:
+            if alias in obj:
+                value = obj[alias]
+                values[name] = value if converter is None or value is None else converter(value)
+
+        return cls.construct(**values)'''
+
+            helpers += '''
+
+
+# class --> (field name, alias, converter or None for values used as is) for each field
+_TRUSTED_FIELDS: _t.Dict[type, _t.List[_t.Tuple[str, str, _t.Any]]] = {}
+
+
+def _trusted_datetime(value: str) -> datetime:
+    """Parse an ISO datetime with Z for UTC, which datetime.fromisoformat rejects before Python 3.11."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _trusted_converter(field: _t.Any) -> _t.Any:
+    """A function which builds a value of a field from trusted data."""
+    from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
+
+    if field.shape == SHAPE_LIST:
+        item_converter = _trusted_converter(field.sub_fields[0])
+        if item_converter is None:
+            return None
+        return lambda value: [None if item is None else item_converter(item) for item in value]
+
+    if field.shape != SHAPE_SINGLETON:
+        return None
+
+    members = [sub_field.type_ for sub_field in field.sub_fields or []] or [field.type_]
+    models = tuple(member for member in members if isinstance(member, type) and issubclass(member, GraphQLBaseModel))
+
+    if models:
+        # __typename --> class for each subclass of the field models
+        classes = {}
+        subclasses = list(models)
+        while subclasses:
+            subclass = subclasses.pop()
+            classes[subclass.__name__] = subclass
+            subclasses.extend(subclass.__subclasses__())
+
+        return lambda value: classes.get(value.get("__typename"), models[0]).from_trusted_dict(value)
+
+    if isinstance(field.type_, type):
+        if issubclass(field.type_, enum.Enum):
+            return field.type_
+        if field.type_ is datetime:
+            return _trusted_datetime
+        if field.type_ is date:
+            return date.fromisoformat
+
+    return None'''
+
+        if add_json_methods:
+            general_class += '''\n\n    @classmethod
+    def from_json(cls, data: _t.Union[bytes, bytearray, memoryview, str]):
+        """Build an object from a JSON GraphQL response, bytes are not decoded to str."""
+        return cls.parse_obj(_json_loads(data))
+
+    def to_json(self) -> bytes:
+        """Dump the object to JSON with aliases as keys."""
+        return _json_dumps(self.dict(by_alias=True))'''
+
+            helpers += '''
+
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(data: _t.Union[bytes, bytearray, memoryview, str]) -> _t.Any:
+    """Parse JSON with orjson if it is installed."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+
+    return json.loads(data)
+
+
+def _json_dumps(obj: _t.Any) -> bytes:
+    """Dump JSON with orjson if it is installed, orjson dumps datetimes, dates and enums natively."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, default=pydantic_encoder)
+
+    return json.dumps(obj, default=pydantic_encoder, separators=(",", ":")).encode("utf-8")'''
+
+        return general_class + helpers
+
+    def general_class_imports(
+        self,
+        add_from_dict: bool,
+        add_to_dict: bool,
+        add_from_trusted_dict: bool = False,
+        add_json_methods: bool = False,
+    ) -> List[Import]:
+        """Imports which are used by the general class (see `render_general_class`)."""
+
+        # pylint: disable=unused-argument
+
+        result = list(self.GENERAL_IMPORTS)
+
+        if add_from_dict:
+            result += self.FROM_DICT_IMPORTS
+
+        if add_from_trusted_dict:
+            result += self.FROM_TRUSTED_DICT_IMPORTS
+
+        if add_json_methods:
+            result += self.JSON_METHODS_IMPORTS
+
+        return result
+
+    @property
+    def expand_interfaces(self) -> bool:
+        """Interface-typed fields are rendered as unions of possible types."""
+
+        return self.discriminated_unions
+
+    def union_imports(self) -> Tuple[Import, ...]:
+        """Imports which are used by unions."""
+
+        return self.DISCRIMINATED_UNION_IMPORTS if self.discriminated_unions else self.UNION_IMPORTS
+
+    @staticmethod
+    def render_imports(imports: Iterable[Import]) -> str:
+        """Render imports of the output module: the standard library, then other packages.
+
+        Args:
+            imports: imports of rendered parts of the module, with duplicates.
+
+        """
+
+        result = Imports()
+        result.append(list(imports))
+
+        return result.dump_sections()
+
+    @staticmethod
+    def render_footer(names: List[str]) -> str:
+        """Render the end of the output module.
+
+        Args:
+            names: names of rendered interfaces and objects.
+
+        """
+
+        return "".join(f"{name}.update_forward_refs()\n" for name in names)
+
+    def render_import(self, module: str, names: List[str], indent: int = 0) -> str:
+        """Render `from module import names`, one name per line if it is too long.
+
+        Args:
+            module: a module name.
+            names: imported names.
+            indent: indent of the import.
+
+        """
+
+        result = " " * indent + f"from {module} import {', '.join(names)}"
+
+        if len(result) <= self.max_line_len:
+            return result
+
+        lines = [" " * indent + f"from {module} import ("]
+        lines.extend(" " * (indent + 4) + f"{name}," for name in names)
+        lines.append(" " * indent + ")")
+
+        return "\n".join(lines)
+
+    def render_package_init(
+        self, all_header: str, base_names: List[str], modules: Dict[str, List[str]], base_module: str = "_base"
+    ) -> str:
+        """Render `__init__.py` of an output package which imports types on first access (PEP 562).
+
+        Args:
+            all_header: `__all__` of the package.
+            base_names: names from the base module which are imported at once.
+            modules: a module name --> names of its types.
+            base_module: a name of the module with the general class and scalars.
+
+        """
+
+        type_imports = "\n".join(self.render_import(f".{module}", names, 4) for module, names in modules.items())
+
+        return self._template_package_init.render(
+            base_import=self.render_import(f".{base_module}", base_names),
+            all_header=all_header,
+            type_imports=type_imports or "    pass",
+            modules={name: module for module, names in modules.items() for name in names},
+        )
 
     @staticmethod
     def processing_of_line(line: str, indent: int = 0, max_line_len: int = 120) -> List[str]:
@@ -111,29 +444,37 @@ class DataModelRender:
 
         """
 
-        line_processed = []
-        line_split = line.split(" ")
+        words = line.split(" ")
+        line_len_limit = max_line_len - 2 - indent
 
-        temp = line_split[0]
+        line_processed = []
 
-        for word_id in range(1, len(line_split)):
-            word = line_split[word_id]
+        # the first word and the length of the current line
+        start = 0
+        current_len = len(words[0])
 
-            if len(temp) > (max_line_len - 2 - indent):
-                line_processed.append(temp)
-                temp = word
+        for word_id in range(1, len(words)):
+            word_len = len(words[word_id])
 
+            if current_len + 1 + word_len <= line_len_limit:
+                current_len += 1 + word_len
             else:
-                if len(temp + word) + 1 <= (max_line_len - 2 - indent):
-                    temp = " ".join([temp, word])
-                else:
-                    line_processed.append(temp)
-                    temp = word
+                line_processed.append(" ".join(words[start:word_id]))
+                start = word_id
+                current_len = word_len
 
-        line_processed.append(temp)
+        line_processed.append(" ".join(words[start:]))
 
         return line_processed
 
+    def text_cache_info(self) -> Tuple[int, int]:
+        """Hits and misses of caches of rendered comments and docstrings."""
+
+        comment_info = self._cached_comment.cache_info()
+        docstring_info = self._cached_docstring.cache_info()
+
+        return comment_info.hits + docstring_info.hits, comment_info.misses + docstring_info.misses
+
     def render_comment(self, lines: List[str], indent: int = 0, max_line_len: int = 120) -> str:
         """Render multiline comment with `comment.jinja2` template.
 
@@ -147,6 +488,9 @@ class DataModelRender:
         if len(lines) == 0:
             lines.append("...")
 
+        return self._cached_comment(tuple(lines), indent, max_line_len)
+
+    def _render_comment(self, lines: Tuple[str, ...], indent: int, max_line_len: int) -> str:
         processed_lines: List[str] = []
 
         for line in lines:
@@ -155,7 +499,7 @@ class DataModelRender:
             for line_from_separated_lines in separated_lines:
                 processed_lines += self.processing_of_line(line_from_separated_lines, indent, max_line_len)
 
-        return self._template_comment.render(indent=" " * indent, lines=processed_lines)[:-1]
+        return self._emit_comment(" " * indent, processed_lines)
 
     def render_docstring(self, lines: List[str], indent: int = 0, max_line_len: int = 120) -> str:
         """Render multiline docstring with `docstring.jinja2` template.
@@ -170,6 +514,9 @@ class DataModelRender:
         if len(lines) == 0:
             lines.append("...")
 
+        return self._cached_docstring(tuple(lines), indent, max_line_len)
+
+    def _render_docstring(self, lines: Tuple[str, ...], indent: int, max_line_len: int) -> str:
         processed_lines: List[str] = []
 
         for line in lines:
@@ -178,7 +525,7 @@ class DataModelRender:
             for line_from_separated_lines in separated_lines:
                 processed_lines += self.processing_of_line(line_from_separated_lines, indent - 2, max_line_len)
 
-        return self._template_docstring.render(indent=" " * indent, lines=processed_lines)
+        return self._emit_docstring(" " * indent, processed_lines)
 
     def render_scalar(self, obj: GraphQLScalarType, pytype: str) -> str:
         """Render scalar with `scalar.jinja2` template.
@@ -194,7 +541,7 @@ class DataModelRender:
             (obj.description or self.SCALAR_DEFAULT_DESCRIPTION).split("\n"), max_line_len=self.max_line_len
         )
 
-        return self._template_scalar.render(description=description, name=name, pytype=pytype)
+        return self._emit_scalar(description, name, pytype)
 
     def render_enum(self, obj: GraphQLEnumType) -> str:
         """Render enum with `enum.jinja2` template.
@@ -240,7 +587,7 @@ class DataModelRender:
 
             values.append((v_name, v, v_description, v_deprecated))
 
-        return self._template_enum.render(docstring=docstring, name=name, values=values)
+        return self._emit_enum(docstring, name, values)
 
     def render_union(self, obj: GraphQLUnionType) -> str:
         """Render union with `union.jinja2` template.
@@ -254,17 +601,75 @@ class DataModelRender:
         description = self.render_comment(
             (obj.description or self.UNION_DEFAULT_DESCRIPTION).split('\n'), max_line_len=self.max_line_len
         )
-        types = [type_.name for type_ in obj.types]  # type: ignore
+        self._enter(name)
+        types = [self._name_ref(type_.name) for type_ in obj.types]  # type: ignore
+
+        return self._emit_union(description, name, types)
+
+    def _enter(self, name: str) -> None:
+        """Start the render of a union, an interface or an object (see `components`)."""
+
+        self._component = None if self.components is None else self.components.get(name)
+
+    def _name_ref(self, type_name: str) -> str:
+        """Render a reference to a type by its name.
+
+        A reference is a string (a forward reference) if `components` is not
+        given or the type is in the component of the rendered type, so it can
+        be rendered after this type. Other types are rendered before it.
+
+        """
+
+        if self.components is None:
+            return f"'{type_name}'"
+
+        component = self.components.get(type_name)
+
+        if component is not None and component == self._component:
+            return f"'{type_name}'"
 
-        return self._template_union.render(description=description, name=name, types=types)
+        return type_name
 
-    def render_field_type(self, field: GraphQLField, alias: Optional[str] = None) -> str:
-        """Render a type of some GraphQL field."""
+    def _render_type_ref(self, type_name: str) -> Tuple[str, bool]:
+        """Render a reference to a type in a field.
 
-        # pylint: disable=too-many-statements,too-many-branches
+        With `discriminated_unions` a union or an interface is replaced by
+        the union of its possible object types.
+
+        Returns:
+            the reference and a flag that it is a union of several types.
+
+        """
+
+        if not self.discriminated_unions or type_name not in self.possible_types:
+            return self._name_ref(type_name), False
+
+        possible_types = self.possible_types[type_name]
+
+        if len(possible_types) == 0:
+            return self._name_ref(type_name), False
+
+        if len(possible_types) == 1:
+            return self._name_ref(possible_types[0]), False
+
+        return "_t.Union[" + ", ".join(map(self._name_ref, possible_types)) + "]", True
+
+    def render_field_type(
+        self, field: GraphQLField, alias: Optional[str] = None, type_name: Optional[str] = None
+    ) -> str:
+        """Render a type of some GraphQL field.
+
+        Field types with the same wrappers, type name and alias are rendered
+        once (see `field_type_cache_hits` and `field_type_cache_misses`).
+
+        Args:
+            field: a field for render.
+            alias: pydantic alias for the field.
+            type_name: a name of a class instead of the name of the field type.
+
+        """
 
         obj = field.type
-        result = ""
 
         #
         # tokens:
@@ -303,13 +708,36 @@ class DataModelRender:
 
             obj = obj.of_type  # type: ignore
 
-        final_name = obj.name  # type: ignore
+        final_name = type_name or obj.name  # type: ignore
 
         if (prev_token is None) or (prev_token in ["L", "OL"]):
             res_list.append("OS")
         else:
             res_list.append("S")
 
+        type_ref, is_union = self._render_type_ref(final_name)
+        key = (tuple(res_list), type_ref, alias, self.each_field_optional)
+
+        result = self._field_types.get(key)
+
+        if result is not None:
+            self.field_type_cache_hits += 1
+            return result
+
+        self.field_type_cache_misses += 1
+
+        result = self._render_field_type(res_list, type_ref, is_union, alias)
+        self._field_types[key] = result
+
+        return result
+
+    def _render_field_type(self, res_list: List[str], type_ref: str, is_union: bool, alias: Optional[str]) -> str:
+        """Render a type of a field by its tokens and the type reference (see `render_field_type`)."""
+
+        # pylint: disable=too-many-branches
+
+        result = ""
+
         # check that the field is optional
         if self.each_field_optional:
             if res_list[0] == "S":
@@ -318,47 +746,22 @@ class DataModelRender:
             elif res_list[0] == "L":
                 res_list[0] = "OL"
 
-        alias_field = ""
-        if alias is not None:
-            alias_field = f", alias='{alias}'"
-
         if len(res_list) == 1:
             is_optional = res_list[0] == "OS"
 
-            def_value = ""
-            if is_optional:
-                def_value = "default=None"
-
-            field_options = ""
-            if is_optional or alias:
-                if def_value == "":
-                    def_value = "..."
-
-                field_options = f' = Field({def_value}{alias_field})'
-
             if res_list[0] == 'OS':
-                result += f"_t.Optional['{final_name}']"
+                result += f"_t.Optional[{type_ref}]"
             elif res_list[0] == 'S':
-                result += f"'{final_name}'"
+                result += type_ref
             else:
                 raise ValueError
 
-            result += field_options
+            # pydantic uses a discriminator of a field only for a union which is not in a list
+            result += self._render_field_options("None" if is_optional else None, alias, is_union)
 
         else:
             is_optional = res_list[0] == 'OL'
 
-            def_value = ''
-            if is_optional:
-                def_value = 'default_factory=list'
-
-            field_options = ''
-            if is_optional or alias:
-                if def_value == '':
-                    def_value = '...'
-
-                field_options = f' = Field({def_value}{alias_field})'
-
             end_brace = 0
             for key_id in range(len(res_list) - 1):
                 if res_list[key_id] == 'OL':
@@ -369,23 +772,56 @@ class DataModelRender:
                     result += '_t.List['
                     end_brace += 1
 
+            # pydantic does not support a discriminated union in Optional, so the union is smart there
             if res_list[-1] == 'OS':
-                result += f"_t.Optional['{final_name}']"
+                result += f"_t.Optional[{type_ref}]"
+            elif is_union:
+                result += f"_t.Annotated[{type_ref}, Field(discriminator='typename__')]"
             else:
-                result += f"'{final_name}'"
+                result += type_ref
 
             result += ']' * end_brace
 
-            result += field_options
+            result += self._render_field_options("list" if is_optional else None, alias, False)
 
         return result
 
+    def _render_field_options(self, default: Optional[str], alias: Optional[str], discriminated: bool) -> str:
+        """Render options of a field after its type.
+
+        Args:
+            default: None for a required field, `"None"` for None as default and `"list"` for an empty list.
+            alias: an alias for the field.
+            discriminated: the field is a union with the `typename__` discriminator.
+
+        """
+
+        if default is None and not alias and not discriminated:
+            return ""
+
+        def_value = "..."
+        if default == "None":
+            def_value = "default=None"
+        elif default == "list":
+            def_value = "default_factory=list"
+
+        alias_field = ""
+        if alias is not None:
+            alias_field = f", alias='{alias}'"
+
+        discriminator_field = ""
+        if discriminated:
+            discriminator_field = ", discriminator='typename__'"
+
+        return f' = Field({def_value}{alias_field}{discriminator_field})'
+
     def render_field(
         self,
         field_name: str,
         field: GraphQLField,
         alias: Optional[str] = None,
         new_name: Optional[str] = None,
+        type_name: Optional[str] = None,
     ) -> str:
         """Render a GraphQL field.
 
@@ -394,6 +830,7 @@ class DataModelRender:
             field: field object for render.
             alias: pydantic alias for field.
             new_name: new field name.
+            type_name: a name of a class instead of the name of the field type.
 
         """
 
@@ -415,13 +852,33 @@ class DataModelRender:
 
         result += f"    {field_name}{name_suffix}: "
 
-        result += self.render_field_type(field, alias)
+        result += self.render_field_type(field, alias, type_name)
 
         if field.deprecation_reason is not None:
             result += f'  # deprecation_reason: {field.deprecation_reason}'
 
         return result
 
+    def inherited_fields(self, interfaces: Collection[GraphQLInterfaceType]) -> FrozenSet[str]:
+        """Names of fields which are inherited from interfaces.
+
+        Args:
+            interfaces: interfaces of an interface or an object.
+
+        """
+
+        key = tuple(interface.name for interface in interfaces)
+
+        if key not in self._inherited_fields:
+            fields: Set[str] = set()
+
+            for interface in interfaces:
+                fields.update(self.interface_fields.get(interface.name, interface.fields))
+
+            self._inherited_fields[key] = frozenset(fields)
+
+        return self._inherited_fields[key]
+
     def render_interface(self, obj: GraphQLInterfaceType, field_aliases: Dict[str, FieldSetting]) -> str:
         """Render an interface with `interface.jinja2` template.
 
@@ -431,17 +888,17 @@ class DataModelRender:
 
         """
 
+        self._enter(obj.name)
         docstring = self.render_docstring(
             indent=4, lines=[obj.description or self.INTERFACE_DEFAULT_DESCRIPTION], max_line_len=self.max_line_len
         )
 
-        interfaces = [int_name.name for int_name in obj.interfaces]  # type: ignore
-
-        parents = set()
+        interfaces: List[str] = []
+        parents: FrozenSet[str] = frozenset()
 
-        for interface in obj.interfaces:  # type: ignore
-            for f_name, _ in interface.fields.items():
-                parents.add(f_name)
+        if self.INHERIT_INTERFACES:
+            interfaces = [int_name.name for int_name in obj.interfaces]  # type: ignore
+            parents = self.inherited_fields(obj.interfaces)  # type: ignore
 
         fields_optional = []
         fields_required = []
@@ -478,12 +935,7 @@ class DataModelRender:
                 )
             )
 
-        return self._template_interface.render(
-            docstring=docstring,
-            name=obj.name,
-            interfaces=interfaces,
-            fields=fields,
-        )
+        return self._emit_interface(docstring, obj.name, interfaces, fields)
 
     def render_object(self, obj: GraphQLObjectType, field_aliases: Dict[str, FieldSetting]) -> str:
         """Render an object with `object.jinja2` template.
@@ -504,16 +956,17 @@ class DataModelRender:
 
         """
 
+        self._enter(obj.name)
         docstring = self.render_docstring(
             indent=4, lines=[obj.description or self.OBJECT_DEFAULT_DESCRIPTION], max_line_len=self.max_line_len
         )
 
-        interfaces = [int_name.name for int_name in obj.interfaces]  # type: ignore
+        interfaces: List[str] = []
+        parents: FrozenSet[str] = frozenset()
 
-        parents = set()
-        for interface in obj.interfaces:  # type: ignore
-            for f_name, _ in interface.fields.items():
-                parents.add(f_name)
+        if self.INHERIT_INTERFACES:
+            interfaces = [int_name.name for int_name in obj.interfaces]  # type: ignore
+            parents = self.inherited_fields(obj.interfaces)  # type: ignore
 
         fields_optional = []
         fields_required = []
@@ -550,9 +1003,33 @@ class DataModelRender:
                 )
             )
 
-        return self._template_object.render(
-            docstring=docstring,
-            name=obj.name,
-            interfaces=interfaces,
-            fields=fields,
+        return self._emit_object(docstring, obj.name, interfaces, fields)
+
+    #
+    # emitters of rendered parts, they are replaced without templates in FastDataModelRender
+    #
+
+    def _emit_comment(self, indent: str, lines: List[str]) -> str:
+        return self._template_comment.render(indent=indent, lines=lines)[:-1]
+
+    def _emit_docstring(self, indent: str, lines: List[str]) -> str:
+        return self._template_docstring.render(indent=indent, lines=lines)
+
+    def _emit_scalar(self, description: str, name: str, pytype: str) -> str:
+        return self._template_scalar.render(description=description, name=name, pytype=pytype)
+
+    def _emit_enum(
+        self, docstring: str, name: str, values: List[Tuple[str, str, Optional[str], Optional[str]]]
+    ) -> str:
+        return self._template_enum.render(docstring=docstring, name=name, values=values)
+
+    def _emit_union(self, description: str, name: str, types: List[str]) -> str:
+        return self._template_union.render(
+            description=description, name=name, types=types, discriminated=self.discriminated_unions
         )
+
+    def _emit_interface(self, docstring: str, name: str, interfaces: List[str], fields: List[str]) -> str:
+        return self._template_interface.render(docstring=docstring, name=name, interfaces=interfaces, fields=fields)
+
+    def _emit_object(self, docstring: str, name: str, interfaces: List[str], fields: List[str]) -> str:
+        return self._template_object.render(docstring=docstring, name=name, interfaces=interfaces, fields=fields)
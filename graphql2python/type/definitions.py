@@ -10,8 +10,9 @@ from graphql import (
     GraphQLScalarType,
     GraphQLUnionType
 )
-from pydantic import BaseModel
-from pydantic import Field as PydanticField
+
+from graphql2python.utils.compat import BaseModel
+from graphql2python.utils.compat import Field as PydanticField
 
 __all__ = [
     "GraphQL2PythonFieldSequenceItemType",
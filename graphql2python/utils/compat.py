@@ -0,0 +1,20 @@
+"""The pydantic v1 API for models of the generator.
+
+The generator works with pydantic v1 and v2 installed, its own models
+(the config, imports, type definitions) use the v1 API from
+`pydantic.v1` if it exists. The output data-model is independent
+of it (see `options.backend`).
+
+"""
+
+try:
+    from pydantic.v1 import BaseModel, Field, root_validator, validator
+except ImportError:  # pragma: no cover
+    from pydantic import BaseModel, Field, root_validator, validator  # type: ignore
+
+__all__ = [
+    "BaseModel",
+    "Field",
+    "root_validator",
+    "validator",
+]
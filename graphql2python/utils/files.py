@@ -0,0 +1,159 @@
+"""Helpers for writing of generated files."""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional, Tuple
+
+__all__ = [
+    "same_content",
+    "write_bytes",
+    "write_chunks",
+]
+
+
+# the buffer size for output files
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+def _default_file_mode() -> int:
+    """The mode of a new file created with `open(..., "w")`."""
+
+    umask = os.umask(0)
+    os.umask(umask)
+
+    return 0o666 & ~umask
+
+
+@contextmanager
+def _atomic_file(path: Path, buffering: int = DEFAULT_BUFFER_SIZE) -> Iterator[IO[bytes]]:
+    """Open a temporary binary file in the folder of `path` which replaces `path` on success."""
+
+    file_mode = path.stat().st_mode & 0o777 if path.exists() else _default_file_mode()
+
+    tmp_fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+
+    try:
+        tmp_file = open(tmp_fd, "wb", buffering=buffering)  # pylint: disable=consider-using-with
+
+        with tmp_file:
+            yield tmp_file
+
+        os.chmod(tmp_name, file_mode)
+        os.replace(tmp_name, path)
+
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+        raise
+
+
+def _encode(chunk: str) -> bytes:
+    """Bytes of a text chunk as they are written by a file opened with `open(..., "w")`."""
+
+    if os.linesep != "\n":
+        chunk = chunk.replace("\n", os.linesep)
+
+    return chunk.encode("utf-8")
+
+
+def _common_prefix(path: Path, chunks: Iterator[str]) -> Optional[Tuple[int, bytes]]:
+    """Compare chunks with the content of a file until the first difference.
+
+    The file is read along with chunks, so neither the file nor the chunks
+    are kept in memory. Chunks are consumed up to the first different one.
+
+    Returns:
+        None if the content is the same, otherwise a size of the same prefix
+        of the file and the first different chunk.
+
+    """
+
+    if not path.is_file():
+        return 0, b""
+
+    matched = 0
+
+    with path.open("rb") as old_file:
+        for chunk in chunks:
+            data = _encode(chunk)
+
+            if old_file.read(len(data)) != data:
+                return matched, data
+
+            matched += len(data)
+
+        if old_file.read(1) == b"":
+            return None
+
+    return matched, b""
+
+
+def same_content(path: Path, chunks: Iterable[str]) -> bool:
+    """Check that a file has the content of text chunks without writing anything.
+
+    Args:
+        path: a path to the file.
+        chunks: text chunks in the output order.
+
+    """
+
+    return _common_prefix(path, iter(chunks)) is None
+
+
+def write_chunks(path: Path, chunks: Iterable[str], buffering: int = DEFAULT_BUFFER_SIZE) -> bool:
+    """Write text chunks to a file if its content is changed.
+
+    The chunks are compared with the file as they are rendered and the file
+    (with its mtime) is kept as is if the content is the same. Otherwise the
+    same prefix is copied and the rest of chunks are written to a temporary
+    file in the same folder which then replaces the target file, so readers
+    never see a partial output.
+
+    Args:
+        path: a path to the target file.
+        chunks: text chunks in the output order.
+        buffering: the buffer size of the temporary file.
+
+    Returns:
+        False if the file is not changed.
+
+    """
+
+    chunks = iter(chunks)
+
+    prefix = _common_prefix(path, chunks)
+    if prefix is None:
+        return False
+
+    matched, first_chunk = prefix
+
+    with _atomic_file(path, buffering=buffering) as output_file:
+        if matched > 0:
+            with path.open("rb") as old_file:
+                while matched > 0:
+                    data = old_file.read(min(matched, buffering))
+                    output_file.write(data)
+                    matched -= len(data)
+
+        output_file.write(first_chunk)
+
+        for chunk in chunks:
+            output_file.write(_encode(chunk))
+
+    return True
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a file through a temporary file (see `write_chunks`).
+
+    Args:
+        path: a path to the target file.
+        data: file content.
+
+    """
+
+    with _atomic_file(path) as output_file:
+        output_file.write(data)
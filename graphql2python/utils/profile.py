@@ -0,0 +1,233 @@
+"""Timings, counters and peak memory of stages of a run."""
+
+import cProfile
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import ContextManager, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+__all__ = [
+    "Profiler",
+    "profile_stage",
+    "profile_iter",
+]
+
+T = TypeVar("T")
+
+
+class _Frame:
+    """An active stage: its start and the time of its nested stages."""
+
+    __slots__ = ("name", "wall", "cpu", "child_wall", "child_cpu", "peak")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.peak = 0
+
+
+class Profiler:
+    """Collect wall and CPU time, peak traced memory and counters of stages.
+
+    The time of a stage excludes the time of stages nested in it, so times
+    of all stages sum to the total time of the run. CPU time and memory
+    are measured in the current process only (worker processes are not
+    counted). Memory is traced with `tracemalloc` if `trace_memory` is set,
+    which slows the run down.
+
+    Args:
+        trace_memory: trace peak memory of stages.
+        cprofile_path: a path for a pstats dump of the render phase (see `render_profile`).
+
+    """
+
+    def __init__(self, trace_memory: bool = True, cprofile_path: Optional[Path] = None):
+        self.trace_memory = trace_memory
+        self.cprofile_path = cprofile_path
+
+        # stage name --> {"wall": seconds, "cpu": seconds, "peak_memory": bytes, "calls": number}
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counts: Dict[str, int] = {}
+        self.total: Dict[str, float] = {}
+
+        self._stack: List[_Frame] = []
+        # tracemalloc is stopped on exit only if it is started by the profiler
+        self._started_tracing = False
+
+    def __enter__(self) -> "Profiler":
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        self._stack.append(_Frame("total"))
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        frame = self._stack.pop()
+
+        self.total = {
+            "wall": time.perf_counter() - frame.wall,
+            "cpu": time.process_time() - frame.cpu,
+            "peak_memory": self._peak(frame),
+        }
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _peak(self, frame: _Frame) -> int:
+        if not self.trace_memory or not tracemalloc.is_tracing():
+            return 0
+
+        return max(frame.peak, tracemalloc.get_traced_memory()[1])
+
+    @staticmethod
+    def _reset_peak() -> None:
+        # Python 3.8 has no reset_peak, so a peak of a stage includes peaks of previous stages there
+        if tracemalloc.is_tracing() and hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Measure a stage, times of several calls with the same name are summed.
+
+        Args:
+            name: a name of the stage.
+
+        """
+
+        if self._stack:
+            parent = self._stack[-1]
+            parent.peak = self._peak(parent)
+
+        self._reset_peak()
+        frame = _Frame(name)
+        self._stack.append(frame)
+
+        try:
+            yield
+        finally:
+            self._stack.pop()
+
+            wall = time.perf_counter() - frame.wall
+            cpu = time.process_time() - frame.cpu
+            peak = self._peak(frame)
+
+            result = self.stages.setdefault(name, {"wall": 0.0, "cpu": 0.0, "peak_memory": 0, "calls": 0})
+            result["wall"] += wall - frame.child_wall
+            result["cpu"] += cpu - frame.child_cpu
+            result["peak_memory"] = max(result["peak_memory"], peak)
+            result["calls"] += 1
+
+            if self._stack:
+                parent = self._stack[-1]
+                parent.child_wall += wall
+                parent.child_cpu += cpu
+                parent.peak = max(parent.peak, peak)
+
+    def iterate(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        """Measure the production of each item of a lazy iterable as a stage.
+
+        Args:
+            name: a name of the stage.
+            items: an iterable, for example a generator of rendered chunks.
+
+        """
+
+        iterator = iter(items)
+
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+
+            yield item
+
+    def count(self, name: str, value: int) -> None:
+        """Add a value to a counter.
+
+        Args:
+            name: a name of the counter.
+            value: a value to add.
+
+        """
+
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def render_profile(self) -> ContextManager:
+        """Profile the block with cProfile and dump pstats to `cprofile_path` if it is given."""
+
+        if self.cprofile_path is None:
+            return nullcontext()
+
+        return self._cprofile(self.cprofile_path)
+
+    @staticmethod
+    @contextmanager
+    def _cprofile(path: Path) -> Iterator[None]:
+        profile = cProfile.Profile()
+        profile.enable()
+
+        try:
+            yield
+        finally:
+            profile.disable()
+            profile.dump_stats(str(path))
+
+    def report(self) -> Dict:
+        """Results in a JSON-serializable dict."""
+
+        return {"stages": self.stages, "counts": self.counts, "total": self.total}
+
+    def format_table(self) -> str:
+        """Results as a text table."""
+
+        width = max([len(name) for name in self.stages] + [len("total")])
+
+        def memory(peak: float) -> str:
+            return f"{peak / (1024 * 1024):9.1f}" if self.trace_memory else f"{'-':>9}"
+
+        lines = [f"{'stage':<{width}}  {'wall, s':>9}  {'cpu, s':>9}  {'peak, MiB':>9}  {'calls':>6}"]
+
+        for name, result in self.stages.items():
+            lines.append(
+                f"{name:<{width}}  {result['wall']:9.3f}  {result['cpu']:9.3f}  "
+                f"{memory(result['peak_memory'])}  {int(result['calls']):6d}"
+            )
+
+        if self.total:
+            lines.append(
+                f"{'total':<{width}}  {self.total['wall']:9.3f}  {self.total['cpu']:9.3f}  "
+                f"{memory(self.total['peak_memory'])}"
+            )
+
+        if self.counts:
+            lines.append("")
+            lines.extend(f"{name}: {value}" for name, value in self.counts.items())
+
+        return "\n".join(lines)
+
+
+def profile_stage(profiler: Optional[Profiler], name: str) -> ContextManager:
+    """`Profiler.stage` if the profiler is given, otherwise a block without measurement."""
+
+    if profiler is None:
+        return nullcontext()
+
+    return profiler.stage(name)
+
+
+def profile_iter(profiler: Optional[Profiler], name: str, items: Iterable[T]) -> Iterable[T]:
+    """`Profiler.iterate` if the profiler is given, otherwise the iterable as is."""
+
+    if profiler is None:
+        return items
+
+    return profiler.iterate(name, items)
@@ -0,0 +1,76 @@
+"""Strongly connected components of a directed graph."""
+
+from typing import Dict, Hashable, Iterable, Iterator, List, Mapping, Set, Tuple, TypeVar
+
+__all__ = [
+    "strongly_connected_components",
+]
+
+
+T = TypeVar("T", bound=Hashable)
+
+
+def strongly_connected_components(graph: Mapping[T, Iterable[T]]) -> List[List[T]]:
+    """Find strongly connected components of a graph (Tarjan's algorithm without recursion).
+
+    Components are returned in the reverse topological order: each component
+    goes after all components reachable from it. A node which is only a
+    successor of other nodes has no successors.
+
+    Args:
+        graph: node --> successors of the node.
+
+    """
+
+    index: Dict[T, int] = {}
+    lowlink: Dict[T, int] = {}
+    stack: List[T] = []
+    on_stack: Set[T] = set()
+    result: List[List[T]] = []
+
+    def visit(node: T) -> Tuple[T, Iterator[T]]:
+        index[node] = lowlink[node] = len(index)
+        stack.append(node)
+        on_stack.add(node)
+
+        return node, iter(graph.get(node, ()))
+
+    for root in graph:
+        if root in index:
+            continue
+
+        # (node, an iterator over its successors which are not visited yet)
+        work = [visit(root)]
+
+        while work:
+            node, successors = work[-1]
+
+            for successor in successors:
+                if successor not in index:
+                    work.append(visit(successor))
+                    break
+
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+
+            else:
+                work.pop()
+
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index[node]:
+                    component: List[T] = []
+
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+
+                        if member == node:
+                            break
+
+                    result.append(component)
+
+    return result
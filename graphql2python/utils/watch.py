@@ -0,0 +1,88 @@
+"""Polling of files for changes."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+__all__ = [
+    "watch_files",
+]
+
+
+# path --> (mtime in ns, size) or None for a missing file
+_Snapshot = Dict[Path, Optional[Tuple[int, int]]]
+
+
+def _snapshot(paths: Iterable[Path]) -> _Snapshot:
+    result: _Snapshot = {}
+
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            result[path] = None
+        else:
+            result[path] = (stat.st_mtime_ns, stat.st_size)
+
+    return result
+
+
+def _changed(old: _Snapshot, new: _Snapshot) -> Set[Path]:
+    return {path for path in old.keys() | new.keys() if old.get(path) != new.get(path)}
+
+
+def watch_files(
+    get_paths: Callable[[], Iterable[Path]],
+    on_change: Callable[[Set[Path]], None],
+    interval: float = 0.5,
+    debounce: float = 0.3,
+    stop_event: Optional[threading.Event] = None,
+) -> None:
+    """Call `on_change` each time some of watched files are changed.
+
+    Files are polled by their modification time and size. A burst of changes
+    (for example, an editor that writes a file in several steps) results in
+    one call after the files have been unchanged for `debounce` seconds.
+
+    Args:
+        get_paths: returns paths for watching; it is called again after each change.
+        on_change: a callback with the set of changed paths.
+        interval: the polling interval in seconds.
+        debounce: the quiet period before the callback in seconds.
+        stop_event: stop watching when this event is set.
+
+    """
+
+    if stop_event is None:
+        stop_event = threading.Event()
+
+    snapshot = _snapshot(get_paths())
+
+    while not stop_event.wait(interval):
+        new_snapshot = _snapshot(snapshot.keys())
+        changed = _changed(snapshot, new_snapshot)
+
+        if not changed:
+            continue
+
+        # wait until files are not changed for the debounce period
+        quiet_since = time.monotonic()
+
+        while time.monotonic() - quiet_since < debounce:
+            if stop_event.wait(min(interval, debounce)):
+                return
+
+            last_snapshot = _snapshot(snapshot.keys())
+
+            if _changed(new_snapshot, last_snapshot):
+                changed |= _changed(new_snapshot, last_snapshot)
+                new_snapshot = last_snapshot
+                quiet_since = time.monotonic()
+
+        on_change(changed)
+
+        # changes made while `on_change` was running are found on the next poll
+        paths = list(get_paths())
+        snapshot = _snapshot(path for path in paths if path not in new_snapshot)
+        snapshot.update((path, new_snapshot[path]) for path in paths if path in new_snapshot)
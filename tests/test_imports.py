@@ -12,10 +12,12 @@ from graphql2python.imports import (
     IMPORT_LITERAL,
     IMPORT_OPTIONAL,
     IMPORT_TIME,
+    IMPORT_TYPING_MODULE,
     IMPORT_UNION,
     IMPORT_UUID,
     Import,
-    Imports
+    Imports,
+    pytype_import
 )
 
 
@@ -71,3 +73,39 @@ def test_alias():
 from datetime import datetime as default_datetime"""
 
     assert str(imports_) == result
+
+
+def test_dump_sections():
+    imports_ = Imports()
+
+    imports_.append(Import.from_full_path("pydantic.Field"))
+    imports_.append(Import(import_="typing", alias="_t"))
+    imports_.append(IMPORT_DATETIME)
+    imports_.append(Import.from_full_path("pydantic.BaseModel"))
+    imports_.append(Import(import_="enum"))
+    imports_.append(IMPORT_DATE)
+
+    result = """import enum
+import typing as _t
+from datetime import date, datetime
+
+from pydantic import BaseModel, Field"""
+
+    assert imports_.dump_sections() == result
+
+
+@pytest.mark.parametrize(
+    "pytype, result",
+    [
+        ("str", None),
+        ("date", IMPORT_DATE),
+        ("Decimal", IMPORT_DECIMAL),
+        ("decimal.Decimal", IMPORT_DECIMAL),
+        ("my.types.Money", Import(from_="my.types", import_="Money")),
+        ("_t.Any", IMPORT_TYPING_MODULE),
+        ("_t.Dict[str, _t.Any]", IMPORT_TYPING_MODULE),
+        ("typing.Dict[str, int]", None),
+    ]
+)
+def test_pytype_import(pytype: str, result):
+    assert pytype_import(pytype) == result
@@ -0,0 +1,62 @@
+import copy
+import importlib.util
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List
+
+import pytest
+
+SEARCH_RESPONSE = {
+    "hero": {"__typename": "Droid", "id": "1", "name": "R2-D2", "primary_function": "Astromech"},
+    "best": {"__typename": "Starship", "id": "2", "name": "X-wing"},
+    "results": [
+        {
+            "__typename": "Human",
+            "id": "3",
+            "name": "Luke",
+            "friends": [{"__typename": "Droid", "id": "1", "name": "R2-D2"}, None],
+            "totalCredits": 100,
+        },
+    ],
+}
+
+
+@pytest.fixture
+def search_schema_path() -> Path:
+    """The schema of the discriminated unions example with the Search type."""
+
+    return Path(
+        os.path.join(os.path.dirname(__file__), "tests_docs_examples", "test_discriminated_unions", "input.graphql")
+    )
+
+
+@pytest.fixture
+def search_response() -> Dict[str, Any]:
+    """A Search response of search_schema_path with the primary_function alias of Droid.primaryFunction."""
+
+    return copy.deepcopy(SEARCH_RESPONSE)
+
+
+@pytest.fixture
+def load_module() -> Iterator[Callable[[Path], ModuleType]]:
+    """Execute generated python files as modules, they are removed from sys.modules after the test."""
+
+    names: List[str] = []
+
+    def _load(output_path: Path) -> ModuleType:
+        spec = importlib.util.spec_from_file_location(output_path.stem, output_path)
+        module = importlib.util.module_from_spec(spec)  # type: ignore
+
+        # type hints of classes are resolved through sys.modules
+        sys.modules[output_path.stem] = module
+        names.append(output_path.stem)
+        spec.loader.exec_module(module)  # type: ignore
+
+        return module
+
+    yield _load
+
+    for name in names:
+        sys.modules.pop(name, None)
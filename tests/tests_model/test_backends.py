@@ -0,0 +1,172 @@
+import json
+import sys
+import typing as _t
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+from graphql import GraphQLField, GraphQLInterfaceType, GraphQLList, GraphQLNonNull, GraphQLScalarType
+
+from graphql2python.model.backends import DataclassRender, FastPydanticV2Render, MsgspecRender, PydanticV2Render
+from graphql2python.model.config import GraphQL2PythonModelConfig
+from graphql2python.model.generate import Generator
+
+scalars_schema_str = """
+type Stats {
+  count: Int!
+  ratio: Float!
+  active: Boolean!
+  label: String
+}
+"""
+
+
+def _generate_module(
+    load_module: _t.Callable[[Path], ModuleType], schema: Path, output_path: Path, backend: str
+) -> ModuleType:
+    config = GraphQL2PythonModelConfig(
+        schema=schema,
+        output=output_path,
+        options={
+            "backend": backend,
+            "add_from_dict": True,
+            "add_to_dict": True,
+            "fields_setting": {"Droid": {"primaryFunction": {"alias": "primary_function"}}},
+        },
+    )
+    Generator(config).generate()
+
+    return load_module(output_path)
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        pytest.param(
+            "dataclass_slots",
+            marks=pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+"),
+        ),
+        "msgspec",
+    ],
+)
+def test_backend_decode(tmp_path: Path, backend: str, load_module, search_schema_path: Path, search_response: dict):
+    if backend == "msgspec":
+        pytest.importorskip("msgspec")
+
+    model = _generate_module(load_module, search_schema_path, tmp_path / f"model_{backend}.py", backend)
+
+    search = model.decode(json.dumps(search_response), model.Search)
+
+    assert isinstance(search.hero, model.Droid)
+    assert search.hero.primaryFunction == "Astromech"
+    assert isinstance(search.best, model.Starship)
+    assert isinstance(search.results[0], model.Human)
+    assert isinstance(search.results[0].friends[0], model.Droid)
+    assert search.results[0].friends[1] is None
+    assert search.results[0].totalCredits == 100
+    assert not hasattr(search, "__dict__")
+
+    assert model.Search.from_dict(search_response) == search
+    assert search.to_dict()["hero"]["primary_function"] == "Astromech"
+    assert search.to_dict()["hero"]["__typename"] == "Droid"
+
+    # built-in scalars are decoded to their python types
+    scalars_schema_path = tmp_path / "scalars.graphql"
+    scalars_schema_path.write_text(scalars_schema_str, encoding="utf-8")
+    scalars_model = _generate_module(
+        load_module, scalars_schema_path, tmp_path / f"model_scalars_{backend}.py", backend
+    )
+
+    stats = scalars_model.decode(
+        json.dumps({"count": 3, "ratio": 0.5, "active": True, "label": None}), scalars_model.Stats
+    )
+
+    assert (scalars_model.Int, scalars_model.Float, scalars_model.Boolean) == (int, float, bool)
+    assert (stats.count, stats.ratio, stats.active, stats.label) == (3, 0.5, True, None)
+    assert scalars_model.Stats.from_dict({"count": 3, "ratio": 0.5, "active": True}) == stats
+
+
+def _pydantic_major() -> int:
+    pydantic = pytest.importorskip("pydantic")
+    return int(pydantic.VERSION.split(".")[0])
+
+
+def test_pydantic_v2_output(tmp_path: Path, search_schema_path: Path):
+    """The pydantic v2 output has v2 config and model_rebuild instead of v1 methods."""
+
+    output_path = tmp_path / "model_v2.py"
+    config = GraphQL2PythonModelConfig(
+        schema=search_schema_path, output=output_path, options={"backend": "pydantic_v2", "add_from_dict": True}
+    )
+    Generator(config).generate()
+
+    output = output_path.read_text(encoding="utf-8")
+
+    assert "from pydantic import BaseModel, ConfigDict, Field, TypeAdapter\n" in output
+    assert "\nInt = int\n" in output
+    assert "\nString = str\n" in output
+    assert (
+        "    model_config = ConfigDict(populate_by_name=True, coerce_numbers_to_str=True, protected_namespaces=())\n"
+        in output
+    )
+    assert "        return cls.model_validate(obj)\n" in output
+    assert "\nSearch.model_rebuild()\n" in output
+    assert "class Config" not in output
+    assert "update_forward_refs" not in output
+
+    compile(output, str(output_path), "exec")
+
+    jinja2_config = GraphQL2PythonModelConfig(
+        schema=search_schema_path,
+        output=tmp_path / "model_v2_jinja2.py",
+        options={"backend": "pydantic_v2", "add_from_dict": True, "renderer": "jinja2"},
+    )
+    Generator(jinja2_config).generate()
+
+    assert jinja2_config.output.read_text(encoding="utf-8") == output
+
+
+def test_pydantic_v2_decode(tmp_path: Path, load_module, search_schema_path: Path, search_response: dict):
+    if _pydantic_major() < 2:
+        pytest.skip("pydantic v2 is not installed")
+
+    model = _generate_module(load_module, search_schema_path, tmp_path / "model_pydantic_v2.py", "pydantic_v2")
+
+    search = model.decode(json.dumps(search_response), model.Search)
+
+    assert isinstance(search.hero, model.Droid)
+    assert search.hero.primaryFunction == "Astromech"
+    assert isinstance(search.results[0].friends[0], model.Droid)
+    assert model.convert([search_response["best"]], _t.List[model.Starship])[0].name == "X-wing"
+
+    assert model.Search.from_dict(search_response) == search
+    assert search.to_dict()["hero"]["primary_function"] == "Astromech"
+    assert model.to_builtins(search)["hero"]["__typename"] == "Droid"
+
+
+@pytest.mark.parametrize("render", [PydanticV2Render, FastPydanticV2Render])
+def test_pydantic_v2_render_footer(render):
+    assert render.render_footer(["A", "B"]) == "A.model_rebuild()\nB.model_rebuild()\n"
+
+
+@pytest.mark.parametrize(
+    "render, alias, result",
+    [
+        (DataclassRender, None, "    f: _t.Optional['S'] = None"),
+        (DataclassRender, "a", "    f: _t.Optional['S'] = dataclasses.field(default=None, metadata={'alias': 'a'})"),
+        (MsgspecRender, None, "    f: _t.Optional['S'] = None"),
+        (MsgspecRender, "a", "    f: _t.Optional['S'] = msgspec.field(default=None, name='a')"),
+    ],
+)
+def test_backend_render_field(render, alias, result: str):
+    field = GraphQLField(type_=GraphQLScalarType('S'))
+    assert render().render_field('f', field, alias=alias) == result
+
+
+def test_backend_render_field_interface():
+    """An interface in a field is replaced by the union of its possible types."""
+
+    field = GraphQLField(type_=GraphQLNonNull(GraphQLList(GraphQLInterfaceType('I', {}))))
+
+    result = "    f: _t.List[_t.Optional[_t.Union['A', 'B']]]"
+    assert MsgspecRender(possible_types={'I': ['A', 'B']}).render_field('f', field) == result
@@ -0,0 +1,43 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from graphql2python.model.batch import generate_batch
+from graphql2python.model.config import GraphQL2PythonModelConfig
+
+schema_path = Path(os.path.join(os.path.dirname(__file__), "tests_docs_examples", "test_interfaces", "input.graphql"))
+output_path = Path(os.path.join(os.path.dirname(__file__), "tests_docs_examples", "test_interfaces", "output.py"))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_batch(tmp_path: Path, workers: int):
+    configs = [
+        GraphQL2PythonModelConfig(schema=schema_path, output=tmp_path / "first.py"),
+        GraphQL2PythonModelConfig(schema=schema_path, output=tmp_path / "missing" / "second.py"),
+        GraphQL2PythonModelConfig(schema=schema_path, output=tmp_path / "third.py"),
+    ]
+
+    results = list(generate_batch(configs, workers))
+
+    assert [result.config.output for result in results] == [config.output for config in configs]
+    assert results[0].error is None
+    assert results[1].error is not None
+    assert results[2].error is None
+
+    expected_output = output_path.read_text(encoding="utf-8")
+    assert (tmp_path / "first.py").read_text(encoding="utf-8") == expected_output
+    assert (tmp_path / "third.py").read_text(encoding="utf-8") == expected_output
+
+
+def test_check_batch(tmp_path: Path):
+    configs = [
+        GraphQL2PythonModelConfig(schema=schema_path, output=tmp_path / "first.py"),
+        GraphQL2PythonModelConfig(schema=schema_path, output=tmp_path / "second.py"),
+    ]
+    (tmp_path / "first.py").write_text(output_path.read_text(encoding="utf-8"), encoding="utf-8")
+
+    results = list(generate_batch(configs, check=True))
+
+    assert [result.changed for result in results] == [(), (tmp_path / "second.py",)]
+    assert not (tmp_path / "second.py").exists()
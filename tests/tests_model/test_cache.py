@@ -0,0 +1,101 @@
+import os
+from pathlib import Path
+
+from graphql import build_ast_schema, parse, print_ast
+
+from graphql2python.model.cache import SchemaCache
+
+schema_str = "type Query {\n  a: String\n}\n"
+
+
+def test_schema_cache(tmp_path: Path):
+    cache = SchemaCache(tmp_path)
+
+    document = cache.parse(schema_str)
+    assert document == parse(schema_str, no_location=True)
+    assert len(list(tmp_path.glob("schema-*.json"))) == 1
+
+    # the second call loads the schema from the file
+    assert cache.parse(schema_str) == document
+
+
+def test_schema_cache_broken_file(tmp_path: Path):
+    cache = SchemaCache(tmp_path)
+    cache.parse(schema_str)
+
+    for path in tmp_path.glob("schema-*.json"):
+        path.write_bytes(b"broken")
+
+    assert cache.parse(schema_str) == parse(schema_str, no_location=True)
+
+
+def test_schema_cache_eviction(tmp_path: Path):
+    """Least recently used schemas are removed first."""
+
+    cache = SchemaCache(tmp_path)
+    cache.parse(schema_str)
+
+    old_path = next(tmp_path.glob("schema-*.json"))
+    os.utime(old_path, (0, 0))
+
+    cache.max_size = old_path.stat().st_size + 1
+    cache.parse("type Query {\n  b: String\n}\n")
+    cache.evict()
+
+    paths = list(tmp_path.glob("schema-*.json"))
+    assert len(paths) == 1
+    assert paths[0] != old_path
+
+
+def test_schema_cache_document(tmp_path: Path):
+    """A document with all kinds of definitions is the same after the cache file."""
+
+    schema_str = '''
+    """A schema"""
+    schema { query: Query }
+    directive @tag(name: String = "x") repeatable on FIELD_DEFINITION | OBJECT
+    scalar Date @specifiedBy(url: "https://example.com")
+    enum Episode { NEWHOPE JEDI @deprecated }
+    interface Node { id: ID! }
+    type Query implements Node @tag { id: ID! episodes(first: Int = 10, ids: [ID!] = ["1"]): [Episode!]! date: Date }
+    union Item = Query
+    input Filter { episode: Episode = JEDI, flag: Boolean = true, ratio: Float = 1.5, nested: Filter = null }
+    '''
+
+    SchemaCache(tmp_path).parse(schema_str)
+    document = SchemaCache(tmp_path).parse(schema_str)
+
+    assert document == parse(schema_str, no_location=True)
+    assert print_ast(document) == print_ast(parse(schema_str))
+    build_ast_schema(document)
+
+
+def test_schema_cache_no_code(tmp_path: Path):
+    """A cache file can have only AST nodes, other classes are not created."""
+
+    cache = SchemaCache(tmp_path)
+    cache.parse(schema_str)
+
+    for path in tmp_path.glob("schema-*.json"):
+        path.write_text('{"": "Path", "value": "x"}', encoding="utf-8")
+
+    assert cache.parse(schema_str) == parse(schema_str, no_location=True)
+
+
+def test_schema_cache_eviction_removed_file(tmp_path: Path, monkeypatch):
+    """A file removed by another process during eviction is skipped."""
+
+    cache = SchemaCache(tmp_path, max_size=0)
+    cache.parse(schema_str)
+
+    path = next(tmp_path.glob("schema-*.json"))
+    unlink = Path.unlink
+
+    def unlink_twice(self, *args, **kwargs):
+        unlink(self, *args, **kwargs)
+        unlink(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "unlink", unlink_twice)
+    cache.evict()
+
+    assert not path.exists()
@@ -27,3 +27,36 @@ def test_schema_validation_correct():
     )
 
     assert isinstance(config.graphql_schema, Path)
+
+
+def test_output_package_validation():
+    config = GraphQL2PythonModelConfig(schema=static_folder / "example.graphql", output=static_folder / "package")
+
+    assert config.output_is_package
+
+    with pytest.raises(ValueError):
+        GraphQL2PythonModelConfig(
+            schema=static_folder / "example.graphql",
+            output=static_folder / "package",
+            options={"backend": "msgspec"},
+        )
+
+
+def test_schema_validation_several_files(tmp_path: Path):
+    (tmp_path / "a.graphql").write_text("type A { a: Int }", encoding="utf-8")
+    (tmp_path / "b.graphql").write_text("type B { b: Int }", encoding="utf-8")
+    (tmp_path / "schema.json").write_text("{}", encoding="utf-8")
+
+    config = GraphQL2PythonModelConfig(schema=str(tmp_path / "*.graphql"), output=tmp_path / "output.py")
+    assert config.schema_paths == [tmp_path / "a.graphql", tmp_path / "b.graphql"]
+
+    config = GraphQL2PythonModelConfig(schema=tmp_path / "schema.json", output=tmp_path / "output.py")
+    assert config.schema_paths == [tmp_path / "schema.json"]
+
+    with pytest.raises(ValueError):
+        GraphQL2PythonModelConfig(
+            schema=[tmp_path / "a.graphql", tmp_path / "schema.json"], output=tmp_path / "output.py"
+        )
+
+    with pytest.raises(ValueError):
+        GraphQL2PythonModelConfig(schema=str(tmp_path / "*.gql"), output=tmp_path / "output.py")
@@ -14,6 +14,15 @@ from graphql2python.model.render import template_env
         "union.jinja2",
         "interface.jinja2",
         "object.jinja2",
+        "dataclass_slots/general.jinja2",
+        "dataclass_slots/interface.jinja2",
+        "dataclass_slots/object.jinja2",
+        "dataclass_slots/decoder.jinja2",
+        "msgspec/general.jinja2",
+        "msgspec/interface.jinja2",
+        "msgspec/object.jinja2",
+        "msgspec/decoder.jinja2",
+        "package_init.jinja2",
     ],
 )
 def test_exist_templates_for_model(template_name: str):
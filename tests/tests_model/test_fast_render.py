@@ -0,0 +1,51 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from graphql2python.model.config import GraphQL2PythonModelConfig
+from graphql2python.model.fast_render import FastDataModelRender
+from graphql2python.model.generate import Generator
+from graphql2python.model.render import DataModelRender
+
+tests_folder = Path(os.path.dirname(__file__))
+docs_examples_folder = tests_folder / "tests_docs_examples"
+
+
+@pytest.mark.parametrize(
+    "schema_path",
+    [
+        tests_folder / "static" / "render_features.graphql",
+        docs_examples_folder / "test_custom_scalar" / "input.graphql",
+        docs_examples_folder / "test_discriminated_unions" / "input.graphql",
+        docs_examples_folder / "test_interfaces" / "input.graphql",
+        docs_examples_folder / "test_unique_union" / "input.graphql",
+    ],
+)
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"discriminated_unions": True},
+        {"each_field_optional": True, "max_line_len": 40},
+        {"fields_setting": {"Human": {"homePlanet": {"alias": "home_planet"}, "class": {"new_name": "klass"}}}},
+    ],
+)
+def test_fast_render_output(tmp_path: Path, schema_path: Path, options: dict):
+    """The python renderer gives the byte-identical output to jinja2 templates."""
+
+    jinja2_config = GraphQL2PythonModelConfig(
+        schema=schema_path, output=tmp_path / "jinja2.py", options={**options, "renderer": "jinja2"}
+    )
+    python_config = GraphQL2PythonModelConfig(schema=schema_path, output=tmp_path / "python.py", options=options)
+
+    jinja2_generator = Generator(jinja2_config)
+    python_generator = Generator(python_config)
+
+    assert type(jinja2_generator.render) is DataModelRender  # pylint: disable=unidiomatic-typecheck
+    assert isinstance(python_generator.render, FastDataModelRender)
+
+    jinja2_generator.generate()
+    python_generator.generate()
+
+    assert python_config.output.read_bytes() == jinja2_config.output.read_bytes()
@@ -0,0 +1,508 @@
+import decimal
+import importlib
+import json
+import os
+import pstats
+import sys
+import uuid
+from concurrent.futures import Future
+from pathlib import Path
+from typing import List
+
+import pytest
+from graphql import build_schema, introspection_from_schema
+
+import graphql2python.model.generate as generate_module
+from graphql2python.imports import Import
+from graphql2python.model.cache import RenderCache
+from graphql2python.model.config import GraphQL2PythonModelConfig
+from graphql2python.model.generate import Generator, GraphQLSchemaTypeMap, PackageLayout, SupportTypes
+from graphql2python.utils.profile import Profiler
+
+schema_path = Path(os.path.join(os.path.dirname(__file__), "tests_docs_examples", "test_interfaces", "input.graphql"))
+
+
+def _generate(output_path: Path, **options) -> str:
+    config = GraphQL2PythonModelConfig(schema=schema_path, output=output_path, options=options)
+
+    Generator(config).generate()
+
+    return output_path.read_text(encoding="utf-8")
+
+
+def test_generate_with_workers(tmp_path: Path):
+    """Parallel render gives the same output as the serial one."""
+
+    serial_output = _generate(tmp_path / "serial.py")
+    parallel_output = _generate(tmp_path / "parallel.py", workers=2)
+
+    assert parallel_output == serial_output
+
+
+def test_generate_package_with_workers(tmp_path: Path):
+    """Types of a package are rendered module by module with the same output in worker processes."""
+
+    for name, workers in (("serial", 1), ("parallel", 2)):
+        config = GraphQL2PythonModelConfig(schema=schema_path, output=tmp_path / name, options={"workers": workers})
+        (tmp_path / name).mkdir()
+        Generator(config).generate()
+
+    serial = {path.name: path.read_text(encoding="utf-8") for path in (tmp_path / "serial").glob("*.py")}
+    parallel = {path.name: path.read_text(encoding="utf-8") for path in (tmp_path / "parallel").glob("*.py")}
+
+    assert parallel == serial
+
+
+def test_render_chunks_pending():
+    """Only a few chunks are submitted ahead of the consumer of rendered types."""
+
+    class Executor:
+        def __init__(self):
+            self.submitted = 0
+
+        def submit(self, function, *args):
+            self.submitted += 1
+            future = Future()
+            future.set_result([f"{self.submitted}"])
+            return future
+
+    executor = Executor()
+    rendered = Generator._render_chunks(executor, None, ([str(i)] for i in range(10)), 3)  # type: ignore
+
+    assert next(rendered) == "1"
+    assert executor.submitted == 3
+    assert list(rendered) == [str(i) for i in range(2, 11)]
+
+
+def test_render_chunks_cancel():
+    """Pending chunks are cancelled if the render is stopped early."""
+
+    futures: List[Future] = []
+
+    class Executor:
+        def submit(self, function, *args):
+            futures.append(Future())
+
+            # only the first chunk is rendered
+            if len(futures) == 1:
+                futures[0].set_result(["0"])
+
+            return futures[-1]
+
+    rendered = Generator._render_chunks(Executor(), None, ([str(i)] for i in range(10)), 3)  # type: ignore
+
+    assert next(rendered) == "0"
+    rendered.close()
+
+    assert len(futures) == 3
+    assert all(future.cancelled() for future in futures[1:])
+
+
+def test_init_worker(monkeypatch):
+    """A spawned worker builds the schema of the parsed document without parsing schema files."""
+
+    config = GraphQL2PythonModelConfig(schema=schema_path, output=Path("output.py"), options={"workers": 2})
+    generator = Generator(config)
+
+    assert generator._document is not None  # pylint: disable=protected-access
+
+    def parse_schema(*_args, **_kwargs):
+        raise AssertionError("the schema is parsed again")
+
+    monkeypatch.setattr(generate_module, "_parse_schema", parse_schema)
+    monkeypatch.setattr(generate_module, "_worker_generator", None)
+
+    worker_config = config.copy(update={"options": config.options.copy(update={"workers": 1})})
+    generate_module._init_worker(worker_config, generator._document)  # pylint: disable=protected-access
+    worker_generator = generate_module._worker_generator  # pylint: disable=protected-access
+
+    assert worker_generator is not None
+    assert worker_generator.config.options.workers == 1
+    assert list(worker_generator.type_map.types) == list(generator.type_map.types)
+    assert worker_generator._render_type("Droid") == generator._render_type("Droid")  # pylint: disable=protected-access
+
+
+def test_generate_with_render_cache(tmp_path: Path):
+    """Only types with changed fingerprints are rendered again."""
+
+    output_path = tmp_path / "output.py"
+    config = GraphQL2PythonModelConfig(schema=schema_path, output=output_path, cache_dir=tmp_path / "cache")
+
+    Generator(config).generate()
+    first_output = output_path.read_text(encoding="utf-8")
+
+    generator = Generator(config)
+    generator.generate()
+
+    assert generator.render_cache is not None
+    assert generator.render_cache.misses == 0
+    assert output_path.read_text(encoding="utf-8") == first_output
+
+    options = {"fields_setting": {"Droid": {"primaryFunction": {"alias": "primary_function"}}}}
+    config = GraphQL2PythonModelConfig(
+        schema=schema_path, output=output_path, cache_dir=tmp_path / "cache", options=options
+    )
+
+    generator = Generator(config)
+    generator.generate()
+
+    assert generator.render_cache is not None
+    assert generator.render_cache.misses == 1
+    assert output_path.read_text(encoding="utf-8") == _generate(tmp_path / "expected.py", **options)
+
+
+def test_generate_with_render_cache_set_later(tmp_path: Path):
+    """A render cache can be set after the generator is created (as in the watch mode)."""
+
+    output_path = tmp_path / "output.py"
+    generator = Generator(GraphQL2PythonModelConfig(schema=schema_path, output=output_path))
+    generator.render_cache = RenderCache()
+
+    generator.generate()
+    first_output = output_path.read_text(encoding="utf-8")
+    misses = generator.render_cache.misses
+
+    generator.generate()
+
+    assert generator.render_cache.misses == misses
+    assert generator.render_cache.hits == misses
+    assert output_path.read_text(encoding="utf-8") == first_output
+
+
+def test_generate_package(tmp_path: Path):
+    """Types of an output package are imported on first access with the types they reference."""
+
+    package_path = tmp_path / "starwars"
+    package_path.mkdir()
+    (package_path / "_Removed.py").write_text('"""Auto-generated by graphql2python."""\n', encoding="utf-8")
+    (package_path / "_custom.py").write_text("", encoding="utf-8")
+
+    Generator(GraphQL2PythonModelConfig(schema=schema_path, output=package_path)).generate()
+
+    assert not (package_path / "_Removed.py").exists()
+    assert (package_path / "_custom.py").exists()
+
+    sys.path.insert(0, str(tmp_path))
+
+    try:
+        package = importlib.import_module("starwars")
+
+        assert sorted(name for name in sys.modules if name.startswith("starwars.")) == ["starwars._base"]
+
+        assert package.Starship(id="1", name="X-wing").name == "X-wing"
+        assert sorted(name for name in sys.modules if name.startswith("starwars.")) == [
+            "starwars._Starship",
+            "starwars._base",
+        ]
+
+        human = package.Human.parse_obj({"id": "1", "name": "Luke", "appearsIn": ["JEDI"], "friends": [None]})
+        assert human.appearsIn == [package.Episode.JEDI]
+        assert "Human" in dir(package)
+
+    finally:
+        sys.path.remove(str(tmp_path))
+
+        for name in [name for name in sys.modules if name.split(".")[0] == "starwars"]:
+            del sys.modules[name]
+
+
+def test_generate_package_module_names(tmp_path: Path):
+    """Module names are unique ignoring case and differ from type names."""
+
+    schema_str = """
+    type base { id: ID }
+    type _base { id: ID }
+    type Foo { id: ID }
+    type foo { id: ID }
+    type Holder { a: base b: _base c: Foo d: foo }
+    """
+    sdl_path = tmp_path / "schema.graphql"
+    sdl_path.write_text(schema_str, encoding="utf-8")
+
+    package_path = tmp_path / "names"
+    package_path.mkdir()
+    (package_path / "__Removed.py").write_text('"""Auto-generated by graphql2python."""\n', encoding="utf-8")
+
+    generator = Generator(GraphQL2PythonModelConfig(schema=sdl_path, output=package_path))
+    generator.generate()
+
+    layout = PackageLayout(generator.type_map)
+    modules = [layout.base_module] + list(layout.modules)
+
+    assert layout.base_module == "_base_2"
+    assert len({module.lower() for module in modules}) == len(modules)
+    assert not set(modules) & set(generator.type_map.types)
+    assert sorted(path.stem for path in package_path.glob("_*.py")) == sorted(modules + ["__init__"])
+
+    sys.path.insert(0, str(tmp_path))
+
+    try:
+        package = importlib.import_module("names")
+        holder = package.Holder.parse_obj({"a": {"id": "1"}, "b": {"id": "2"}, "c": {"id": "3"}, "d": {"id": "4"}})
+
+        assert isinstance(holder.b, package._base)  # pylint: disable=protected-access
+        assert isinstance(holder.c, package.Foo)
+        assert isinstance(holder.d, package.foo)
+
+    finally:
+        sys.path.remove(str(tmp_path))
+
+        for name in [name for name in sys.modules if name.split(".")[0] == "names"]:
+            del sys.modules[name]
+
+
+def test_generate_ordered_classes(tmp_path: Path, load_module):
+    """Types go after types they reference, forward references are only in cycles."""
+
+    schema_str = """
+    interface Node { id: ID! parent: Node }
+    type User implements Node { id: ID! parent: Node name: String }
+    type Tag { label: String }
+    type Post { title: String tags: [Tag!]! author: Author }
+    type Author { name: String posts: [Post] }
+    union Item = Tag | Post
+    type Feed { items: [Item] first: Tag }
+    """
+    sdl_path = tmp_path / "schema.graphql"
+    sdl_path.write_text(schema_str, encoding="utf-8")
+
+    output_path = tmp_path / "model_ordered.py"
+    config = GraphQL2PythonModelConfig(schema=sdl_path, output=output_path, options={"ordered_classes": True})
+    Generator(config).generate()
+
+    output = output_path.read_text(encoding="utf-8")
+
+    assert output.index("class Tag(") < output.index("class Post(") < output.index("Item = ")
+    assert output.index("Item = ") < output.index("class Feed(")
+    assert "    tags: _t.List[Tag]\n" in output
+    assert "    author: _t.Optional['Author'] = Field(default=None)\n" in output
+    assert "    items: _t.Optional[_t.List[_t.Optional[Item]]] = Field(default_factory=list)\n" in output
+
+    # User inherits the forward reference of Node
+    assert output.endswith(
+        "\n\n\nAuthor.update_forward_refs()\nPost.update_forward_refs()\n"
+        "Node.update_forward_refs()\nUser.update_forward_refs()\n"
+    )
+
+    model = load_module(output_path)
+
+    feed = model.Feed.parse_obj({"items": [{"title": "A", "tags": [], "author": {"posts": [{"tags": []}]}}]})
+    assert isinstance(feed.items[0].author.posts[0], model.Post)
+    assert isinstance(model.User.parse_obj({"id": "1", "parent": {"id": "2"}}).parent, model.Node)
+
+    parallel_config = GraphQL2PythonModelConfig(
+        schema=sdl_path, output=tmp_path / "parallel.py", options={"ordered_classes": True, "workers": 2}
+    )
+    Generator(parallel_config).generate()
+
+    assert parallel_config.output.read_text(encoding="utf-8") == output
+
+
+def test_interface_fields_index():
+    """Fields of interfaces include fields of their interfaces."""
+
+    schema = build_schema(
+        """
+        interface Node { id: ID! }
+        interface Entity implements Node { id: ID! name: String }
+        type User implements Entity & Node { id: ID! name: String email: String }
+        """
+    )
+
+    type_map = GraphQLSchemaTypeMap()
+    type_map.build(schema)
+
+    assert type_map.interface_fields == {"Node": frozenset({"id"}), "Entity": frozenset({"id", "name"})}
+
+    generator = Generator(
+        GraphQL2PythonModelConfig(schema=schema_path, output=Path("output.py")),
+        schema=schema,
+    )
+    user = generator.render.render_object(schema.get_type("User"), {})  # type: ignore
+
+    assert "    email: _t.Optional['String'] = Field(default=None)" in user
+    assert "name:" not in user
+
+
+def test_generate_from_introspection(tmp_path: Path):
+    """An introspection result gives the same output as SDL."""
+
+    # introspection needs the query type
+    sdl_path = tmp_path / "schema.graphql"
+    sdl_path.write_text(
+        schema_path.read_text(encoding="utf-8") + "\ntype Query { hero: Character }\n", encoding="utf-8"
+    )
+
+    introspection_path = tmp_path / "schema.json"
+    introspection = {"data": introspection_from_schema(build_schema(sdl_path.read_text(encoding="utf-8")))}
+    introspection_path.write_text(json.dumps(introspection), encoding="utf-8")
+
+    sdl_config = GraphQL2PythonModelConfig(schema=sdl_path, output=tmp_path / "sdl.py")
+    introspection_config = GraphQL2PythonModelConfig(schema=introspection_path, output=tmp_path / "introspection.py")
+
+    Generator(sdl_config).generate()
+    Generator(introspection_config).generate()
+
+    assert introspection_config.output.read_text(encoding="utf-8") == sdl_config.output.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_from_several_files(tmp_path: Path, workers: int):
+    """SDL files from a glob pattern are merged in one schema."""
+
+    schema_folder = tmp_path / "schema"
+    schema_folder.mkdir()
+
+    # each definition to its own file
+    for i, definition in enumerate(schema_path.read_text(encoding="utf-8").split("\n\n")):
+        (schema_folder / f"part_{i}.graphql").write_text(definition, encoding="utf-8")
+
+    config = GraphQL2PythonModelConfig(
+        schema=str(schema_folder / "*.graphql"), output=tmp_path / "output.py", options={"workers": workers}
+    )
+    assert len(config.schema_paths) > 1
+
+    Generator(config).generate()
+
+    assert config.output.read_text(encoding="utf-8") == _generate(tmp_path / "expected.py")
+
+
+def test_generate_with_profiler(tmp_path: Path):
+    """The profiler does not change the output, and it counts rendered types and fields."""
+
+    output = _generate(tmp_path / "output.py")
+
+    config = GraphQL2PythonModelConfig(schema=schema_path, output=tmp_path / "profiled.py")
+    dump_path = tmp_path / "render.pstats"
+
+    with Profiler(cprofile_path=dump_path) as profiler:
+        Generator(config, profiler=profiler).generate()
+
+    assert config.output.read_text(encoding="utf-8") == output
+
+    for stage in ("parse", "build_schema", "sort_schema", "type_map", "header", "objects", "footer", "write"):
+        assert stage in profiler.stages
+
+    objects = Generator(config).type_map.type_map[SupportTypes.GraphQLObjectType]
+    assert profiler.counts["GraphQLObjectType"] == len(objects)
+    assert profiler.counts["fields"] > 0
+    assert pstats.Stats(str(dump_path)).total_calls > 0
+
+
+def test_generate_unchanged_and_check(tmp_path: Path):
+    """An unchanged output is not rewritten, and check reports outdated files without writing them."""
+
+    config = GraphQL2PythonModelConfig(schema=schema_path, output=tmp_path / "output.py")
+
+    assert Generator(config).check() == [config.output]
+    assert not config.output.exists()
+
+    assert Generator(config).generate() == [config.output]
+    os.utime(config.output, ns=(1, 1))
+
+    assert Generator(config).generate() == []
+    assert config.output.stat().st_mtime_ns == 1
+    assert Generator(config).check() == []
+
+    config.output.write_text("outdated", encoding="utf-8")
+    assert Generator(config).check() == [config.output]
+    assert config.output.read_text(encoding="utf-8") == "outdated"
+
+
+def test_check_package(tmp_path: Path):
+    config = GraphQL2PythonModelConfig(schema=schema_path, output=tmp_path / "model")
+
+    Generator(config).generate()
+    assert Generator(config).check() == []
+
+    stale_module = config.output / "_Removed.py"
+    stale_module.write_text(Generator.MODULE_DOCSTRING, encoding="utf-8")
+    (config.output / "__init__.py").write_text("", encoding="utf-8")
+
+    assert Generator(config).check() == [config.output / "__init__.py", stale_module]
+    assert sorted(Generator(config).generate()) == sorted([config.output / "__init__.py", stale_module])
+    assert not stale_module.exists()
+
+
+def test_generate_only_used_imports(tmp_path: Path, load_module):
+    """Dotted python types of scalars are imported, other modules are imported only if they are used."""
+
+    schema_str = """
+    scalar Money
+    scalar Amount
+
+    type Price {
+      money: Money
+      amount: Amount
+    }
+    """
+    sdl_path = tmp_path / "schema.graphql"
+    sdl_path.write_text(schema_str, encoding="utf-8")
+
+    output_path = tmp_path / "model_imports.py"
+    config = GraphQL2PythonModelConfig(
+        schema=sdl_path,
+        output=output_path,
+        options={"scalar_pytypes": {"Money": "decimal.Decimal", "Amount": "uuid.UUID"}},
+    )
+    Generator(config).generate()
+
+    output = output_path.read_text(encoding="utf-8")
+
+    assert "import enum" not in output
+    assert "from decimal import Decimal\nfrom uuid import UUID\n" in output
+    assert "\nMoney = Decimal\n" in output
+
+    model = load_module(output_path)
+
+    price = model.Price.parse_obj({"money": "1.5", "amount": "12345678-1234-5678-1234-567812345678"})
+    assert price.money == decimal.Decimal("1.5")
+    assert price.amount == uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+
+def test_scalar_pytype_typing(tmp_path: Path, load_module):
+    """A python type of the typing module as _t needs `typing as _t` and no other import."""
+
+    sdl_path = tmp_path / "schema.graphql"
+    sdl_path.write_text("scalar Json\nscalar Object\ntype Data { payload: Json object: Object }\n", encoding="utf-8")
+
+    output_path = tmp_path / "model_typing.py"
+    config = GraphQL2PythonModelConfig(
+        schema=sdl_path,
+        output=output_path,
+        options={"scalar_pytypes": {"Json": "_t.Any", "Object": "_t.Dict[str, _t.Any]"}},
+    )
+    Generator(config).generate()
+
+    output = output_path.read_text(encoding="utf-8")
+
+    assert "import typing as _t\n" in output
+    assert "from _t" not in output
+    assert "\nJson = _t.Any\n" in output
+    assert "\nObject = _t.Dict[str, _t.Any]\n" in output
+
+    model = load_module(output_path)
+
+    assert model.Data.parse_obj({"payload": [1], "object": {"a": 1}}).object == {"a": 1}
+
+
+def test_scalar_pytype_alias(tmp_path: Path):
+    """An imported python type is aliased if its name is the name of another GraphQL type."""
+
+    sdl_path = tmp_path / "schema.graphql"
+    sdl_path.write_text("scalar Money\ntype Decimal { money: Money }\n", encoding="utf-8")
+
+    config = GraphQL2PythonModelConfig(
+        schema=sdl_path, output=tmp_path / "output.py", options={"scalar_pytypes": {"Money": "decimal.Decimal"}}
+    )
+    generator = Generator(config)
+
+    assert generator.scalar_pytype("Money") == (
+        "_Decimal",
+        Import(from_="decimal", import_="Decimal", alias="_Decimal"),
+    )
+    generator.generate()
+
+    output = config.output.read_text(encoding="utf-8")
+    assert "from decimal import Decimal as _Decimal\n" in output
+    assert "\nMoney = _Decimal\n" in output
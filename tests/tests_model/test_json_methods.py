@@ -0,0 +1,104 @@
+import datetime
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+import pytest
+from pydantic import VERSION as PYDANTIC_VERSION
+
+from graphql2python.model.config import GraphQL2PythonModelConfig
+from graphql2python.model.generate import Generator
+
+schema_str = """
+scalar DateTime
+scalar Date
+
+enum Episode { NEWHOPE JEDI }
+
+type Event {
+  name: String!
+  when: DateTime
+  day: Date
+  episode: Episode
+}
+"""
+
+response = {"name": "Battle", "when": "2020-01-02T03:04:05", "day": "2020-01-02", "episode": "JEDI"}
+
+
+def _generate_module(tmp_path: Path, load_module: Callable[[Path], ModuleType], backend: str) -> ModuleType:
+    schema_path = tmp_path / "schema.graphql"
+    schema_path.write_text(schema_str, encoding="utf-8")
+
+    output_path = tmp_path / f"model_json_{backend}.py"
+    config = GraphQL2PythonModelConfig(
+        schema=schema_path,
+        output=output_path,
+        options={
+            "backend": backend,
+            "add_json_methods": True,
+            "scalar_pytypes": {"DateTime": "datetime.datetime", "Date": "datetime.date"},
+        },
+    )
+    Generator(config).generate()
+
+    return load_module(output_path)
+
+
+@pytest.mark.skipif(PYDANTIC_VERSION.startswith("2."), reason="the pydantic backend output needs pydantic v1")
+@pytest.mark.parametrize("with_orjson", [True, False])
+def test_json_methods(tmp_path: Path, load_module, with_orjson: bool):
+    """from_json accepts bytes without decoding, to_json gives the same bytes with orjson and json."""
+
+    model = _generate_module(tmp_path, load_module, "pydantic")
+
+    if with_orjson:
+        pytest.importorskip("orjson")
+    else:
+        model._orjson = None  # pylint: disable=protected-access
+
+    data = json.dumps(response).encode("utf-8")
+    event = model.Event.from_json(data)
+
+    assert event.when == datetime.datetime(2020, 1, 2, 3, 4, 5)
+    assert event.day == datetime.date(2020, 1, 2)
+    assert event.episode == model.Episode.JEDI
+    assert model.Event.from_json(memoryview(data)) == event
+    assert model.Event.from_json(data.decode("utf-8")) == event
+
+    assert json.loads(event.to_json()) == {**response, "__typename": "Event"}
+    assert b" " not in event.to_json().replace(b'"Battle"', b"")
+
+
+def test_json_methods_output(tmp_path: Path):
+    """The stdlib json is imported for the fallback, orjson is optional."""
+
+    schema_path = tmp_path / "schema.graphql"
+    schema_path.write_text(schema_str, encoding="utf-8")
+
+    output_path = tmp_path / "model_json.py"
+    config = GraphQL2PythonModelConfig(schema=schema_path, output=output_path, options={"add_json_methods": True})
+    Generator(config).generate()
+
+    output = output_path.read_text(encoding="utf-8")
+
+    assert "\nimport json\n" in output
+    assert "from pydantic.json import pydantic_encoder\n" in output
+    assert "try:\n    import orjson as _orjson\nexcept ImportError:\n    _orjson = None\n" in output
+    assert "    def from_json(cls, data: _t.Union[bytes, bytearray, memoryview, str]):\n" in output
+    assert "    def to_json(self) -> bytes:\n" in output
+
+
+def test_json_methods_pydantic_v2(tmp_path: Path, load_module):
+    if not PYDANTIC_VERSION.startswith("2."):
+        pytest.skip("pydantic v2 is not installed")
+
+    model = _generate_module(tmp_path, load_module, "pydantic_v2")
+
+    data = json.dumps(response).encode("utf-8")
+    event = model.Event.from_json(memoryview(data))
+
+    assert event.when == datetime.datetime(2020, 1, 2, 3, 4, 5)
+    assert event.episode == model.Episode.JEDI
+    assert json.loads(event.to_json()) == {**response, "__typename": "Event"}
@@ -0,0 +1,212 @@
+import sys
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from click.testing import CliRunner
+from pydantic import VERSION as PYDANTIC_VERSION
+
+from graphql2python.__main__ import model_cli
+from graphql2python.model.config import GraphQL2PythonModelConfig
+from graphql2python.model.generate import Generator
+from graphql2python.model.operations import OperationsGenerator
+
+schema_str = """
+enum Episode { NEWHOPE EMPIRE JEDI }
+
+interface Character {
+  id: ID!
+  name: String!
+  friends: [Character]
+}
+
+type Human implements Character {
+  id: ID!
+  name: String!
+  friends: [Character]
+  homePlanet: String
+}
+
+type Droid implements Character {
+  id: ID!
+  name: String!
+  friends: [Character]
+  primaryFunction: String
+}
+
+type Starship {
+  id: ID!
+  name: String!
+  length: Float
+}
+
+union SearchResult = Human | Droid | Starship
+
+union Single = Starship
+
+interface Vehicle {
+  id: ID!
+}
+
+type Speeder implements Vehicle {
+  id: ID!
+  speed: Float
+}
+
+type Query {
+  hero(episode: Episode): Character
+  search(text: String!): [SearchResult!]!
+  single: Single
+  vehicle: Vehicle
+}
+"""
+
+operations_str = """
+query Hero($withFriends: Boolean!) {
+  hero(episode: JEDI) {
+    __typename
+    name
+    ...DroidFields
+    ... on Human { homePlanet }
+    friends @include(if: $withFriends) { name }
+  }
+}
+
+query Names {
+  hero { id name }
+}
+
+query Search {
+  search(text: "x") {
+    __typename
+    ... on Character { id name }
+    ... on Starship { id size: length class: name }
+  }
+}
+
+fragment DroidFields on Droid { primaryFunction }
+"""
+
+
+def _generate(tmp_path: Path, operations: str, module_name: str, options: Optional[dict] = None):
+    schema_path = tmp_path / "schema.graphql"
+    schema_path.write_text(schema_str, encoding="utf-8")
+
+    operation_path = tmp_path / "operations.graphql"
+    operation_path.write_text(operations, encoding="utf-8")
+
+    config = GraphQL2PythonModelConfig(schema=schema_path, output=tmp_path / "model.py", options=options or {})
+    output_path = tmp_path / f"{module_name}.py"
+
+    OperationsGenerator(Generator(config), [operation_path]).generate(output_path)
+
+    return output_path
+
+
+@pytest.mark.skipif(PYDANTIC_VERSION.startswith("2."), reason="the pydantic backend output needs pydantic v1")
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="discriminated unions need typing.Annotated")
+def test_generate_operations(tmp_path: Path, load_module):
+    output_path = _generate(tmp_path, operations_str, "operations_model")
+    output = output_path.read_text(encoding="utf-8")
+
+    # only scalars and enums of selected fields are rendered
+    assert "Episode" not in output
+    assert "Float = " in output
+
+    model = load_module(output_path)
+    assert model.__all__ == ["GraphQLBaseModel", "HeroQuery", "NamesQuery", "SearchQuery"]
+
+    hero = model.HeroQuery.parse_obj(
+        {"hero": {"__typename": "Droid", "name": "R2-D2", "primaryFunction": "Astromech"}}
+    )
+    assert isinstance(hero.hero, model.HeroQueryHeroDroid)
+    assert hero.hero.primaryFunction == "Astromech"
+    assert not hasattr(hero.hero, "homePlanet")
+
+    # the same fields for all characters, so there is one class
+    names = model.NamesQuery.parse_obj({"hero": {"id": "1", "name": "Luke"}})
+    assert isinstance(names.hero, model.NamesQueryHero)
+
+    search = model.SearchQuery.parse_obj(
+        {
+            "search": [
+                {"__typename": "Starship", "id": "1", "size": 12.5, "class": "X-wing"},
+                {"__typename": "Human", "id": "2", "name": "Luke"},
+            ]
+        }
+    )
+    assert isinstance(search.search[0], model.SearchQuerySearchStarship)
+    assert search.search[0].size == "12.5"
+    assert search.search[0].class_ == "X-wing"
+    assert isinstance(search.search[1], model.SearchQuerySearchHuman)
+
+
+@pytest.mark.skipif(PYDANTIC_VERSION.startswith("2."), reason="the pydantic backend output needs pydantic v1")
+def test_generate_operations_ordered_classes(tmp_path: Path, load_module):
+    """Selection classes are updated even if types of the schema are ordered."""
+
+    output_path = _generate(tmp_path, "query Names { hero { id name } }", "ordered_model", {"ordered_classes": True})
+    output = output_path.read_text(encoding="utf-8")
+
+    assert "NamesQuery.update_forward_refs()\n" in output
+
+    names = load_module(output_path).NamesQuery.parse_obj({"hero": {"id": "1", "name": "Luke"}})
+    assert names.hero.name == "Luke"
+
+
+@pytest.mark.skipif(PYDANTIC_VERSION.startswith("2."), reason="the pydantic backend output needs pydantic v1")
+def test_generate_operations_single_possible_type(tmp_path: Path, load_module):
+    """Fields of fragments on the only possible type of a union or an interface are kept."""
+
+    operations = """
+    query Find {
+      single { ... on Starship { id length } }
+      vehicle { id ... on Speeder { speed } }
+    }
+    """
+    model = load_module(_generate(tmp_path, operations, "single_model"))
+
+    find = model.FindQuery.parse_obj({"single": {"id": "1", "length": 12.5}, "vehicle": {"id": "2", "speed": 3.5}})
+
+    assert (find.single.id, find.single.length) == ("1", "12.5")
+    assert (find.vehicle.id, find.vehicle.speed) == ("2", "3.5")
+
+
+def test_generate_operations_without_typename(tmp_path: Path):
+    with pytest.raises(ValueError, match="__typename"):
+        _generate(tmp_path, "query Search { search(text: \"x\") { ... on Starship { id } } }", "no_typename")
+
+
+def test_generate_operations_invalid(tmp_path: Path):
+    with pytest.raises(ValueError, match="Invalid operations"):
+        _generate(tmp_path, "query Hero { hero { size } }", "invalid")
+
+
+def test_generate_operations_cli(tmp_path: Path):
+    schema_path = tmp_path / "schema.graphql"
+    schema_path.write_text(schema_str, encoding="utf-8")
+
+    (tmp_path / "operations").mkdir()
+    operation_path = tmp_path / "operations" / "names.graphql"
+    operation_path.write_text("query Names { hero { id name } }", encoding="utf-8")
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(f"schema: {schema_path}\noutput: {tmp_path / 'model.py'}\n", encoding="utf-8")
+
+    output_path = tmp_path / "operations_cli.py"
+
+    result = CliRunner().invoke(
+        model_cli,
+        [
+            "generate-operations",
+            "-c",
+            str(config_path),
+            "--operation",
+            str(tmp_path / "operations" / "*.graphql"),
+            "-o",
+            str(output_path),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "class NamesQueryHero(GraphQLBaseModel):" in output_path.read_text(encoding="utf-8")
@@ -0,0 +1,119 @@
+from pathlib import Path
+
+import pytest
+from graphql import build_schema, parse
+
+from graphql2python.model.config import GraphQL2PythonModelConfig
+from graphql2python.model.generate import Generator
+from graphql2python.model.reachable import load_operations, operation_types, reachable_types
+
+schema_str = """
+scalar DateTime
+
+enum Episode { NEWHOPE EMPIRE JEDI }
+
+interface Character {
+  id: ID!
+  friends: [Character]
+}
+
+type Human implements Character {
+  id: ID!
+  friends: [Character]
+  birthday: DateTime
+}
+
+type Droid implements Character {
+  id: ID!
+  friends: [Character]
+  appearsIn: [Episode]
+}
+
+type Starship {
+  id: ID!
+  length: Float
+}
+
+type Planet {
+  name: String
+}
+
+union SearchResult = Human | Starship
+
+type Query {
+  hero: Character
+  search(text: String): [SearchResult]
+  planet: Planet
+  episode: Episode
+}
+"""
+
+schema = build_schema(schema_str)
+
+
+@pytest.mark.parametrize(
+    "roots, result",
+    [
+        (["Planet"], {"Planet", "String"}),
+        (["Starship"], {"Starship", "ID", "Float"}),
+        (
+            ["Character"],
+            {"Character", "Human", "Droid", "ID", "DateTime", "Episode"},
+        ),
+        (
+            ["SearchResult"],
+            {"SearchResult", "Human", "Starship", "Character", "Droid", "ID", "Float", "DateTime", "Episode"},
+        ),
+    ],
+)
+def test_reachable_types(roots, result):
+    assert reachable_types(schema, roots) == result
+
+
+def test_reachable_types_unknown_root():
+    with pytest.raises(ValueError):
+        reachable_types(schema, ["Unknown"])
+
+
+def test_operation_types():
+    document = parse(
+        """
+        query Search { search(text: "x") { ...StarshipFields } }
+        query Planet { episode planet { name } }
+        fragment StarshipFields on Starship { id }
+        """
+    )
+
+    assert operation_types(schema, document) == {"SearchResult", "Starship", "Planet", "Episode"}
+
+
+def test_load_operations_invalid(tmp_path: Path):
+    operation_path = tmp_path / "query.graphql"
+    operation_path.write_text("query { planet { size } }", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="size"):
+        load_operations(schema, [operation_path])
+
+
+def test_generate_with_roots(tmp_path: Path):
+    schema_path = tmp_path / "schema.graphql"
+    schema_path.write_text(schema_str, encoding="utf-8")
+
+    operation_path = tmp_path / "planet.graphql"
+    operation_path.write_text("query { planet { name } }", encoding="utf-8")
+
+    config = GraphQL2PythonModelConfig(
+        schema=schema_path,
+        output=tmp_path / "output.py",
+        options={"roots": ["Starship"], "operations": [str(operation_path)]},
+    )
+
+    generator = Generator(config)
+    generator.generate()
+
+    assert sorted(generator.type_map.types) == ["Float", "ID", "Planet", "Starship", "String"]
+    assert generator.type_map.pruned == 7
+
+    output = config.output.read_text(encoding="utf-8")
+    assert "class Planet(GraphQLBaseModel):" in output
+    assert "class Human" not in output
@@ -345,3 +345,50 @@ def test_render_field_description():
 def test_render_field_scalar_alias(field_name: str, field: GraphQLField, result: str):
     """Tests for render of a field with alias."""
     assert render.render_field(field_name, field, alias='alias_f') == result
+
+
+@pytest.mark.parametrize(
+    'field, result',
+    [
+        (
+            GraphQLField(type_=GraphQLInterfaceType('I', {})),
+            "    f: _t.Optional[_t.Union['A', 'B']] = Field(default=None, discriminator='typename__')",
+        ),
+        (
+            GraphQLField(type_=GraphQLNonNull(GraphQLInterfaceType('I', {}))),
+            "    f: _t.Union['A', 'B'] = Field(..., discriminator='typename__')",
+        ),
+        (
+            GraphQLField(type_=GraphQLList(GraphQLNonNull(GraphQLInterfaceType('I', {})))),
+            "    f: _t.Optional[_t.List[_t.Annotated[_t.Union['A', 'B'], Field(discriminator='typename__')]]]"
+            " = Field(default_factory=list)",
+        ),
+        (
+            GraphQLField(type_=GraphQLList(GraphQLInterfaceType('I', {}))),
+            "    f: _t.Optional[_t.List[_t.Optional[_t.Union['A', 'B']]]] = Field(default_factory=list)",
+        ),
+        (
+            GraphQLField(type_=GraphQLNonNull(GraphQLInterfaceType('One', {}))),
+            "    f: 'A'",
+        ),
+    ],
+)
+def test_render_field_discriminated_union(field: GraphQLField, result: str):
+    """Test of field render with an interface replaced by its possible types."""
+
+    render_discriminated = DataModelRender(discriminated_unions=True, possible_types={'I': ['A', 'B'], 'One': ['A']})
+    assert render_discriminated.render_field('f', field) == result
+
+
+def test_render_field_type_cache():
+    cache_render = DataModelRender()
+    scalar = GraphQLScalarType('S')
+
+    first = cache_render.render_field_type(GraphQLField(type_=GraphQLNonNull(GraphQLList(scalar))))
+    second = cache_render.render_field_type(GraphQLField(type_=GraphQLNonNull(GraphQLList(scalar))))
+    aliased = cache_render.render_field_type(GraphQLField(type_=GraphQLNonNull(GraphQLList(scalar))), alias='a')
+
+    assert first == second == "_t.List[_t.Optional['S']]"
+    assert aliased == "_t.List[_t.Optional['S']] = Field(..., alias='a')"
+    assert cache_render.field_type_cache_hits == 1
+    assert cache_render.field_type_cache_misses == 2
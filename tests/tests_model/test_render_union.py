@@ -35,3 +35,35 @@ MyUnion = _t.Union[
 def test_render_union(obj: GraphQLUnionType, result: str):
     """Tests for a union render with some options."""
     assert render.render_union(obj) == result
+
+
+def test_render_union_discriminated():
+    obj = GraphQLUnionType('MyUnion', types=[GraphQLObjectType('MyObject1', {}), GraphQLObjectType('MyObject2', {})])
+
+    result = """# A Union type
+# See https://graphql.org/learn/schema/#union-types
+MyUnion = _t.Annotated[
+    _t.Union[
+        'MyObject1',
+        'MyObject2',
+    ],
+    Field(discriminator='typename__'),
+]"""
+
+    assert DataModelRender(discriminated_unions=True).render_union(obj) == result
+
+
+def test_render_union_components():
+    """Only members in the component of the union are forward references."""
+
+    obj = GraphQLUnionType('MyUnion', types=[GraphQLObjectType('MyObject1', {}), GraphQLObjectType('MyObject2', {})])
+
+    components_render = DataModelRender()
+    components_render.components = {'MyUnion': '_MyUnion', 'MyObject1': '_MyObject1', 'MyObject2': '_MyUnion'}
+
+    assert components_render.render_union(obj) == """# A Union type
+# See https://graphql.org/learn/schema/#union-types
+MyUnion = _t.Union[
+    MyObject1,
+    'MyObject2',
+]"""
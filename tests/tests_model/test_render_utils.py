@@ -1,3 +1,4 @@
+import random
 from typing import List
 
 import pytest
@@ -33,3 +34,41 @@ def test_processing_of_line(line: str, result: List[str]):
 )
 def test_processing_of_line_indent(line: str, result: List[str]):
     assert render.processing_of_line(line, 4, 10) == result
+
+
+def _processing_of_line_by_concatenation(line: str, indent: int, max_line_len: int) -> List[str]:
+    """The previous implementation of processing_of_line for comparison."""
+
+    line_processed = []
+    line_split = line.split(" ")
+
+    temp = line_split[0]
+
+    for word in line_split[1:]:
+        if len(temp) > (max_line_len - 2 - indent):
+            line_processed.append(temp)
+            temp = word
+
+        elif len(temp + word) + 1 <= (max_line_len - 2 - indent):
+            temp = " ".join([temp, word])
+
+        else:
+            line_processed.append(temp)
+            temp = word
+
+    line_processed.append(temp)
+
+    return line_processed
+
+
+def test_processing_of_line_random():
+    rnd = random.Random(0)
+
+    for _ in range(2000):
+        line = "".join(rnd.choice("ab  ") for _ in range(rnd.randint(0, 60)))
+        indent = rnd.randint(0, 8)
+        max_line_len = rnd.randint(2, 30)
+
+        assert render.processing_of_line(line, indent, max_line_len) == _processing_of_line_by_concatenation(
+            line, indent, max_line_len
+        )
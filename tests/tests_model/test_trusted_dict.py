@@ -0,0 +1,68 @@
+import datetime
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import VERSION as PYDANTIC_VERSION
+
+from graphql2python.model.config import GraphQL2PythonModelConfig
+from graphql2python.model.generate import Generator
+
+
+@pytest.mark.skipif(PYDANTIC_VERSION.startswith("2."), reason="the pydantic backend output needs pydantic v1")
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="discriminated unions need typing.Annotated")
+def test_from_trusted_dict(tmp_path: Path, load_module, search_schema_path: Path, search_response: dict):
+    """from_trusted_dict builds the same objects as parse_obj for valid data."""
+
+    output_path = tmp_path / "model_trusted.py"
+
+    config = GraphQL2PythonModelConfig(
+        schema=search_schema_path,
+        output=output_path,
+        options={
+            "add_from_trusted_dict": True,
+            "discriminated_unions": True,
+            "fields_setting": {"Droid": {"primaryFunction": {"alias": "primary_function"}}},
+        },
+    )
+    Generator(config).generate()
+
+    model = load_module(output_path)
+
+    # Int is str in the models and ints are not converted without validation
+    del search_response["results"][0]["totalCredits"]
+
+    search = model.Search.from_trusted_dict(search_response)
+
+    assert isinstance(search.hero, model.Droid)
+    assert search.hero.primaryFunction == "Astromech"
+    assert isinstance(search.best, model.Starship)
+    assert isinstance(search.results[0].friends[0], model.Droid)
+    assert search.results[0].friends[1] is None
+
+    assert search == model.Search.parse_obj(search_response)
+    assert search.results[0].__fields_set__ == model.Search.parse_obj(search_response).results[0].__fields_set__
+
+
+@pytest.mark.skipif(PYDANTIC_VERSION.startswith("2."), reason="the pydantic backend output needs pydantic v1")
+def test_from_trusted_dict_datetime(tmp_path: Path, load_module):
+    """Datetimes with Z for UTC are parsed as by parse_obj."""
+
+    schema_path = tmp_path / "schema.graphql"
+    schema_path.write_text("scalar DateTime\ntype Event { when: DateTime at: [DateTime] }\n", encoding="utf-8")
+
+    output_path = tmp_path / "model_trusted_datetime.py"
+    config = GraphQL2PythonModelConfig(
+        schema=schema_path,
+        output=output_path,
+        options={"add_from_trusted_dict": True, "scalar_pytypes": {"DateTime": "datetime.datetime"}},
+    )
+    Generator(config).generate()
+
+    model = load_module(output_path)
+
+    data = {"when": "2020-01-02T03:04:05Z", "at": ["2020-01-02T03:04:05.123456Z", "2020-01-02T03:04:05+03:00"]}
+    event = model.Event.from_trusted_dict(data)
+
+    assert event.when == datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+    assert event == model.Event.parse_obj(data)
@@ -3,7 +3,6 @@
 # pylint: disable-all
 # mypy: ignore-errors
 
-import enum
 import typing as _t
 from datetime import date, datetime
 
@@ -26,7 +26,6 @@ def test_custom_scalar():
 # pylint: disable-all
 # mypy: ignore-errors
 
-import enum
 import typing as _t
 from datetime import date, datetime
 
@@ -0,0 +1,133 @@
+"""Auto-generated by graphql2python."""
+
+# pylint: disable-all
+# mypy: ignore-errors
+
+import typing as _t
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+__all__ = [
+    "GraphQLBaseModel",
+    # scalars
+    "Boolean",
+    "ID",
+    "Int",
+    "String",
+    # enums
+    # unions
+    "SearchResult",
+    # interfaces
+    "Character",
+    # objects
+    "Droid",
+    "Human",
+    "Search",
+    "Starship",
+]
+
+
+class GraphQLBaseModel(BaseModel):
+    """Base Model for GraphQL object."""
+
+    class Config:
+        allow_population_by_field_name = True
+        json_encoders = {
+            # custom output conversion for datetime
+            datetime: lambda dt: dt.isoformat()
+        }
+        smart_union = True
+
+
+# The `Boolean` scalar type represents `true` or `false`.
+Boolean = str
+
+
+# The `ID` scalar type represents a unique identifier, often used to refetch an object or as key for a cache. The ID
+# type appears in a JSON response as a String; however, it is not intended to be human-readable. When expected as an
+# input type, any string (such as `"4"`) or integer (such as `4`) input value will be accepted as an ID.
+ID = str
+
+
+# The `Int` scalar type represents non-fractional signed whole numeric values. Int can represent values between -(2^31)
+# and 2^31 - 1.
+Int = str
+
+
+# The `String` scalar type represents textual data, represented as UTF-8 character sequences. The String type is most
+# often used by GraphQL to represent free-form human-readable text.
+String = str
+
+
+# A Union type
+# See https://graphql.org/learn/schema/#union-types
+SearchResult = _t.Annotated[
+    _t.Union[
+        'Droid',
+        'Human',
+        'Starship',
+    ],
+    Field(discriminator='typename__'),
+]
+
+
+class Character(GraphQLBaseModel):
+    """
+    An Interface type
+    See https://graphql.org/learn/schema/#interfaces
+    """
+    id: 'ID'
+    name: 'String'
+    friends: _t.Optional[_t.List[_t.Optional[_t.Union['Droid', 'Human']]]] = Field(default_factory=list)
+    typename__: _t.Literal["Character"] = Field(default="Character", alias="__typename")
+
+
+class Droid(
+    Character,
+):
+    """
+    An Object type
+    See https://graphql.org/learn/schema/#object-types-and-fields
+    """
+    primaryFunction: _t.Optional['String'] = Field(default=None)
+    typename__: _t.Literal["Droid"] = Field(default="Droid", alias="__typename")
+
+
+class Human(
+    Character,
+):
+    """
+    An Object type
+    See https://graphql.org/learn/schema/#object-types-and-fields
+    """
+    totalCredits: _t.Optional['Int'] = Field(default=None)
+    typename__: _t.Literal["Human"] = Field(default="Human", alias="__typename")
+
+
+class Search(GraphQLBaseModel):
+    """
+    An Object type
+    See https://graphql.org/learn/schema/#object-types-and-fields
+    """
+    best: _t.Union['Droid', 'Human', 'Starship'] = Field(..., discriminator='typename__')
+    results: _t.List[_t.Annotated[_t.Union['Droid', 'Human', 'Starship'], Field(discriminator='typename__')]]
+    hero: _t.Optional[_t.Union['Droid', 'Human']] = Field(default=None, discriminator='typename__')
+    typename__: _t.Literal["Search"] = Field(default="Search", alias="__typename")
+
+
+class Starship(GraphQLBaseModel):
+    """
+    An Object type
+    See https://graphql.org/learn/schema/#object-types-and-fields
+    """
+    id: 'ID'
+    name: 'String'
+    typename__: _t.Literal["Starship"] = Field(default="Starship", alias="__typename")
+
+
+Character.update_forward_refs()
+Droid.update_forward_refs()
+Human.update_forward_refs()
+Search.update_forward_refs()
+Starship.update_forward_refs()
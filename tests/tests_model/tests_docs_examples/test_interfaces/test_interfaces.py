@@ -26,7 +26,7 @@ def test_custom_scalar():
 
 import enum
 import typing as _t
-from datetime import date, datetime
+from datetime import datetime
 
 from pydantic import BaseModel, Field
 
@@ -5,7 +5,7 @@
 
 import enum
 import typing as _t
-from datetime import date, datetime
+from datetime import datetime
 
 from pydantic import BaseModel, Field
 
@@ -0,0 +1,68 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from graphql2python.utils.files import same_content, write_chunks
+
+
+def test_write_chunks(tmp_path: Path):
+    output_path = tmp_path / "output.py"
+
+    write_chunks(output_path, iter(["a = 1\n", "", "b = 2\n"]))
+
+    assert output_path.read_text(encoding="utf-8") == "a = 1\nb = 2\n"
+    assert [path.name for path in tmp_path.iterdir()] == ["output.py"]
+
+
+def test_write_chunks_keep_old_file_on_error(tmp_path: Path):
+    """The target file is not changed if rendering fails."""
+
+    output_path = tmp_path / "output.py"
+    output_path.write_text("old", encoding="utf-8")
+
+    def chunks():
+        yield "new"
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        write_chunks(output_path, chunks())
+
+    assert output_path.read_text(encoding="utf-8") == "old"
+    assert [path.name for path in tmp_path.iterdir()] == ["output.py"]
+
+
+@pytest.mark.parametrize(
+    "new_chunks",
+    [
+        ["a = 1\n", "b = 3\n"],
+        ["a = 1\n"],
+        ["a = 1\n", "b = 2\n", "c = 3\n"],
+        ["", "x = 1\n", "b = 2\n"],
+    ],
+)
+def test_write_chunks_changed(tmp_path: Path, new_chunks):
+    output_path = tmp_path / "output.py"
+    write_chunks(output_path, ["a = 1\n", "b = 2\n"])
+
+    assert not same_content(output_path, new_chunks)
+    assert write_chunks(output_path, iter(new_chunks), buffering=2)
+    assert output_path.read_text(encoding="utf-8") == "".join(new_chunks)
+
+
+def test_write_chunks_unchanged(tmp_path: Path):
+    """A file with the same content is not rewritten."""
+
+    output_path = tmp_path / "output.py"
+    assert write_chunks(output_path, ["a = 1\n", "b = 2\n"])
+
+    os.utime(output_path, ns=(1, 1))
+
+    assert same_content(output_path, ["a = 1\nb", " = 2\n"])
+    assert not write_chunks(output_path, iter(["a = 1\nb", " = 2\n"]))
+    assert output_path.stat().st_mtime_ns == 1
+    assert [path.name for path in tmp_path.iterdir()] == ["output.py"]
+
+
+def test_same_content_missing_file(tmp_path: Path):
+    assert not same_content(tmp_path / "output.py", [])
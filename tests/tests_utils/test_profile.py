@@ -0,0 +1,72 @@
+import time
+
+from graphql2python.utils.profile import Profiler, profile_iter, profile_stage
+
+
+def test_nested_stages():
+    """A stage excludes the time of nested stages."""
+
+    with Profiler(trace_memory=False) as profiler:
+        with profiler.stage("outer"):
+            time.sleep(0.02)
+
+            with profiler.stage("inner"):
+                time.sleep(0.05)
+
+        with profiler.stage("inner"):
+            time.sleep(0.01)
+
+    assert profiler.stages["inner"]["calls"] == 2
+    assert profiler.stages["inner"]["wall"] >= 0.06
+    assert 0.02 <= profiler.stages["outer"]["wall"] < 0.05
+    assert profiler.total["wall"] >= profiler.stages["outer"]["wall"] + profiler.stages["inner"]["wall"]
+
+
+def test_iterate():
+    def items():
+        for item in range(3):
+            time.sleep(0.01)
+            yield item
+
+    with Profiler(trace_memory=False) as profiler:
+        with profiler.stage("consumer"):
+            assert list(profiler.iterate("producer", items())) == [0, 1, 2]
+
+    assert profiler.stages["producer"]["calls"] == 4
+    assert profiler.stages["producer"]["wall"] >= 0.03
+    assert profiler.stages["consumer"]["wall"] < profiler.stages["producer"]["wall"]
+
+
+def test_peak_memory():
+    with Profiler() as profiler:
+        with profiler.stage("small"):
+            data = [0] * 1000
+
+        with profiler.stage("large"):
+            data = [0] * 1_000_000
+
+        del data
+
+    assert profiler.stages["large"]["peak_memory"] >= 8_000_000
+    assert profiler.total["peak_memory"] >= profiler.stages["large"]["peak_memory"]
+
+
+def test_report_and_table():
+    with Profiler(trace_memory=False) as profiler:
+        with profiler.stage("render"):
+            profiler.count("fields", 2)
+            profiler.count("fields", 3)
+
+    assert profiler.report()["counts"] == {"fields": 5}
+    assert set(profiler.report()["stages"]["render"]) == {"wall", "cpu", "peak_memory", "calls"}
+
+    table = profiler.format_table()
+    assert table.splitlines()[1].startswith("render")
+    assert "fields: 5" in table
+
+
+def test_without_profiler():
+    items = [1, 2]
+
+    with profile_stage(None, "stage"):
+        assert profile_iter(None, "stage", items) is items
@@ -0,0 +1,29 @@
+from graphql2python.utils.scc import strongly_connected_components
+
+
+def test_strongly_connected_components():
+    graph = {
+        "a": ["b"],
+        "b": ["c", "d"],
+        "c": ["a"],
+        "d": ["e"],
+        "e": ["d", "f"],
+    }
+
+    components = strongly_connected_components(graph)
+
+    assert sorted(map(sorted, components)) == [["a", "b", "c"], ["d", "e"], ["f"]]
+
+    # dependencies go first
+    order = {node: i for i, component in enumerate(components) for node in component}
+    assert order["f"] < order["d"] < order["a"]
+
+
+def test_strongly_connected_components_long_chain():
+    graph = {i: [i + 1] for i in range(10000)}
+
+    components = strongly_connected_components(graph)
+
+    assert components[0] == [10000]
+    assert components[-1] == [0]
+    assert len(components) == 10001
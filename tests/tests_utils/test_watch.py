@@ -0,0 +1,34 @@
+import threading
+from pathlib import Path
+from typing import List, Set
+
+from graphql2python.utils.watch import watch_files
+
+
+def test_watch_files(tmp_path: Path):
+    watched_path = tmp_path / "schema.graphql"
+    watched_path.write_text("type A", encoding="utf-8")
+
+    stop_event = threading.Event()
+    calls: List[Set[Path]] = []
+
+    def on_change(changed: Set[Path]):
+        calls.append(changed)
+        stop_event.set()
+
+    thread = threading.Thread(
+        target=watch_files,
+        args=(lambda: [watched_path], on_change),
+        kwargs={"interval": 0.01, "debounce": 0.05, "stop_event": stop_event},
+    )
+    thread.start()
+
+    # a burst of changes results in one call
+    for text in ["type B", "type BB", "type BBB"]:
+        stop_event.wait(0.02)
+        watched_path.write_text(text, encoding="utf-8")
+
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert calls == [{watched_path}]